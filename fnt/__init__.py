@@ -20,14 +20,28 @@ from .types import (
     version16dot16,
     table,
 )
-from .font import Font, ParseMethod
+from .font import Font, FontCursor, ParseMethod
 from .file_font import FileFont
+from .collection import Collection, CollectionFont
+from .cache import TableCache
+from .index import FontIndex, IndexedFont
+from .probe import probe, FontSummary
+from .checksum import ChecksumMismatch
 
 # TODO: tables
 
 __all__ = (
     "Font",
     "FileFont",
+    "Collection",
+    "CollectionFont",
+    "TableCache",
+    "FontIndex",
+    "IndexedFont",
+    "probe",
+    "FontSummary",
+    "ChecksumMismatch",
+    "FontCursor",
     "ParseMethod",
     "uint8",
     "int8",
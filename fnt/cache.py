@@ -0,0 +1,98 @@
+from pathlib import Path
+from hashlib import blake2b
+from tempfile import NamedTemporaryFile
+from dataclasses import fields, is_dataclass
+from functools import lru_cache
+from operator import attrgetter
+from os import replace, remove
+from typing import Any, Callable
+import pickle
+
+from .tables import Table, TableRecord
+
+__all__ = ("TableCache",)
+
+# Bump whenever a table's dataclass changes shape so old pickles are never loaded.
+CACHE_VERSION = 2
+
+# Tables which hold onto their font to decode lazily, they are cheap to create and
+# can't outlive the font anyway.
+UNCACHED_TABLES = frozenset(("directory", "glyf"))
+
+type TableKey = tuple[str, int, int, int]
+
+
+def table_key(record: TableRecord) -> TableKey:
+    return record.tableTag, record.checksum, record.offset, record.length
+
+
+@lru_cache(maxsize=None)
+def _init_values(cls: type) -> Callable[[Any], tuple]:
+    names = tuple(f.name for f in fields(cls) if f.init)
+    if not names:
+        return lambda _: ()
+    if len(names) == 1:
+        return lambda obj: (getattr(obj, names[0]),)
+    return attrgetter(*names)
+
+
+# Tables are pickled as their class and init arguments rather than their __dict__,
+# which is smaller and around twice as fast to load. Fields which aren't init
+# arguments (lookup caches and the like) are left to be rebuilt.
+class _TablePickler(pickle.Pickler):
+    def reducer_override(self, obj: Any):
+        if is_dataclass(obj) and not isinstance(obj, type):
+            return type(obj), _init_values(type(obj))(obj)
+        return NotImplemented
+
+
+# An opt-in directory of pickled tables, so fonts opened again by a later process skip
+# parsing. Each font file gets one entry keyed by its path, size and mtime, which
+# holds its tables keyed by their TableRecord, so editing a font never loads stale
+# tables. Pickles are loaded from the directory as is, so it must not be writable by
+# anyone untrusted.
+class TableCache:
+    def __init__(self, directory: Path):
+        self.directory: Path = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    # Columnar fonts parse some tables differently, so get entries of their own.
+    @staticmethod
+    def font_key(src: Path, columnar: bool = False) -> str:
+        src = Path(src).resolve()
+        info = src.stat()
+        key = f"{CACHE_VERSION}:{src}:{info.st_size}:{info.st_mtime_ns}"
+        return f"{key}:columnar" if columnar else key
+
+    def _path(self, font_key: str) -> Path:
+        digest = blake2b(font_key.encode(), digest_size=16).hexdigest()
+        return self.directory / f"{digest}.pickle"
+
+    def load(self, font_key: str) -> dict[TableKey, Table]:
+        try:
+            with open(self._path(font_key), "rb") as fp:
+                tables = pickle.load(fp)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            # Missing, or written by an incompatible version of pyfont.
+            return {}
+        return tables if isinstance(tables, dict) else {}
+
+    def store(self, font_key: str, tables: dict[TableKey, Table]):
+        tables = {
+            key: table for key, table in tables.items() if key[0] not in UNCACHED_TABLES
+        }
+
+        # Written to a temporary file first so other processes never read a partial
+        # entry. Tables that can't be pickled leave the entry as it was.
+        with NamedTemporaryFile("wb", dir=self.directory, delete=False) as fp:
+            try:
+                _TablePickler(fp, pickle.HIGHEST_PROTOCOL).dump(tables)
+            except (pickle.PicklingError, TypeError, AttributeError):
+                fp.close()
+                remove(fp.name)
+                return
+        replace(fp.name, self._path(font_key))
+
+    def clear(self):
+        for path in self.directory.glob("*.pickle"):
+            path.unlink(missing_ok=True)
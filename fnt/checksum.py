@@ -0,0 +1,104 @@
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from sys import byteorder
+from array import array
+
+from .tables import TableRecord
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+__all__ = ("checksum", "verify_checksums", "ChecksumMismatch")
+
+# numpy's sum releases the GIL and beats summing an array once a table has a few
+# thousand words, smaller tables are summed in python.
+VECTORIZE_WORDS = 4096
+
+# Below this many bytes of tables starting a thread pool costs more than it saves.
+PARALLEL_BYTES = 4 << 20
+
+# The whole font, with head.checksumAdjustment taken as 0, sums to this minus the
+# adjustment.
+CHECKSUM_MAGIC = 0xB1B0AFBA
+
+# head.checksumAdjustment's position in the head table
+ADJUSTMENT_OFFSET = 8
+
+
+# expected is the value stored in the font, actual is the one computed from its bytes.
+@dataclass(frozen=True)
+class ChecksumMismatch:
+    tableTag: str | None  # None for the whole font's head.checksumAdjustment
+    expected: int
+    actual: int
+
+
+# The uint32 sum of data as big endian words, with the last word padded with zeros.
+def checksum(data: bytes | memoryview) -> int:
+    data = memoryview(data).cast("B")
+    whole = len(data) & ~3
+    words = whole >> 2
+
+    if numpy is not None and words >= VECTORIZE_WORDS:
+        total = int(numpy.frombuffer(data[:whole], ">u4").sum(dtype=numpy.uint64))
+    else:
+        values = array("I")
+        values.frombytes(data[:whole])
+        if byteorder == "little":
+            values.byteswap()
+        total = sum(values)
+
+    if whole != len(data):
+        total += int.from_bytes(data[whole:].tobytes().ljust(4, b"\x00"))
+    return total & 0xFFFFFFFF
+
+
+def _table_checksum(data: memoryview, record: TableRecord) -> int:
+    table = data[record.offset : record.offset + record.length]
+    total = checksum(table)
+    if record.tableTag == "head" and len(table) >= ADJUSTMENT_OFFSET + 4:
+        # head's checksum is taken with checksumAdjustment as 0
+        adjustment = table[ADJUSTMENT_OFFSET : ADJUSTMENT_OFFSET + 4]
+        total -= int.from_bytes(adjustment)
+    return total & 0xFFFFFFFF
+
+
+# Checks every table against the checksum in its record, and when whole_font is set
+# (a font which is the entire file, so not one inside a collection) the head table's
+# checksumAdjustment too. Tables are summed on a thread pool when workers asks for
+# one, or by default when numpy can sum them in parallel and there's enough to sum.
+def verify_checksums(
+    data: memoryview,
+    records: tuple[TableRecord, ...],
+    whole_font: bool = False,
+    workers: int | None = None,
+) -> tuple[ChecksumMismatch, ...]:
+    if workers is None:
+        size = sum(record.length for record in records)
+        parallel = numpy is not None and size >= PARALLEL_BYTES
+    else:
+        parallel = workers > 1
+
+    if not parallel or len(records) < 2:
+        sums = list(map(_table_checksum, (data,) * len(records), records))
+    else:
+        with ThreadPoolExecutor(workers) as pool:
+            sums = list(pool.map(_table_checksum, (data,) * len(records), records))
+
+    mismatches = [
+        ChecksumMismatch(record.tableTag, record.checksum, actual)
+        for record, actual in zip(records, sums)
+        if record.checksum != actual
+    ]
+
+    head = next((record for record in records if record.tableTag == "head"), None)
+    if whole_font and head is not None and head.length >= ADJUSTMENT_OFFSET + 4:
+        position = head.offset + ADJUSTMENT_OFFSET
+        adjustment = int.from_bytes(data[position : position + 4])
+        total = (checksum(data) - adjustment) & 0xFFFFFFFF
+        actual = (CHECKSUM_MAGIC - total) & 0xFFFFFFFF
+        if adjustment != actual:
+            mismatches.append(ChecksumMismatch(None, adjustment, actual))
+    return tuple(mismatches)
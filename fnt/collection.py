@@ -1,11 +1,205 @@
-from .font import Font
+from __future__ import annotations
+from pathlib import Path
+from mmap import mmap as MemoryMap, ACCESS_READ
+from threading import Lock
+
+from .font import Font, FontCursor, BoundedCursor
+from .file_font import FileFont
+from .tables import Table, TableRecord, TTCHeader
+from .parsing import parsers, parse_ttc_header
+
+__all__ = ("Collection", "CollectionFont")
+
+# (tableTag, offset, length) of a table record, member fonts which point at the same
+# bytes share the parsed table.
+type TableKey = tuple[str, int, int]
+
+
+# Tables which decode lazily through the font that parsed them (glyf), sharing one
+# would leave the other fonts reading through that font's bytes and budget, which
+# stop working once it's closed. They're cheap to create, so each font parses its own.
+_UNSHARED_TABLES = frozenset(("glyf",))
+
+
+def _table_key(record: TableRecord) -> TableKey:
+    return record.tableTag, record.offset, record.length
+
+
+def _same_dependencies(font: Font, dependencies: tuple[TableKey, ...]) -> bool:
+    for key in dependencies:
+        if not font.has_table(key[0]) or _table_key(font.get_record(key[0])) != key:
+            return False
+    return True
+
+
+# Some parsers pull values from other tables (hmtx needs hhea and maxp). The cursor
+# remembers which, so a shared table is only reused by fonts whose dependencies
+# also point at the same bytes.
+class _SharedCursor(FontCursor):
+    def __init__(self, font: Font, data: memoryview, offset: int = 0):
+        FontCursor.__init__(self, font, data, offset)
+        self.dependencies: list[str] = []
+
+    def get_table(self, name: str) -> Table | None:
+        self.dependencies.append(name)
+        return self._font.get_table(name)
+
+
+class _BoundedSharedCursor(_SharedCursor, BoundedCursor):
+    def __init__(self, font: Font, data: memoryview, offset: int = 0, end: int = -1):
+        BoundedCursor.__init__(self, font, data, offset, end)
+        self.dependencies: list[str] = []
 
 
 # Collection Fonts have less control over their own bytes, and need to ask the Collection
 # for some data, this should have no impact on the end user
-class CollectionFont(Font):
-    pass
+class CollectionFont(FileFont):
+    def __init__(self, collection: Collection, index: int):
+        self._collection: Collection = collection
+        self._index: int = index
+        offset = collection.header.tableDirectoryOffsets[index]
+        FileFont.__init__(
+            self,
+            collection._data,
+            collection._src,
+            offset,
+            strict=collection.strict,
+            budget=collection._budget,
+            columnar=collection.columnar,
+        )
+
+    @property
+    def collection(self) -> Collection:
+        return self._collection
+
+    @property
+    def index(self) -> int:
+        return self._index
+
+    def close(self):
+        # The bytes belong to the collection, so only let go of our own view.
+        self._closed = True
+        self._data.release()
+
+    def _parse_table(self, record: TableRecord) -> Table | None:
+        if record.tableTag in _UNSHARED_TABLES:
+            return FileFont._parse_table(self, record)
+        return self._collection._get_shared_table(self, record)
 
 
+# Strict collections make strict fonts, columnar ones columnar fonts, and each font
+# gets its own budget, see FileFont.
 class Collection:
-    pass
+    def __init__(
+        self,
+        data: bytes | MemoryMap,
+        src: Path | None = None,
+        strict: bool = False,
+        budget: int | None = None,
+        columnar: bool = False,
+    ):
+        self._buffer: bytes | MemoryMap = data
+        self._data: memoryview = memoryview(data)
+        self._src = src
+        self._closed: bool = False
+        self._strict: bool = strict
+        self._budget: int | None = budget
+        self._columnar: bool = columnar
+
+        cursor = (BoundedCursor if strict else FontCursor)(None, self._data)
+        self.header: TTCHeader = parse_ttc_header(cursor)
+        self._fonts: list[CollectionFont | None] = [None] * self.header.numFonts
+
+        self._lock: Lock = Lock()
+        self._table_locks: dict[TableKey, Lock] = {}
+        # Each key can hold several parses if the member fonts disagree on the
+        # tables it depends on.
+        self._tables: dict[TableKey, list[tuple[tuple[TableKey, ...], Table]]] = {}
+
+    @property
+    def strict(self) -> bool:
+        return self._strict
+
+    @property
+    def columnar(self) -> bool:
+        return self._columnar
+
+    def __len__(self) -> int:
+        return self.header.numFonts
+
+    def __getitem__(self, index: int) -> CollectionFont:
+        return self.get_font(index)
+
+    def __iter__(self):
+        return (self.get_font(index) for index in range(self.header.numFonts))
+
+    def get_font(self, index: int) -> CollectionFont:
+        # Fonts are only created once asked for, as creating one parses its directory.
+        font = self._fonts[index]
+        if font is not None:
+            return font
+
+        with self._lock:
+            font = self._fonts[index]
+            if font is None:
+                font = self._fonts[index] = CollectionFont(self, index)
+        return font
+
+    def _get_shared_table(self, font: CollectionFont, record: TableRecord) -> Table:
+        key = _table_key(record)
+        with self._lock:
+            table_lock = self._table_locks.setdefault(key, Lock())
+
+        with table_lock:
+            for dependencies, table in self._tables.get(key, ()):
+                if _same_dependencies(font, dependencies):
+                    return table
+
+            if font.strict:
+                end = record.offset + record.length
+                cursor = _BoundedSharedCursor(font, font._data, end=end)
+            else:
+                cursor = _SharedCursor(font, font._data)
+            table = parsers[record.tableTag](cursor, record)
+            if table is not None:
+                dependencies = tuple(
+                    _table_key(font.get_record(tag)) for tag in cursor.dependencies
+                )
+                self._tables.setdefault(key, []).append((dependencies, table))
+
+        return table
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def close(self):
+        self._closed = True
+        for font in self._fonts:
+            if font is not None and not font.closed:
+                font.close()
+        self._data.release()
+        if isinstance(self._buffer, MemoryMap):
+            self._buffer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    @classmethod
+    def from_file(
+        cls,
+        file: Path,
+        mmap: bool = False,
+        strict: bool = False,
+        budget: int | None = None,
+        columnar: bool = False,
+    ):
+        with open(file, "rb") as fp:
+            if mmap:
+                data = MemoryMap(fp.fileno(), 0, access=ACCESS_READ)
+            else:
+                data = fp.read()
+        return cls(data, file, strict, budget, columnar)
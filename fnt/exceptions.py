@@ -21,3 +21,60 @@ class TableRedefinitionError(Exception):
         Exception.__init__(
             self, f"{cls} has already been defined, use {cls}.version(<x>) instead."
         )
+
+
+class CompositeGlyphCycleError(Exception):
+    def __init__(self, path: tuple[int, ...]):
+        Exception.__init__(
+            self,
+            f"Composite glyph {path[0]} contains itself "
+            f"({' -> '.join(map(str, path))})",
+        )
+
+
+class CompositeGlyphDepthError(Exception):
+    def __init__(self, glyph_id: int, depth: int):
+        Exception.__init__(
+            self, f"Composite glyph {glyph_id} nests more than {depth} components deep"
+        )
+
+
+class CompositeGlyphPointError(Exception):
+    def __init__(self, glyph_id: int, parent_point: int, child_point: int):
+        Exception.__init__(
+            self,
+            f"Composite glyph {glyph_id} matches point {child_point} of a component "
+            f"onto point {parent_point}, but one of them doesn't exist",
+        )
+
+
+class TableBoundsError(Exception):
+    def __init__(self, tag: str, offset: int, length: int, size: int):
+        Exception.__init__(
+            self,
+            f"The {tag} table ({length} bytes at {offset}) runs past the end of "
+            f"the font ({size} bytes)",
+        )
+
+
+class ReadBoundsError(Exception):
+    def __init__(self, offset: int, size: int, limit: int):
+        Exception.__init__(
+            self, f"Reading {size} bytes at {offset} runs past the table's end {limit}"
+        )
+
+
+class CountBoundsError(Exception):
+    def __init__(self, count: int, size: int, remaining: int):
+        Exception.__init__(
+            self,
+            f"{count} items of {size} bytes don't fit in the {remaining} bytes left "
+            f"in the table",
+        )
+
+
+class MemoryBudgetError(Exception):
+    def __init__(self, requested: int, budget: int):
+        Exception.__init__(
+            self, f"Parsing {requested} bytes is over the {budget} left in the budget"
+        )
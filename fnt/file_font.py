@@ -1,6 +1,12 @@
 from pathlib import Path
+from struct import Struct
+from mmap import mmap as MemoryMap, ACCESS_READ
+from threading import Lock
 
-from .font import Font, TableRef
+from .font import Font, FontCursor, BoundedCursor, TableRef
+from .exceptions import TableBoundsError, MemoryBudgetError
+from .cache import TableCache, TableKey, table_key, UNCACHED_TABLES
+from .checksum import ChecksumMismatch, verify_checksums
 from .tables import (
     Table,
     TableDirectory,
@@ -83,30 +89,125 @@ from .parsing import parsers, parse_table_directory
 # File Fonts hold and manage their own byte data. They can do what the like with it, and
 # aren't beholdent to a collection.
 class FileFont(Font):
-    def __init__(self, data: bytes, src: Path | None = None):
-        self._data: bytes = data
+    def __init__(
+        self,
+        data: bytes | MemoryMap,
+        src: Path | None = None,
+        offset: int = 0,
+        cache: TableCache | None = None,
+        strict: bool = False,
+        budget: int | None = None,
+        columnar: bool = False,
+    ):
+        # All reads go through a memoryview so that unpack and view never copy.
+        self._buffer: bytes | MemoryMap = data
+        self._data: memoryview = memoryview(data)
         self._src = src
+        self._closed: bool = False
+
+        if cache is not None and src is None:
+            raise ValueError("only fonts read from a file can use a table cache.")
+        self._cache: TableCache | None = cache
+        self._cache_key: str | None = (
+            None if cache is None else cache.font_key(src, columnar)
+        )
+        self._cached_tables: dict[TableKey, Table] | None = None
+        # Set once tables are parsed that the cache entry doesn't hold yet, see flush.
+        self._cache_dirty: bool = False
 
         self._byte_offset: int = 0
+        self._directory_offset: int = offset
+
+        # Bytes of font data the parsers may still expand into tuples and arrays, see
+        # Font.check_count. Parsed tables take a small multiple of this in memory.
+        self._budget: int | None = budget
 
-        table_directory = parse_table_directory(self, 0)
+        # Columnar fonts keep the records there can be thousands of (cmap groups,
+        # variation mappings, DSIG records) as Columns of typed arrays.
+        self._columnar: bool = columnar
+
+        # Strict fonts check every table record against the data once here, so
+        # parsing can't read past the end of the font or into a later table.
+        self._strict: bool = strict
+        if strict:
+            cursor = BoundedCursor(self, self._data)
+            table_directory = parse_table_directory(cursor, offset)
+            for record in table_directory.tableRecords:
+                if record.offset + record.length > len(self._data):
+                    raise TableBoundsError(
+                        record.tableTag, record.offset, record.length, len(self._data)
+                    )
+        else:
+            table_directory = parse_table_directory(self, offset)
         self._records: dict[str, TableRecord] = {
             record.tableTag: record for record in table_directory.tableRecords
         }
         self._tables: dict[str, Table] = {"directory": table_directory}
 
+        # Each table gets its own lock so independant tables can be parsed at the
+        # same time, but no table is ever parsed twice.
+        self._lock: Lock = Lock()
+        self._table_locks: dict[str, Lock] = {}
+
     def seek(self, offset: int):
         self._byte_offset = offset
 
     def read(self, sz: int) -> bytes:
+        n = self._byte_offset + sz
+        b = self._data[self._byte_offset : n].tobytes()
+        self._byte_offset = n
+        return b
+
+    def view(self, sz: int) -> memoryview:
+        # Zero-copy alternative to read, only valid while the font's data is alive.
         n = self._byte_offset + sz
         b = self._data[self._byte_offset : n]
         self._byte_offset = n
         return b
 
+    def unpack(self, fmt: Struct) -> tuple:
+        values = fmt.unpack_from(self._data, self._byte_offset)
+        self._byte_offset += fmt.size
+        return values
+
     def pointer(self) -> int:
         return self._byte_offset
 
+    def read_at(self, offset: int, sz: int) -> bytes:
+        return self._data[offset : offset + sz].tobytes()
+
+    def unpack_at(self, fmt: Struct, offset: int) -> tuple:
+        return fmt.unpack_from(self._data, offset)
+
+    def cursor(self, offset: int = 0) -> FontCursor:
+        return FontCursor(self, self._data, offset)
+
+    @property
+    def strict(self) -> bool:
+        return self._strict
+
+    @property
+    def budget(self) -> int | None:
+        return self._budget
+
+    @property
+    def columnar(self) -> bool:
+        return self._columnar
+
+    def charge(self, size: int):
+        if self._budget is None:
+            return
+        with self._lock:
+            if size > self._budget:
+                raise MemoryBudgetError(size, self._budget)
+            self._budget -= size
+
+    # Strict fonts' parsers can't read past the end of the table.
+    def _table_cursor(self, record: TableRecord) -> FontCursor:
+        if self._strict:
+            return BoundedCursor(self, self._data, end=record.offset + record.length)
+        return self.cursor()
+
     def get_record(self, name: str) -> TableRecord:
         if name not in self._records:
             # TODO: make custom error for this
@@ -127,25 +228,112 @@ class FileFont(Font):
         if name not in self._records:
             raise KeyError(f"font does not contain the {name} table.")
 
-        record = self._records[name]
-        table = parsers[name](self, record)
-        if table is None:
-            raise ValueError(f"Failed to parse {name} table.")
-        self._tables[record.tableTag] = table
+        with self._lock:
+            table_lock = self._table_locks.setdefault(name, Lock())
+
+        with table_lock:
+            # Another thread may have finished parsing while we waited.
+            if name in self._tables:
+                return self._tables[name]
+
+            record = self._records[name]
+            table = self._parse_table(record)
+            if table is None:
+                raise ValueError(f"Failed to parse {name} table.")
+            self._tables[record.tableTag] = table
 
         return table
 
+    def _parse_table(self, record: TableRecord) -> Table | None:
+        if self._cache is None:
+            return parsers[record.tableTag](self._table_cursor(record), record)
+
+        with self._lock:
+            if self._cached_tables is None:
+                self._cached_tables = self._cache.load(self._cache_key)
+
+        key = table_key(record)
+        table = self._cached_tables.get(key)
+        if table is not None:
+            return table
+
+        table = parsers[record.tableTag](self._table_cursor(record), record)
+        if table is not None and record.tableTag not in UNCACHED_TABLES:
+            with self._lock:
+                self._cached_tables[key] = table
+                self._cache_dirty = True
+        return table
+
+    # Writes the tables parsed since the entry was last written to the cache, in one
+    # go as the whole entry is rewritten. close calls this, so fonts using a cache
+    # should be closed or used as a context manager.
+    def flush(self):
+        if self._cache is None:
+            return
+        # Held while storing so an older snapshot never replaces a newer one.
+        with self._lock:
+            if not self._cache_dirty:
+                return
+            self._cache.store(self._cache_key, self._cached_tables)
+            self._cache_dirty = False
+
     def has_table(self, name: str) -> bool:
         return name in self._records or name in self._tables
 
+    # Compares every table's bytes against its record's checksum, and the head
+    # table's checksumAdjustment against the whole file. Returns the mismatches, so
+    # an empty tuple means the font is intact. Collection members only check their
+    # tables, as the adjustment covers the file they share.
+    def verify(self, workers: int | None = None) -> tuple[ChecksumMismatch, ...]:
+        return verify_checksums(
+            self._data,
+            tuple(self._records.values()),
+            whole_font=self._directory_offset == 0,
+            workers=workers,
+        )
+
     def is_table_parsed(self, name: str) -> bool:
         return name in self._tables
 
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def close(self):
+        self.flush()
+        # Any memoryview handed out by view must be released first, otherwise
+        # closing a memory mapped font raises a BufferError.
+        self._closed = True
+        self._data.release()
+        if isinstance(self._buffer, MemoryMap):
+            self._buffer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
     @classmethod
-    def from_file(cls, file: Path):
+    def from_file(
+        cls,
+        file: Path,
+        mmap: bool = False,
+        cache: TableCache | None = None,
+        strict: bool = False,
+        budget: int | None = None,
+        columnar: bool = False,
+    ):
+        # When memory mapped only the pages of the tables actually parsed are
+        # read from disk. The font should then be closed, or used as a context manager.
         with open(file, "rb") as fp:
-            data = fp.read()
-        return cls(data, file)
+            if mmap:
+                data = MemoryMap(fp.fileno(), 0, access=ACCESS_READ)
+            else:
+                data = fp.read()
+        return cls(
+            data, file, cache=cache, strict=strict, budget=budget, columnar=columnar
+        )
 
     # -- TableRefs for better type checking --
     directory: TableDirectory | None = TableRef(TableDirectory, "directory")
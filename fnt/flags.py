@@ -80,16 +80,16 @@ class ISOEncoding:
 
 class WindowsEncoding:
     SYMBOL: uint16 = 0
-    UNICODE_BMP: uint16 = 0
-    SHIFTJIS: uint16 = 0
-    PRC: uint16 = 0
-    BIG5: uint16 = 0
-    WANSUNG: uint16 = 0
-    JOHAB: uint16 = 0
-    RESERVED0: uint16 = 0
-    RESERVED1: uint16 = 0
-    RESERVED2: uint16 = 0
-    UNICODE_FULL: uint16 = 0
+    UNICODE_BMP: uint16 = 1
+    SHIFTJIS: uint16 = 2
+    PRC: uint16 = 3
+    BIG5: uint16 = 4
+    WANSUNG: uint16 = 5
+    JOHAB: uint16 = 6
+    RESERVED0: uint16 = 7
+    RESERVED1: uint16 = 8
+    RESERVED2: uint16 = 9
+    UNICODE_FULL: uint16 = 10
 
 
 # Custom supports any from 0-255 see:
@@ -129,6 +129,21 @@ class fontDirectionHint:
     RIGHT_TO_LEFT_NEUTRALS: int16 = -2
 
 
+# https://learn.microsoft.com/en-us/typography/opentype/spec/os2#fsselection
+class fsSelectionFlags:
+    ITALIC: uint16 = 0x0001
+    UNDERSCORE: uint16 = 0x0002
+    NEGATIVE: uint16 = 0x0004
+    OUTLINED: uint16 = 0x0008
+    STRIKEOUT: uint16 = 0x0010
+    BOLD: uint16 = 0x0020
+    REGULAR: uint16 = 0x0040
+    USE_TYPO_METRICS: uint16 = 0x0080
+    WWS: uint16 = 0x0100
+    OBLIQUE: uint16 = 0x0200
+    Reserved: uint16 = 0xFC00
+
+
 class SimpleGlyphFlags:
     ON_CURVE_POINT: uint8 = 0x01
     X_SHORT_VECTOR: uint8 = 0x02
@@ -1,6 +1,16 @@
 from typing import Callable
+from functools import lru_cache
+from struct import Struct
+from array import array
+from sys import byteorder
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 from .tables import Table, TableRecord
+from .exceptions import ReadBoundsError, CountBoundsError
 from .types import (
     uint8,
     int8,
@@ -15,22 +25,35 @@ from .types import (
     LONGDATETIME,
     tag,
     version16dot16,
-    uint8_from_bytes,
-    int8_from_bytes,
-    uint16_from_bytes,
-    int16_from_bytes,
-    uint24_from_bytes,
-    int24_from_bytes,
-    uint32_from_bytes,
-    int32_from_bytes,
-    fixed_from_bytes,
-    F2DOT14_from_bytes,
-    LONGDATETIME_from_bytes,
     tag_from_bytes,
-    version16dot16_from_bytes,
 )
 
-__all__ = ("Font", "ParseMethod", "TableRef")
+__all__ = ("Font", "FontCursor", "BoundedCursor", "ParseMethod", "TableRef")
+
+
+# Arrays are decoded with a single struct call rather than one int.from_bytes per item.
+# The compiled formats are cached as the same few counts come up again and again
+# (256 subHeaderKeys, segCount arrays, numberOfHMetrics, etc).
+@lru_cache(maxsize=512)
+def array_format(code: str, count: int) -> Struct:
+    if len(code) == 1:
+        return Struct(f">{count}{code}")
+    return Struct(">" + code * count)
+
+
+UINT8 = Struct(">B")
+INT8 = Struct(">b")
+UINT16 = Struct(">H")
+INT16 = Struct(">h")
+UINT24 = Struct(">BH")  # struct has no 24-bit codes so split into high byte + word
+INT24 = Struct(">bH")
+UINT32 = Struct(">I")
+INT32 = Struct(">i")
+TIME = Struct(">q")
+VERSION = Struct(">HBx")
+
+# Below this many characters numpy's call overhead outweighs the batching.
+VECTORIZE_CHARACTERS = 100
 
 
 # Abstract
@@ -62,46 +85,125 @@ class Font:
     def pointer(self) -> int:
         raise NotImplementedError()
 
+    # Offset-explicit reads, these never touch the seek position so are safe to
+    # share between threads.
+    def read_at(self, offset: int, sz: int) -> bytes:
+        raise NotImplementedError()
+
+    def unpack_at(self, fmt: Struct, offset: int) -> tuple:
+        return fmt.unpack(self.read_at(offset, fmt.size))
+
+    # A new, independent, seek position over the font's bytes.
+    def cursor(self, offset: int = 0) -> "Font":
+        raise NotImplementedError()
+
+    # Fonts which hold their bytes should override these to skip the
+    # intermediate bytes object made by read (see FileFont).
+    def view(self, sz: int) -> memoryview:
+        return memoryview(self.read(sz))
+
+    def unpack(self, fmt: Struct) -> tuple:
+        return fmt.unpack(self.read(fmt.size))
+
+    # Parsers call this with any count read from the font before allocating for it.
+    # count items of size bytes each have to fit between the read position and end
+    # (the end of the table), and are charged against the font's memory budget.
+    # Returns count so it can be checked inline.
+    def check_count(self, count: int, size: int, end: int) -> int:
+        remaining = end - self.pointer()
+        if count * size > remaining:
+            raise CountBoundsError(count, size, remaining)
+        self.charge(count * size)
+        return count
+
+    # Fonts without a memory budget accept everything.
+    def charge(self, size: int):
+        pass
+
+    # Columnar fonts parse their large record tuples into Columns, see FileFont.
+    @property
+    def columnar(self) -> bool:
+        return False
+
+    # -- TEXT METHODS --
+
+    # The advance width of text at size (in whatever unit size is given in, i.e. px
+    # or pt), or each character's advance when advances is True. Only the glyph
+    # advances are summed; kerning and shaping are not applied.
+    def measure(
+        self, text: str, size: float = 1.0, advances: bool = False
+    ) -> float | array:
+        cmap = self.get_table("cmap")
+        hmtx = self.get_table("hmtx")
+        scale = size / self.get_table("head").unitsPerEm
+
+        if numpy is not None and len(text) >= VECTORIZE_CHARACTERS:
+            widths = self._measure_numpy(text, cmap, hmtx) * scale
+            if advances:
+                result = array("d")
+                result.frombytes(widths.tobytes())
+                return result
+            return float(widths.sum())
+
+        widths = hmtx.advances(map(cmap.lookup, map(ord, text)))
+        if advances:
+            return array("d", [width * scale for width in widths])
+        return sum(widths) * scale
+
+    @staticmethod
+    def _measure_numpy(text: str, cmap: Table, hmtx: Table) -> "numpy.ndarray":
+        # Each distinct character is only looked up once, then spread back out.
+        codepoints = numpy.frombuffer(text.encode("utf-32-le"), "<u4")
+        unique, inverse = numpy.unique(codepoints, return_inverse=True)
+        glyphs = numpy.fromiter(map(cmap.lookup, unique.tolist()), numpy.intp)
+
+        widths = numpy.frombuffer(hmtx.advanceWidths, numpy.uint16)
+        glyphs = numpy.minimum(glyphs, len(widths) - 1)
+        return widths[glyphs][inverse].astype(numpy.float64)
+
     # -- FILE READ METHODS --
 
     def get_uint8(self) -> uint8:
-        return uint8_from_bytes(self.read(1))
+        return self.unpack(UINT8)[0]
 
     def get_int8(self) -> int8:
-        return int8_from_bytes(self.read(1))
+        return self.unpack(INT8)[0]
 
     def get_uint16(self) -> uint16:
-        return uint16_from_bytes(self.read(2))
+        return self.unpack(UINT16)[0]
 
     def get_int16(self) -> int16:
-        return int16_from_bytes(self.read(2))
+        return self.unpack(INT16)[0]
 
     def get_uint24(self) -> uint24:
-        return uint24_from_bytes(self.read(3))
+        high, low = self.unpack(UINT24)
+        return (high << 16) + low
 
     def get_int24(self) -> int24:
-        return int24_from_bytes(self.read(3))
+        high, low = self.unpack(INT24)
+        return (high << 16) + low
 
     def get_uint32(self) -> uint32:
-        return uint32_from_bytes(self.read(4))
+        return self.unpack(UINT32)[0]
 
     def get_int32(self) -> int32:
-        return int32_from_bytes(self.read(4))
+        return self.unpack(INT32)[0]
 
     def get_fixed(self) -> fixed:
-        return fixed_from_bytes(self.read(4))
+        return self.unpack(INT32)[0] / (1 << 16)
 
     def get_F2DOT14(self) -> F2DOT14:
-        return F2DOT14_from_bytes(self.read(2))
+        return self.unpack(INT16)[0] / (1 << 14)
 
     def get_time(self) -> LONGDATETIME:
-        return LONGDATETIME_from_bytes(self.read(8))
+        return self.unpack(TIME)[0]
 
     def get_tag(self) -> tag:
         return tag_from_bytes(self.read(4))
 
     def get_version_legacy(self) -> version16dot16:
-        return version16dot16_from_bytes(self.read(4))
+        major, minor = self.unpack(VERSION)
+        return major, (minor & 0xF0) >> 4
 
     get_offset8 = get_uint8
     get_offset16 = get_uint16
@@ -110,61 +212,59 @@ class Font:
     get_FWORD = get_int16
 
     def get_uint8_array(self, count: int) -> tuple[uint8, ...]:
-        b = self.read(count)
-        return tuple(uint8_from_bytes(b[i : i + 1]) for i in range(count))
+        return self.unpack(array_format("B", count))
 
     def get_int8_array(self, count: int) -> tuple[int8, ...]:
-        b = self.read(count)
-        return tuple(int8_from_bytes(b[i : i + 1]) for i in range(count))
+        return self.unpack(array_format("b", count))
 
     def get_uint16_array(self, count: int) -> tuple[uint16, ...]:
-        b = self.read(2 * count)
-        return tuple(uint16_from_bytes(b[2 * i : 2 * i + 2]) for i in range(count))
+        return self.unpack(array_format("H", count))
 
     def get_int16_array(self, count: int) -> tuple[int16, ...]:
-        b = self.read(2 * count)
-        return tuple(uint16_from_bytes(b[2 * i : 2 * i + 2]) for i in range(count))
+        return self.unpack(array_format("h", count))
 
     def get_uint24_array(self, count: int) -> tuple[uint24, ...]:
-        b = self.read(3 * count)
-        return tuple(uint24_from_bytes(b[3 * i : 3 * i + 3]) for i in range(count))
+        values = iter(self.unpack(array_format("BH", count)))
+        return tuple((high << 16) + low for high, low in zip(values, values))
 
     def get_int24_array(self, count: int) -> tuple[int24, ...]:
-        b = self.read(3 * count)
-        return tuple(int24_from_bytes(b[3 * i : 3 * i + 3]) for i in range(count))
+        values = iter(self.unpack(array_format("bH", count)))
+        return tuple((high << 16) + low for high, low in zip(values, values))
 
     def get_uint32_array(self, count: int) -> tuple[uint32, ...]:
-        b = self.read(4 * count)
-        return tuple(uint32_from_bytes(b[4 * i : 4 * i + 4]) for i in range(count))
+        return self.unpack(array_format("I", count))
 
     def get_int32_array(self, count: int) -> tuple[int32, ...]:
-        b = self.read(4 * count)
-        return tuple(int32_from_bytes(b[4 * i : 4 * i + 4]) for i in range(count))
+        return self.unpack(array_format("i", count))
 
     def get_fixed_array(self, count: int) -> tuple[fixed, ...]:
-        b = self.read(4 * count)
-        return tuple(fixed_from_bytes(b[4 * i : 4 * i + 4]) for i in range(count))
+        return tuple(v / (1 << 16) for v in self.unpack(array_format("i", count)))
 
     def get_F2DOT14_array(self, count: int) -> tuple[F2DOT14, ...]:
-        b = self.read(2 * count)
-        return tuple(F2DOT14_from_bytes(b[2 * i : 2 * i + 2]) for i in range(count))
+        return tuple(v / (1 << 14) for v in self.unpack(array_format("h", count)))
 
     def get_time_array(self, count: int) -> tuple[LONGDATETIME, ...]:
-        b = self.read(8 * count)
-        return tuple(
-            LONGDATETIME_from_bytes(b[8 * i : 8 * i + 8]) for i in range(count)
-        )
+        return self.unpack(array_format("q", count))
 
     def get_tag_array(self, count: int) -> tuple[tag, ...]:
-        b = self.read(4 * count)
-        return tuple(tag_from_bytes(b[4 * i : 4 * i + 4]) for i in range(count))
+        s = self.read(4 * count).decode("latin-1")
+        return tuple(s[4 * i : 4 * i + 4] for i in range(count))
 
     def get_version_legacy_array(self, count: int) -> tuple[version16dot16, ...]:
-        b = self.read(4 * count)
+        values = iter(self.unpack(array_format("HBx", count)))
         return tuple(
-            version16dot16_from_bytes(b[4 * i : 4 * i + 4]) for i in range(count)
+            (major, (minor & 0xF0) >> 4) for major, minor in zip(values, values)
         )
 
+    # Big endian values straight into a compact array rather than a tuple, for the
+    # per glyph tables where a tuple of ints costs far more memory.
+    def get_packed_array(self, typecode: str, count: int) -> array:
+        values = array(typecode)
+        values.frombytes(self.read(values.itemsize * count))
+        if byteorder == "little" and values.itemsize > 1:
+            values.byteswap()
+        return values
+
     get_offset8_array = get_uint8_array
     get_offset16_array = get_uint16_array
     get_offset24_array = get_uint24_array
@@ -173,6 +273,120 @@ class Font:
     get_FWORD_array = get_int16_array
 
 
+# A private seek position over another font's bytes. Tables are parsed through
+# their own cursor so concurrent get_table calls never share a position, everything
+# that isn't a read is handed back to the owning font. The font is None when the bytes
+# don't belong to a single font (i.e. the header of a collection).
+class FontCursor(Font):
+    def __init__(self, font: Font | None, data: memoryview, offset: int = 0):
+        self._font: Font | None = font
+        self._data: memoryview = data
+        self._byte_offset: int = offset
+
+    def get_record(self, name: str) -> TableRecord:
+        return self._font.get_record(name)
+
+    def get_table_names(self) -> tuple[str, ...]:
+        return self._font.get_table_names()
+
+    def get_tables(self) -> tuple[Table, ...]:
+        return self._font.get_tables()
+
+    def get_table(self, name: str) -> Table | None:
+        return self._font.get_table(name)
+
+    def has_table(self, name: str) -> bool:
+        return self._font.has_table(name)
+
+    def is_table_parsed(self, name: str) -> bool:
+        return self._font.is_table_parsed(name)
+
+    def charge(self, size: int):
+        if self._font is not None:
+            self._font.charge(size)
+
+    @property
+    def columnar(self) -> bool:
+        return self._font is not None and self._font.columnar
+
+    def seek(self, offset: int):
+        self._byte_offset = offset
+
+    def read(self, sz: int) -> bytes:
+        n = self._byte_offset + sz
+        b = self._data[self._byte_offset : n].tobytes()
+        self._byte_offset = n
+        return b
+
+    def view(self, sz: int) -> memoryview:
+        n = self._byte_offset + sz
+        b = self._data[self._byte_offset : n]
+        self._byte_offset = n
+        return b
+
+    def unpack(self, fmt: Struct) -> tuple:
+        values = fmt.unpack_from(self._data, self._byte_offset)
+        self._byte_offset += fmt.size
+        return values
+
+    def pointer(self) -> int:
+        return self._byte_offset
+
+    def read_at(self, offset: int, sz: int) -> bytes:
+        return self._data[offset : offset + sz].tobytes()
+
+    def unpack_at(self, fmt: Struct, offset: int) -> tuple:
+        return fmt.unpack_from(self._data, offset)
+
+    def cursor(self, offset: int = 0) -> "FontCursor":
+        return FontCursor(self._font, self._data, offset)
+
+
+# A cursor for strict fonts, reads stop at end (where the table being parsed ends)
+# and any read past it raises a ReadBoundsError rather than coming back short. The
+# cursor shares its font's view rather than slicing it, so tables which hold onto
+# their cursor (glyf) don't keep a memory mapped font from closing. Table records are
+# checked against the font once, so end is never past the data.
+class BoundedCursor(FontCursor):
+    def __init__(
+        self, font: Font | None, data: memoryview, offset: int = 0, end: int = -1
+    ):
+        FontCursor.__init__(self, font, data, offset)
+        self._end: int = len(data) if end < 0 else end
+
+    def read(self, sz: int) -> bytes:
+        return self.view(sz).tobytes()
+
+    def view(self, sz: int) -> memoryview:
+        n = self._byte_offset + sz
+        if n > self._end:
+            raise ReadBoundsError(self._byte_offset, sz, self._end)
+        b = self._data[self._byte_offset : n]
+        self._byte_offset = n
+        return b
+
+    def unpack(self, fmt: Struct) -> tuple:
+        offset = self._byte_offset
+        if offset + fmt.size > self._end:
+            raise ReadBoundsError(offset, fmt.size, self._end)
+        values = fmt.unpack_from(self._data, offset)
+        self._byte_offset = offset + fmt.size
+        return values
+
+    def read_at(self, offset: int, sz: int) -> bytes:
+        if offset + sz > self._end:
+            raise ReadBoundsError(offset, sz, self._end)
+        return self._data[offset : offset + sz].tobytes()
+
+    def unpack_at(self, fmt: Struct, offset: int) -> tuple:
+        if offset + fmt.size > self._end:
+            raise ReadBoundsError(offset, fmt.size, self._end)
+        return fmt.unpack_from(self._data, offset)
+
+    def cursor(self, offset: int = 0) -> "BoundedCursor":
+        return BoundedCursor(self._font, self._data, offset, self._end)
+
+
 type ParseMethod = Callable[[Font, TableRecord], Table]
 
 
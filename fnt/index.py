@@ -0,0 +1,306 @@
+from __future__ import annotations
+from pathlib import Path
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from os import stat_result
+from typing import Iterable
+from struct import error as StructError
+import sqlite3
+
+from .file_font import FileFont
+from .collection import Collection
+from .exceptions import (
+    CompositeGlyphCycleError,
+    CompositeGlyphDepthError,
+    CompositeGlyphPointError,
+    TableBoundsError,
+    ReadBoundsError,
+    CountBoundsError,
+    MemoryBudgetError,
+)
+from .flags import fsSelectionFlags
+from .tables import cmap, name, OS2, Coverage
+
+__all__ = ("FontIndex", "IndexedFont")
+
+FONT_SUFFIXES = frozenset((".ttf", ".otf", ".ttc", ".otc"))
+
+# What a malformed font raises while being described. Such files are indexed without
+# any faces, so they aren't read again until they change.
+PARSE_ERRORS = (
+    ValueError,
+    LookupError,
+    StructError,
+    CompositeGlyphCycleError,
+    CompositeGlyphDepthError,
+    CompositeGlyphPointError,
+    TableBoundsError,
+    ReadBoundsError,
+    CountBoundsError,
+    MemoryBudgetError,
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS fonts (
+    id INTEGER PRIMARY KEY,
+    file INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    face INTEGER NOT NULL,
+    family TEXT,
+    subfamily TEXT,
+    weight INTEGER,
+    fs_selection INTEGER,
+    unicode_range1 INTEGER,
+    unicode_range2 INTEGER,
+    unicode_range3 INTEGER,
+    unicode_range4 INTEGER
+);
+CREATE INDEX IF NOT EXISTS fonts_file ON fonts(file);
+CREATE TABLE IF NOT EXISTS coverage (
+    block INTEGER NOT NULL,
+    font INTEGER NOT NULL REFERENCES fonts(id) ON DELETE CASCADE,
+    bits BLOB NOT NULL,
+    PRIMARY KEY (block, font)
+) WITHOUT ROWID;
+"""
+
+# face, family, subfamily, weight, fsSelection, the 4 unicode ranges, coverage blocks
+type FaceSummary = tuple[
+    int,
+    str | None,
+    str | None,
+    int | None,
+    int | None,
+    int | None,
+    int | None,
+    int | None,
+    int | None,
+    dict[int, bytes],
+]
+
+
+@dataclass(frozen=True)
+class IndexedFont:
+    path: Path
+    face: int
+    family: str | None
+    subfamily: str | None
+    weight: int | None
+    fsSelection: int | None
+
+    @property
+    def italic(self) -> bool:
+        return bool((self.fsSelection or 0) & fsSelectionFlags.ITALIC)
+
+
+# Coverage is stored as 256 codepoint blocks, each a 32 byte slice of the font's
+# coverage bitset. Only blocks with at least one mapped codepoint are kept.
+def _coverage_blocks(coverage: Coverage) -> dict[int, bytes]:
+    bits = coverage.bits
+    blocks = {}
+    for block in range((len(bits) + 31) >> 5):
+        chunk = bits[32 * block : 32 * block + 32]
+        if any(chunk):
+            blocks[block] = chunk.ljust(32, b"\x00")
+    return blocks
+
+
+def _has_codepoint(bits: bytes, codepoint: int) -> bool:
+    return bool(bits[(codepoint & 0xFF) >> 3] >> (codepoint & 7) & 1)
+
+
+def _describe_face(font: FileFont, face: int) -> FaceSummary:
+    # Fonts missing a table, or with one pyfont can't parse, are still indexed
+    # with whatever could be read.
+    family = subfamily = None
+    if font.has_table("name"):
+        try:
+            table: name = font.get_table("name")
+            family = table.get_name(16, 1)
+            subfamily = table.get_name(17, 2)
+        except (ValueError, LookupError):
+            pass
+
+    weight = fs_selection = None
+    unicode_ranges = (None, None, None, None)
+    if font.has_table("OS/2"):
+        os2: OS2 = font.get_table("OS/2")
+        weight, fs_selection = os2.usWeightClass, os2.fsSelection
+        unicode_ranges = (
+            os2.ulUnicodeRange1,
+            os2.ulUnicodeRange2,
+            os2.ulUnicodeRange3,
+            os2.ulUnicodeRange4,
+        )
+
+    blocks = {}
+    if font.has_table("cmap"):
+        mapping: cmap = font.get_table("cmap")
+        blocks = _coverage_blocks(mapping.coverage())
+
+    return (face, family, subfamily, weight, fs_selection, *unicode_ranges, blocks)
+
+
+# Run in the worker processes, so only plain data is sent back. Files which couldn't
+# be read (i.e. a PermissionError) give None, and are left out of the index until a
+# later scan manages to read them.
+def _describe_file(path: str) -> list[FaceSummary] | None:
+    try:
+        with open(path, "rb") as fp:
+            is_collection = fp.read(4) == b"ttcf"
+        if is_collection:
+            with Collection.from_file(Path(path), mmap=True) as collection:
+                return [_describe_face(font, font.index) for font in collection]
+        with FileFont.from_file(Path(path), mmap=True) as font:
+            return [_describe_face(font, 0)]
+    except PARSE_ERRORS:
+        return []  # one broken file shouldn't stop the scan
+    except OSError:
+        return None
+
+
+# A catalog of the fonts under some directories, answering which fonts cover some
+# text in a given style without opening any font files. Only the family names,
+# OS/2 weight, fsSelection and unicode ranges, and cmap coverage are kept.
+class FontIndex:
+    def __init__(self, database: Path | str = ":memory:"):
+        self._connection = sqlite3.connect(database)
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        self._connection.executescript(SCHEMA)
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM fonts").fetchone()[0]
+
+    def scan(self, *directories: Path, workers: int | None = None) -> int:
+        # Only files which are new, or whose mtime or size changed, are read again.
+        # Returns how many files were read.
+        roots = [Path(directory).resolve() for directory in directories]
+        found: dict[str, stat_result] = {
+            str(path): path.stat()
+            for root in roots
+            for path in root.rglob("*")
+            if path.suffix.lower() in FONT_SUFFIXES and path.is_file()
+        }
+
+        known = {
+            path: (file_id, mtime_ns, size)
+            for file_id, path, mtime_ns, size in self._connection.execute(
+                "SELECT id, path, mtime_ns, size FROM files"
+            )
+            if any(Path(path).is_relative_to(root) for root in roots)
+        }
+        removed = [known[path][0] for path in known.keys() - found.keys()]
+        changed = [
+            path
+            for path, info in found.items()
+            if path not in known or known[path][1:] != (info.st_mtime_ns, info.st_size)
+        ]
+
+        if workers == 1 or len(changed) < 2:
+            summaries = map(_describe_file, changed)
+            self._store(removed, changed, found, summaries)
+        else:
+            with ProcessPoolExecutor(workers) as pool:
+                summaries = pool.map(_describe_file, changed, chunksize=4)
+                self._store(removed, changed, found, summaries)
+        return len(changed)
+
+    def _store(
+        self,
+        removed: list[int],
+        changed: list[str],
+        found: dict[str, stat_result],
+        summaries: Iterable[list[FaceSummary] | None],
+    ):
+        with self._connection as connection:
+            connection.executemany(
+                "DELETE FROM files WHERE id = ?", ((file_id,) for file_id in removed)
+            )
+            for path, faces in zip(changed, summaries):
+                if faces is None:
+                    continue
+                info = found[path]
+                connection.execute("DELETE FROM files WHERE path = ?", (path,))
+                file_id = connection.execute(
+                    "INSERT INTO files (path, mtime_ns, size) VALUES (?, ?, ?)",
+                    (path, info.st_mtime_ns, info.st_size),
+                ).lastrowid
+                for face, *fields, blocks in faces:
+                    font_id = connection.execute(
+                        "INSERT INTO fonts (file, face, family, subfamily, weight, "
+                        "fs_selection, unicode_range1, unicode_range2, "
+                        "unicode_range3, unicode_range4) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (file_id, face, *fields),
+                    ).lastrowid
+                    connection.executemany(
+                        "INSERT INTO coverage (block, font, bits) VALUES (?, ?, ?)",
+                        ((block, font_id, bits) for block, bits in blocks.items()),
+                    )
+
+    def find(
+        self,
+        text: str | int,
+        weight: int | None = None,
+        italic: bool | None = None,
+    ) -> list[IndexedFont]:
+        # Fonts covering every character of text (or a single codepoint).
+        codepoints = sorted({text} if isinstance(text, int) else set(map(ord, text)))
+        if not codepoints:
+            return []
+
+        # The style and the first codepoint's block narrow the fonts down in sqlite,
+        # the bit tests are done here.
+        first = codepoints[0]
+        query = (
+            "SELECT fonts.id, coverage.bits, files.path, fonts.face, fonts.family, "
+            "fonts.subfamily, fonts.weight, fonts.fs_selection FROM coverage "
+            "JOIN fonts ON fonts.id = coverage.font "
+            "JOIN files ON files.id = fonts.file WHERE coverage.block = ?"
+        )
+        params: list[int] = [first >> 8]
+        if weight is not None:
+            query += " AND fonts.weight = ?"
+            params.append(weight)
+        if italic is not None:
+            query += " AND ((fonts.fs_selection & ?) != 0) = ?"
+            params += (fsSelectionFlags.ITALIC, int(italic))
+
+        fonts = {
+            font_id: row
+            for font_id, bits, *row in self._connection.execute(query, params)
+            if _has_codepoint(bits, first)
+        }
+        for codepoint in codepoints[1:]:
+            if not fonts:
+                break
+            covering = {
+                font_id
+                for font_id, bits in self._connection.execute(
+                    "SELECT font, bits FROM coverage WHERE block = ?",
+                    (codepoint >> 8,),
+                )
+                if font_id in fonts and _has_codepoint(bits, codepoint)
+            }
+            fonts = {font_id: fonts[font_id] for font_id in covering}
+
+        return [
+            IndexedFont(Path(path), face, family, subfamily, weight, fs_selection)
+            for path, face, family, subfamily, weight, fs_selection in sorted(
+                fonts.values()
+            )
+        ]
@@ -1,7 +1,9 @@
 from __future__ import annotations
 from typing import Self, Protocol, Callable, TypeVar, TYPE_CHECKING
 from enum import StrEnum
+from functools import cache, partial
 import dataclasses
+import struct
 
 from fnt.exceptions import (
     InvalidFieldTypeError,
@@ -344,9 +346,16 @@ class Array(tuple, TTFType):
         if cls.__typ__ is None:
             raise IllformedTTFTypeError(cls)
 
-        # Because the Array's TTF type might be dynamic is size
-        # all we can do is iterate over them. This could be shortened to an actual
-        # struct read for static arrays.
+        # Arrays of primitives, or of records made of them, are unpacked with one
+        # struct call.
+        size = cls.__typ__.sz
+        if size is not None and (decode := _array_decoder(cls.__typ__)):
+            if len(b) < cls.__ln__ * size:
+                raise ValueError(f"buffer is too small for {cls}")
+            return cls._from_items(decode(b, 0, cls.__ln__))
+
+        # Otherwise the Array's TTF type might be dynamic is size so all we can do is
+        # iterate over them.
         sz = 0
         items = [None] * cls.__ln__
         for idx in range(cls.__ln__):
@@ -363,6 +372,14 @@ class Array(tuple, TTFType):
 
         return array
 
+    @classmethod
+    def _from_items(cls, items: list[TTFType]) -> Self:
+        # items must all be of the Array's type, which has a static size
+        array = tuple.__new__(cls, items)
+        array.fmt = len(items) * cls.__typ__.fmt
+        array.sz = len(items) * cls.__typ__.sz
+        return array
+
     @classmethod
     def force(cls, *items: TTFType):
         if cls.__typ__ is None:
@@ -387,10 +404,11 @@ class Array(tuple, TTFType):
             raise IllformedTTFTypeError(cls)
 
         if cls.__typ__.sz is not None:
-            b = buffer[offset : offset + cls.__ln__ * cls.__typ__.sz]
-            if len(b) < cls.__ln__ * cls.__typ__.sz:
+            if len(buffer) - offset < cls.__ln__ * cls.__typ__.sz:
                 raise ValueError(f"buffer is too small for {cls}")
-            return cls(b)
+            if decode := _array_decoder(cls.__typ__):
+                return cls._from_items(decode(buffer, offset, cls.__ln__))
+            return cls(buffer[offset : offset + cls.__ln__ * cls.__typ__.sz])
 
         return cls(buffer[offset:])
 
@@ -613,6 +631,358 @@ class TableRecord(Protocol):
     length: uint32
 
 
+# The field by field decoders, used by tables the compiler can't handle
+def _interpret_parse(
+    cls: type[Table], record: TableRecord, font: Font, buffer: bytes
+) -> Table:
+    entries: dict[str, TTFType] = {}
+    fmt = ""  # Table's final struct fmt
+    sz = 0  # Table's final byte size, Also used as the rolling offset
+    offset = record.offset
+
+    for field in dataclasses.fields(cls):
+        typ = field.type
+        name = field.name
+        match field.metadata.get("entry", EntryType.STATIC):
+            case EntryType.STATIC:
+                # This entry can be read as-is from the buffer
+                value = _parse_static(typ, buffer, offset + sz)
+                entries[name] = value
+                sz += value.sz
+                fmt += value.fmt
+            case EntryType.DYNAMIC:
+                # This entry has to be modified/derived instead of the raw value
+                derived = field.metadata.get("derived", False)
+                func = field.metadata.get("func", _parse_static)
+                values = (entries[src] for src in field.metadata.get("srcs", ()))
+                value = func(*values, typ, buffer, offset, sz)
+                entries[name] = value
+                if not derived:
+                    # If the entry was actually found in the table then we need to
+                    # offset the buffer, and add it to the format string.
+                    sz += value.sz
+                    fmt += value.fmt
+            case EntryType.LINKED:
+                # this entry comes from another table rather than the buffer
+                source = field.metadata["source"]
+                table = font.get_table(field.metadata["table"])
+                entries[name] = table[source]
+            case EntryType.PROPERTY:
+                # this entry comes from the table record or font.
+                prop = field.metadata.get("property", "length")
+                value = uint32.byte(0)
+                if prop == "length":
+                    value = record.length
+                entries[name] = value
+            case entry:
+                raise InvalidFieldTypeError(entry)
+
+    obj = cls(**entries)
+    obj.fmt = fmt
+    obj.sz = sz
+
+    return obj
+
+
+def _interpret_read(cls: type[Table], buffer: bytes, offset: int = 0) -> Table:
+    entries: dict[str, TTFType] = {}
+    fmt = ""  # Table's final struct fmt
+    sz = 0  # Table's final byte size, Also used as the rolling offset
+
+    for field in dataclasses.fields(cls):
+        typ = field.type  # Metamagic of dataclasses.Field stores the type
+        name = field.name  # Name of the Field from the dataclass def
+        match field.metadata.get("entry", EntryType.STATIC):
+            case EntryType.STATIC:
+                # This entry can be read as-is from the buffer
+                item = _parse_static(typ, buffer, offset + sz)
+                entries[name] = item
+                sz += item.sz
+                fmt += item.fmt
+            case EntryType.DYNAMIC:
+                # This entry has to be modified/derived instead of the raw value
+                derived = field.metadata.get("derived", False)
+                srcs = (entries[src] for src in field.metadata.get("srcs", ()))
+                func = field.metadata.get("func", _parse_static)
+                item = func(*srcs, typ, buffer, offset, sz)
+                entries[name] = item
+                if not derived:
+                    # If the entry was actually found in the table then we need to
+                    # offset the buffer, and add it to the format string.
+                    sz += item.sz
+                    fmt += item.fmt
+            case entry:
+                raise InvalidFieldTypeError(entry)
+
+    obj = cls(**entries)
+    obj.fmt = fmt
+    obj.sz = sz
+
+    return obj
+
+
+# Struct codes of the types compiled decoders unpack themselves, with the expression
+# building each type from its unpacked values (v, or v0 and v1). Subclasses aren't
+# included as they may override __new__.
+_PRIMITIVES: dict[type[TTFType], tuple[str, str]] = {
+    uint8: ("B", "_int({t}, {v})"),
+    int8: ("b", "_int({t}, {v})"),
+    uint16: ("H", "_int({t}, {v})"),
+    int16: ("h", "_int({t}, {v})"),
+    uint24: ("BH", "_int({t}, {v0} << 16 | {v1})"),
+    int24: ("bH", "_int({t}, {v0} << 16 | {v1})"),
+    uint32: ("I", "_int({t}, {v})"),
+    int32: ("i", "_int({t}, {v})"),
+    fixed: ("i", "_float({t}, {v} / 0x10000)"),
+    FWORD: ("h", "_int({t}, {v})"),
+    UFWORD: ("H", "_int({t}, {v})"),
+    F2DOT14: ("h", "_float({t}, {v} / 0x4000)"),
+    LONGDATETIME: ("Q", "_int({t}, {v})"),
+    Tag: ("4s", "_tuple({t}, {v})"),
+    Offset8: ("B", "_int({t}, {v})"),
+    Offset16: ("H", "_int({t}, {v})"),
+    Offset24: ("BH", "_int({t}, {v0} << 16 | {v1})"),
+    Offset32: ("I", "_int({t}, {v})"),
+    Version16Dot16: ("HBx", "_tuple({t}, ({v0}, {v1} >> 4))"),
+}
+
+# Names every generated decoder can use
+_DECODER_GLOBALS = {
+    "_int": int.__new__,
+    "_float": float.__new__,
+    "_tuple": tuple.__new__,
+    "_unpack_from": struct.unpack_from,
+    "_struct_error": struct.error,
+    "_InvalidFieldTypeError": InvalidFieldTypeError,
+}
+
+
+def _value_names(typ: type[TTFType], first: int = 0) -> list[str]:
+    code = ">" + _PRIMITIVES[typ][0]
+    count = len(struct.unpack(code, bytes(struct.calcsize(code))))
+    return [f"v{first + idx}" for idx in range(count)]
+
+
+def _primitive_expr(typ: type[TTFType], t: str, values: list[str]) -> str:
+    return _PRIMITIVES[typ][1].format(t=t, v=values[0], v0=values[0], v1=values[-1])
+
+
+def _define(source: str, namespace: dict, name: str) -> Callable:
+    namespace = {**_DECODER_GLOBALS, **namespace}
+    exec(compile(source, f"<{name} decoder>", "exec"), namespace)
+    return namespace[name]
+
+
+# Decodes ln items of a primitive type starting at offset into a list
+@cache
+def _primitive_decoder(item: type[TTFType]) -> Callable[[bytes, int, int], list]:
+    code = _PRIMITIVES[item][0]
+    values = _value_names(item)
+    expr = _primitive_expr(item, "_item", values)
+    if len(values) == 1 and code.isalpha():
+        source = (
+            "def decode(buffer, offset, ln):\n"
+            f"    values = _unpack_from(f'>{{ln}}{code}', buffer, offset)\n"
+            f"    return [{expr} for v0 in values]\n"
+        )
+    else:
+        source = (
+            "def decode(buffer, offset, ln):\n"
+            "    data = buffer[offset : offset + ln * _item.sz]\n"
+            "    items = _items.iter_unpack(data)\n"
+            f"    return [{expr} for ({', '.join(values)},) in items]\n"
+        )
+    namespace = {"_item": item, "_items": struct.Struct(">" + code)}
+    return _define(source, namespace, "decode")
+
+
+def _array_decoder(item: type[TTFType]) -> Callable[[bytes, int, int], list] | None:
+    if item in _PRIMITIVES:
+        return _primitive_decoder(item)
+    if isinstance(item, Definition) and not item.__versions__:
+        if not item.__selectors__:
+            return item.__rows__
+    return None
+
+
+def _decoder_body(
+    fields: tuple[dataclasses.Field, ...], parse: bool, namespace: dict
+) -> tuple[list[str], list[str]] | None:
+    # The statements reading each field into f0, f1, ..., and the expressions which
+    # concatenate into the table's fmt. None when the fields can't be compiled.
+    lines: list[str] = []
+    fmts: list[str] = []
+    run: list[tuple[int, type[TTFType]]] = []  # static primitives read as one struct
+    shift = 0  # bytes read since pos last moved
+    indices: dict[str, int] = {}
+
+    def at() -> str:
+        return f"pos + {shift}" if shift else "pos"
+
+    def advance(idx: int):
+        nonlocal shift
+        lines.append(f"pos += {shift} + f{idx}.sz" if shift else f"pos += f{idx}.sz")
+        fmts.append(f"f{idx}.fmt")
+        shift = 0
+
+    def flush():
+        nonlocal shift
+        if not run:
+            return
+        values: list[str] = []
+        exprs: list[str] = []
+        for idx, typ in run:
+            names = _value_names(typ, len(values))
+            values.extend(names)
+            exprs.append(f"f{idx} = {_primitive_expr(typ, f'_t{idx}', names)}")
+        name = f"_s{run[0][0]}"
+        namespace[name] = unpacker = struct.Struct(
+            ">" + "".join(_PRIMITIVES[typ][0] for _, typ in run)
+        )
+        lines.append(f"{', '.join(values)}, = {name}.unpack_from(buffer, {at()})")
+        lines.extend(exprs)
+        fmts.append(repr("".join(typ.fmt for _, typ in run)))
+        shift += unpacker.size
+        run.clear()
+
+    for idx, field in enumerate(fields):
+        typ = field.type
+        namespace[f"_t{idx}"] = typ
+        entry = field.metadata.get("entry", EntryType.STATIC)
+        if entry == EntryType.STATIC and typ in _PRIMITIVES:
+            run.append((idx, typ))
+            indices[field.name] = idx
+            continue
+
+        flush()
+        match entry:
+            case EntryType.STATIC:
+                if issubclass(typ, Array):
+                    lines.append(f"f{idx} = _t{idx}.read(buffer, {at()})")
+                else:
+                    lines.append(f"f{idx} = _static(_t{idx}, buffer, {at()})")
+                advance(idx)
+            case EntryType.DYNAMIC:
+                srcs = field.metadata.get("srcs", ())
+                if any(src not in indices for src in srcs):
+                    return None
+                args = [f"f{indices[src]}" for src in srcs]
+                func = field.metadata.get("func", _parse_static)
+                if func is _parse_semistatic_array and len(args) == 1:
+                    lines.append(f"f{idx} = _t{idx}[{args[0]}].read(buffer, {at()})")
+                else:
+                    if shift:
+                        lines.append(f"pos += {shift}")
+                        shift = 0
+                    namespace[f"_f{idx}"] = func
+                    args += [f"_t{idx}", "buffer", "offset", "pos - offset"]
+                    lines.append(f"f{idx} = _f{idx}({', '.join(args)})")
+                if not field.metadata.get("derived", False):
+                    advance(idx)
+            case EntryType.LINKED if parse:
+                namespace[f"_table{idx}"] = field.metadata["table"]
+                namespace[f"_source{idx}"] = field.metadata["source"]
+                lines.append(f"f{idx} = font.get_table(_table{idx})[_source{idx}]")
+            case EntryType.PROPERTY if parse:
+                if field.metadata.get("property", "length") == "length":
+                    lines.append(f"f{idx} = record.length")
+                else:
+                    namespace[f"_p{idx}"] = uint32.byte(0)
+                    lines.append(f"f{idx} = _p{idx}")
+            case _:
+                namespace[f"_e{idx}"] = entry
+                lines.append(f"raise _InvalidFieldTypeError(_e{idx})")
+        indices[field.name] = idx
+
+    flush()
+    if shift:
+        lines.append(f"pos += {shift}")
+    return lines, fmts
+
+
+def _decoder_source(
+    signature: str,
+    prologue: tuple[str, ...],
+    fields: tuple[dataclasses.Field, ...],
+    body: tuple[list[str], list[str]],
+) -> str:
+    lines, fmts = body
+    entries = ", ".join(f"f{idx}" for idx in range(len(fields)))
+    return "\n".join(
+        (
+            f"def {signature}:",
+            *prologue,
+            "    pos = offset",
+            "    try:",
+            *(f"        {line}" for line in lines or ["pass"]),
+            "    except _struct_error as error:",
+            '        raise ValueError("buffer is too small") from error',
+            f"    obj = _cls({entries})",
+            f"    obj.fmt = {' + '.join(fmts) or repr('')}",
+            "    obj.sz = pos - offset",
+            "    return obj",
+        )
+    )
+
+
+def _rows_source(fields: tuple[dataclasses.Field, ...], namespace: dict) -> str:
+    values: list[str] = []
+    exprs: list[str] = []
+    for idx, field in enumerate(fields):
+        names = _value_names(field.type, len(values))
+        values.extend(names)
+        exprs.append(_primitive_expr(field.type, f"_t{idx}", names))
+        namespace[f"_t{idx}"] = field.type
+    namespace["_row"] = struct.Struct(
+        ">" + "".join(_PRIMITIVES[field.type][0] for field in fields)
+    )
+    namespace["_fmt"] = "".join(field.type.fmt for field in fields)
+    return "\n".join(
+        (
+            "def rows(buffer, offset, ln):",
+            "    rows = []",
+            "    append = rows.append",
+            "    data = buffer[offset : offset + ln * _row.size]",
+            f"    for ({', '.join(values)},) in _row.iter_unpack(data):",
+            f"        obj = _cls({', '.join(exprs)})",
+            "        obj.fmt = _fmt",
+            "        obj.sz = _row.size",
+            "        append(obj)",
+            "    return rows",
+        )
+    )
+
+
+# Generates the table's __parser__ and __reader__ from its fields, so parsing doesn't
+# walk the fields every time. Runs of static primitive fields are read with a single
+# struct, and arrays of primitives or of records are read in bulk. Records which are
+# all static primitives also get a __rows__ decoder used by those arrays. Tables the
+# compiler can't handle are interpreted as before.
+def _compile_decoders(table: type[Table]):
+    fields = dataclasses.fields(table)
+    namespace = {"_cls": table, "_static": _parse_static}
+
+    parse = _decoder_body(fields, True, namespace)
+    read = _decoder_body(fields, False, namespace)
+    if parse is None or read is None:
+        table.__parser__ = staticmethod(partial(_interpret_parse, table))
+        table.__reader__ = staticmethod(partial(_interpret_read, table))
+    else:
+        prologue = ("    offset = record.offset",)
+        source = _decoder_source("parse(record, font, buffer)", prologue, fields, parse)
+        table.__parser__ = staticmethod(_define(source, namespace, "parse"))
+        source = _decoder_source("read(buffer, offset=0)", (), fields, read)
+        table.__reader__ = staticmethod(_define(source, namespace, "read"))
+
+    table.__rows__ = None
+    static = (field.metadata.get("entry", EntryType.STATIC) for field in fields)
+    primitive = all(field.type in _PRIMITIVES for field in fields)
+    if fields and primitive and all(entry == EntryType.STATIC for entry in static):
+        namespace = {"_cls": table}
+        source = _rows_source(fields, namespace)
+        table.__rows__ = staticmethod(_define(source, namespace, "rows"))
+
+
 class Definition(type):
     def __new__(cls, name, bases, dct):
         table = type.__new__(cls, name, bases, dct)
@@ -624,6 +994,7 @@ class Definition(type):
         table.__versions__ = {}
 
         table.fmt, table.sz = _find_table_static(table)
+        _compile_decoders(table)
         return table
 
 
@@ -632,6 +1003,10 @@ class Table(TTFType, metaclass=Definition):
     __selectors__: tuple[
         tuple[TTFVersion, Callable[[TTFVersion, TTFVersion], bool], type[Table]], ...
     ] = ()
+    # Generated by the Definition metaclass, see _compile_decoders
+    __parser__: Callable[[TableRecord, Font, bytes], Table] = None
+    __reader__: Callable[[bytes, int], Table] = None
+    __rows__: Callable[[bytes, int, int], list[Table]] | None = None
 
     def __class_getitem__(cls, version: TTFVersion) -> type[Table]:
         if not isinstance(version, TTFType) and len(version) == 1:
@@ -709,53 +1084,7 @@ class Table(TTFType, metaclass=Definition):
 
     @classmethod
     def _parse(cls: Self, record: TableRecord, font: Font, buffer: bytes):
-        entries: dict[str, TTFType] = {}
-        fmt = ""  # Table's final struct fmt
-        sz = 0  # Table's final byte size, Also used as the rolling offset
-        offset = record.offset
-
-        for field in dataclasses.fields(cls):
-            typ = field.type
-            name = field.name
-            match field.metadata.get("entry", EntryType.STATIC):
-                case EntryType.STATIC:
-                    # This entry can be read as-is from the buffer
-                    value = _parse_static(typ, buffer, offset + sz)
-                    entries[name] = value
-                    sz += value.sz
-                    fmt += value.fmt
-                case EntryType.DYNAMIC:
-                    # This entry has to be modified/derived instead of the raw value
-                    derived = field.metadata.get("derived", False)
-                    func = field.metadata.get("func", _parse_static)
-                    values = (entries[src] for src in field.metadata.get("srcs", ()))
-                    value = func(*values, typ, buffer, offset, sz)
-                    entries[name] = value
-                    if not derived:
-                        # If the entry was actually found in the table then we need to
-                        # offset the buffer, and add it to the format string.
-                        sz += value.sz
-                        fmt += value.fmt
-                case EntryType.LINKED:
-                    # this entry comes from another table rather than the buffer
-                    source = field.metadata["source"]
-                    table = font.get_table(field.metadata["table"])
-                    entries[name] = table[source]
-                case EntryType.PROPERTY:
-                    # this entry comes from the table record or font.
-                    prop = field.metadata.get("property", "length")
-                    value = uint32.byte(0)
-                    if prop == "length":
-                        value = record.length
-                    entries[name] = value
-                case entry:
-                    raise InvalidFieldTypeError(entry)
-
-        obj = cls(**entries)
-        obj.fmt = fmt
-        obj.sz = sz
-
-        return obj
+        return cls.__parser__(record, font, buffer)
 
     @classmethod
     def read(cls: Self, buffer: bytes, offset: int = 0) -> Self:
@@ -764,40 +1093,7 @@ class Table(TTFType, metaclass=Definition):
 
     @classmethod
     def _read(cls: Self, buffer, offset: int = 0) -> Self:
-        entries: dict[str, TTFType] = {}
-        fmt = ""  # Table's final struct fmt
-        sz = 0  # Table's final byte size, Also used as the rolling offset
-
-        for field in dataclasses.fields(cls):
-            typ = field.type  # Metamagic of dataclasses.Field stores the type
-            name = field.name  # Name of the Field from the dataclass def
-            match field.metadata.get("entry", EntryType.STATIC):
-                case EntryType.STATIC:
-                    # This entry can be read as-is from the buffer
-                    item = _parse_static(typ, buffer, offset + sz)
-                    entries[name] = item
-                    sz += item.sz
-                    fmt += item.fmt
-                case EntryType.DYNAMIC:
-                    # This entry has to be modified/derived instead of the raw value
-                    derived = field.metadata.get("derived", False)
-                    srcs = (entries[src] for src in field.metadata.get("srcs", ()))
-                    func = field.metadata.get("func", _parse_static)
-                    item = func(*srcs, typ, buffer, offset, sz)
-                    entries[name] = item
-                    if not derived:
-                        # If the entry was actually found in the table then we need to
-                        # offset the buffer, and add it to the format string.
-                        sz += item.sz
-                        fmt += item.fmt
-                case entry:
-                    raise InvalidFieldTypeError(entry)
-
-        obj = cls(**entries)
-        obj.fmt = fmt
-        obj.sz = sz
-
-        return obj
+        return cls.__reader__(buffer, offset)
 
     @classmethod
     def add_version(
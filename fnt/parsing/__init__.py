@@ -1,7 +1,14 @@
 from math import log2, floor
+from sys import byteorder
+from array import array
+from dataclasses import fields
 
 from fnt.font import Font, ParseMethod
 from fnt.tables import (
+    Columns,
+    TTCHeader,
+    TTCHeader_v1,
+    TTCHeader_v2,
     TableRecord,
     TableDirectory,
     acnt,
@@ -22,6 +29,7 @@ from fnt.tables import (
     cmapHeader,
     EncodingRecord,
     MapGroup,
+    MapGroups,
     VariationSelector,
     UnicodeValueRange,
     DefaultUVS,
@@ -58,13 +66,16 @@ from fnt.tables import (
     gasp,
     GDEF,
     glyf,
+    glyfGlyph,
+    SimpleGlyph,
+    CompositeGlyphDescription,
+    CompositeGlyph,
     GPOS,
     GSUB,
     gvar,
     hdmx,
     head,
     hhea,
-    LongHorMetric,
     hmtx,
     HVAR,
     JSTF,
@@ -114,12 +125,32 @@ from fnt.tables import (
     xref,
     Zapf,
 )
-from fnt.flags import Platform, WindowsEncoding, MacintoshEncoding
+from fnt.flags import SimpleGlyphFlags, CompositeGlyphFlags
 
 
 # -- TOP LEVEL TABLES --
 
-# TODO: Font Collection Header
+
+def parse_ttc_header(font: Font, offset: int = 0) -> TTCHeader:
+    font.seek(offset)
+    ttc_tag = font.get_tag()
+    major = font.get_uint16()
+    minor = font.get_uint16()
+    num_fonts = font.get_uint32()
+    offsets = font.get_offset32_array(num_fonts)
+
+    if major == 1:
+        return TTCHeader_v1(ttc_tag, major, minor, num_fonts, offsets)
+    return TTCHeader_v2(
+        ttc_tag,
+        major,
+        minor,
+        num_fonts,
+        offsets,
+        font.get_tag(),
+        font.get_uint32(),
+        font.get_uint32(),
+    )
 
 
 def parse_table_record(font: Font) -> TableRecord:
@@ -153,8 +184,8 @@ def parse_acnt(font: Font, record: TableRecord) -> acnt: ...  # TODO: acnt
 def parse_ankr(font: Font, record: TableRecord) -> ankr: ...  # TODO: ankr
 
 
-def parse_SegmentMaps(font: Font) -> SegmentMaps:
-    count = font.get_uint16()
+def parse_SegmentMaps(font: Font, end: int) -> SegmentMaps:
+    count = font.check_count(font.get_uint16(), 4, end)
     return SegmentMaps(
         count,
         tuple(
@@ -168,13 +199,14 @@ def parse_avar(font: Font, record: TableRecord) -> avar:
     major = font.get_uint16()
     minor = font.get_uint16()
     reserved = font.get_uint16()
-    count = font.get_uint16()
+    end = record.offset + record.length
+    count = font.check_count(font.get_uint16(), 2, end)
     return avar(
         major,
         minor,
         reserved,
         count,
-        tuple(parse_SegmentMaps(font) for _ in range(count)),
+        tuple(parse_SegmentMaps(font, end) for _ in range(count)),
     )
 
 
@@ -193,9 +225,53 @@ def parse_map_group(font: Font):
     return MapGroup(font.get_uint32(), font.get_uint32(), font.get_uint32())
 
 
+# count records made of uint32 fields, read as one array and split into a column per
+# field.
+def parse_uint32_columns(font: Font, record_type: type, count: int) -> Columns:
+    names = [field.name for field in fields(record_type)]
+    values = font.get_packed_array("I", len(names) * count)
+    columns = {name: values[idx :: len(names)] for idx, name in enumerate(names)}
+    return Columns(record_type, columns)
+
+
+# Bytes start to start + width of each stride byte row of raw, as a column of the
+# big-endian values they make (padded out to the typecode's size).
+def _byte_column(raw: array, stride: int, start: int, width: int, typecode: str):
+    column = array(typecode)
+    size = column.itemsize
+    data = bytearray(size * (len(raw) // stride))
+    for idx in range(width):
+        data[size - width + idx :: size] = raw[start + idx :: stride]
+    column.frombytes(data)
+    if byteorder == "little" and size > 1:
+        column.byteswap()
+    return column
+
+
+# count records of a uint24 followed by a uint8 or uint16 field (typecode "B" or "H"),
+# read as one array of bytes which is split into columns without making any rows.
+def parse_uint24_columns(
+    font: Font, record_type: type, typecode: str, count: int
+) -> Columns:
+    stride = 3 + array(typecode).itemsize
+    raw = font.get_packed_array("B", stride * count)
+    first, second = (field.name for field in fields(record_type))
+    columns = {
+        first: _byte_column(raw, stride, 0, 3, "I"),
+        second: _byte_column(raw, stride, 3, stride - 3, typecode),
+    }
+    return Columns(record_type, columns)
+
+
+def parse_map_groups(font: Font, count: int) -> MapGroups:
+    if font.columnar:
+        return parse_uint32_columns(font, MapGroup, count)
+    return tuple(parse_map_group(font) for _ in range(count))
+
+
 def parse_variation_selector(font: Font):
     return VariationSelector(
-        font.get_uint32(),
+        font.get_uint24(),
         font.get_offset32(),
         font.get_offset32(),
     )
@@ -205,6 +281,7 @@ def parse_cmap_subtable(
     font: Font, record: TableRecord, encoding: EncodingRecord
 ) -> cmapSubtable:
     offset = record.offset + encoding.subtableOffset
+    end = record.offset + record.length
     font.seek(offset)
     fmt = font.get_uint16()
     match fmt:
@@ -219,6 +296,7 @@ def parse_cmap_subtable(
             length = font.get_uint16()
             language = font.get_uint16()
             keys = font.get_uint16_array(256)
+            font.check_count(max(keys) // 8 + 1, 8, end)
             sub_headers = tuple(
                 cmapSubHeader(
                     font.get_uint16(),
@@ -229,7 +307,7 @@ def parse_cmap_subtable(
                 for _ in range(max(keys) // 8 + 1)
             )
             # TODO: Validate this is a safe method of getting length.
-            table_remainder = (record.offset + record.length) - font.pointer()
+            table_remainder = end - font.pointer()
             glyph_id_range = font.get_uint16_array(table_remainder // 2)
             return cmapSubtable_v2(
                 fmt,
@@ -244,6 +322,7 @@ def parse_cmap_subtable(
             language = font.get_uint16()
             seg_count_x2 = font.get_uint16()
             font.get_uint16_array(3)  # Skip search values and derive.
+            font.check_count(seg_count_x2 // 2, 8, end)
             search_range = 2 ** int(log2(seg_count_x2))
             entry_selector = int(log2(seg_count_x2 / 2.0))
             range_shift = seg_count_x2 - search_range
@@ -261,90 +340,104 @@ def parse_cmap_subtable(
                 font.get_uint16_array(seg_count_x2 // 2),
                 font.get_uint16_array(seg_count_x2 // 2),
                 font.get_uint16_array(seg_count_x2 // 2),
-                font.get_uint16_array((offset + length) - font.pointer()),
+                font.get_uint16_array(
+                    font.check_count(((offset + length) - font.pointer()) // 2, 2, end)
+                ),
             )
         case 6:
             length = font.get_uint16()
+            language = font.get_uint16()
+            first_code = font.get_uint16()
+            entry_count = font.check_count(font.get_uint16(), 2, end)
             return cmapSubtable_v6(
                 fmt,
                 length,
-                font.get_uint16(),
-                font.get_uint16(),
-                font.get_uint16(),
-                font.get_uint16_array(length),
+                language,
+                first_code,
+                entry_count,
+                font.get_uint16_array(entry_count),
             )
         case 8:
             length = font.get_uint16()
             language = font.get_uint16()
             is32 = font.get_uint8_array(8192)
-            count = font.get_uint32()
+            count = font.check_count(font.get_uint32(), 12, end)
             return cmapSubtable_v8(
                 fmt,
                 length,
                 language,
                 is32,
                 count,
-                tuple(parse_map_group(font) for _ in range(count)),
+                parse_map_groups(font, count),
             )
         case 10:
             reserved = font.get_uint16()
-            length = font.get_uint16()
+            length = font.get_uint32()
+            language = font.get_uint32()
+            start_char_code = font.get_uint32()
+            num_chars = font.check_count(font.get_uint32(), 2, end)
             return cmapSubtable_v10(
                 fmt,
                 reserved,
                 length,
-                font.get_uint32(),
-                font.get_uint32(),
-                font.get_uint32(),
-                font.get_uint16_array(length),
+                language,
+                start_char_code,
+                num_chars,
+                font.get_uint16_array(num_chars),
             )
         case 12:
             reserved = font.get_uint16()
             length = font.get_uint32()
             language = font.get_uint32()
-            count = font.get_uint32()
+            count = font.check_count(font.get_uint32(), 12, end)
             return cmapSubtable_v12(
                 fmt,
                 reserved,
                 length,
                 language,
                 count,
-                tuple(parse_map_group(font) for _ in range(count)),
+                parse_map_groups(font, count),
             )
         case 13:
             reserved = font.get_uint16()
             length = font.get_uint32()
-            count = font.get_uint32()
+            count = font.check_count(font.get_uint32(), 12, end)
             return cmapSubtable_v13(
                 fmt,
                 reserved,
                 length,
                 count,
-                tuple(parse_map_group(font) for _ in range(count)),
+                parse_map_groups(font, count),
             )
         case 14:
-            length = font.get_uint16()
-            count = font.get_uint32()
+            length = font.get_uint32()
+            count = font.check_count(font.get_uint32(), 11, end)
             selectors = tuple(parse_variation_selector(font) for _ in range(count))
             default = []
             non_default = []
             for selector in selectors:
                 if selector.defaultUVSOffset != 0:
                     font.seek(offset + selector.defaultUVSOffset)
-                    num = font.get_uint32()
-                    ranges = tuple(
-                        UnicodeValueRange(font.get_uint24(), font.get_uint8())
-                        for _ in range(num)
-                    )
+                    num = font.check_count(font.get_uint32(), 4, end)
+                    if font.columnar:
+                        ranges = parse_uint24_columns(font, UnicodeValueRange, "B", num)
+                    else:
+                        ranges = tuple(
+                            UnicodeValueRange(font.get_uint24(), font.get_uint8())
+                            for _ in range(num)
+                        )
                     default.append(DefaultUVS(num, ranges))
 
                 if selector.nonDefaultUVSOffset != 0:
                     font.seek(offset + selector.nonDefaultUVSOffset)
-                    num = font.get_uint32()
-                    mappings = tuple(
-                        UVSMapping(font.get_uint24(), font.get_uint16())
-                        for _ in range(num)
-                    )
+                    num = font.check_count(font.get_uint32(), 5, end)
+                    if font.columnar:
+                        mappings = parse_uint24_columns(font, UVSMapping, "H", num)
+                    else:
+                        mappings = tuple(
+                            UVSMapping(font.get_uint24(), font.get_uint16())
+                            for _ in range(num)
+                        )
                     non_default.append(NonDefaultUVS(num, mappings))
             return cmapSubtable_v14(
                 fmt, length, count, selectors, tuple(default), tuple(non_default)
@@ -355,7 +448,7 @@ def parse_cmap(font: Font, record: TableRecord) -> cmap:
     font.seek(record.offset)
 
     heaader_version = font.get_uint16()
-    num_tables = font.get_uint16()
+    num_tables = font.check_count(font.get_uint16(), 8, record.offset + record.length)
     header = cmapHeader(
         heaader_version,
         num_tables,
@@ -365,6 +458,8 @@ def parse_cmap(font: Font, record: TableRecord) -> cmap:
         ),
     )
 
+    # Encodings often share a subtable (i.e. unicode and windows BMP), these are
+    # parsed once and the same object is referenced by both.
     sub_table_offsets: dict[int, cmapSubtable] = {}
     sub_tables = []
     for encoding in header.encodingRecords:
@@ -375,13 +470,7 @@ def parse_cmap(font: Font, record: TableRecord) -> cmap:
         sub_tables.append(sub_table)
         sub_table_offsets[encoding.subtableOffset] = sub_table
 
-    return cmap(
-        header,
-        tuple(
-            parse_cmap_subtable(font, record, encoding)
-            for encoding in header.encodingRecords
-        ),
-    )
+    return cmap(header, tuple(sub_tables))
 
 
 def parse_COLR(font: Font, record: TableRecord) -> COLR: ...  # TODO: COLR
@@ -395,12 +484,12 @@ def parse_cvt(font: Font, record: TableRecord) -> cvt:
 
 
 def parse_SignatureBlock(
-    font: Font, offset: int, record: SignatureRecord
+    font: Font, offset: int, record: SignatureRecord, end: int
 ) -> SignatureBlock:
     font.seek(offset + record.signatureBlockOffset)
     if record.format == 1:
         r1, r2 = font.get_uint16(), font.get_uint16()
-        length = font.get_uint32()
+        length = font.check_count(font.get_uint32(), 1, end)
         signature = font.get_uint8_array(length)
         return SignatureBlock_fmt1(r1, r2, length, signature)
     raise ValueError(f"Invalid Signature Format ({record.format}).")
@@ -409,14 +498,20 @@ def parse_SignatureBlock(
 def parse_DSIG(font: Font, record: TableRecord) -> DSIG:
     font.seek(record.offset)
     version = font.get_uint32()
+    end = record.offset + record.length
     count = font.get_uint16()
     flags = font.get_uint16()
-    records = tuple(
-        SignatureRecord(font.get_uint32(), font.get_uint32(), font.get_offset32())
-        for _ in range(count)
-    )
+    font.check_count(count, 12, end)
+    if font.columnar:
+        records = parse_uint32_columns(font, SignatureRecord, count)
+    else:
+        records = tuple(
+            SignatureRecord(font.get_uint32(), font.get_uint32(), font.get_offset32())
+            for _ in range(count)
+        )
     blocks = tuple(
-        parse_SignatureBlock(font, record.offset, sig_record) for sig_record in records
+        parse_SignatureBlock(font, record.offset, sig_record, end)
+        for sig_record in records
     )
     return DSIG(version, count, flags, records, blocks)
 
@@ -432,35 +527,114 @@ def parse_fpgm(font: Font, record: TableRecord) -> fpgm: ...  # TODO: fpgm
 def parse_fvar(font: Font, record: TableRecord) -> fvar: ...  # TODO: fvar
 def parse_gasp(font: Font, record: TableRecord) -> gasp: ...  # TODO: gasp
 def parse_GDEF(font: Font, record: TableRecord) -> GDEF: ...  # TODO: GDEF
-def parse_glyf(font: Font, record: TableRecord) -> glyf: ...  # TODO: glyf
+def parse_simple_glyph_data(font: Font, number_of_contours: int) -> tuple:
+    end_points = font.get_uint16_array(number_of_contours)
+    instruction_length = font.get_uint16()
+    instructions = font.get_uint8_array(instruction_length)
+
+    # The coordinate arrays are sized by the flags, so walk them once to find the
+    # length of each. Repeated flags are followed by how many more times they apply.
+    point_count = end_points[-1] + 1 if end_points else 0
+    flags = []
+    x_size = y_size = 0
+    while point_count > 0:
+        flag = font.get_uint8()
+        flags.append(flag)
+        repeat = 1
+        if flag & SimpleGlyphFlags.REPEAT_FLAG:
+            count = font.get_uint8()
+            flags.append(count)
+            repeat += count
+
+        if flag & SimpleGlyphFlags.X_SHORT_VECTOR:
+            x_size += repeat
+        elif not flag & SimpleGlyphFlags.X_IS_SAME_OR_POSITIVE_X_SHORT_VECTOR:
+            x_size += 2 * repeat
+
+        if flag & SimpleGlyphFlags.Y_SHORT_VECTOR:
+            y_size += repeat
+        elif not flag & SimpleGlyphFlags.Y_IS_SAME_OR_POSITIVE_Y_SHORT_VECTOR:
+            y_size += 2 * repeat
+
+        point_count -= repeat
+
+    return (
+        end_points,
+        instruction_length,
+        instructions,
+        tuple(flags),
+        font.get_uint8_array(x_size),
+        font.get_uint8_array(y_size),
+    )
+
+
+def parse_CompositeGlyphDescription(font: Font) -> CompositeGlyphDescription:
+    flags = font.get_uint16()
+    glyph_index = font.get_uint16()
+
+    signed = flags & CompositeGlyphFlags.ARGS_ARE_XY_VALUES
+    if flags & CompositeGlyphFlags.ARG_1_AND_2_ARE_WORDS:
+        args = font.get_int16_array(2) if signed else font.get_uint16_array(2)
+    else:
+        args = font.get_int8_array(2) if signed else font.get_uint8_array(2)
+
+    if flags & CompositeGlyphFlags.WE_HAVE_A_SCALE:
+        scale = (font.get_F2DOT14(),)
+    elif flags & CompositeGlyphFlags.WE_HAVE_AN_X_AND_Y_SCALE:
+        x_scale, y_scale = font.get_F2DOT14_array(2)
+        scale = (x_scale, y_scale)
+    elif flags & CompositeGlyphFlags.WE_HAVE_A_TWO_BY_TWO:
+        x_scale, scale01, scale10, y_scale = font.get_F2DOT14_array(4)
+        scale = (x_scale, y_scale, scale01, scale10)
+    else:
+        scale = (1.0,)
+
+    return CompositeGlyphDescription(flags, glyph_index, *args, *scale)
+
+
+def parse_glyph(font: Font, length: int) -> glyfGlyph:
+    number_of_contours = font.get_int16()
+    bounds = font.get_int16_array(4)
+
+    if number_of_contours >= 0:
+        return SimpleGlyph(
+            number_of_contours,
+            *bounds,
+            *parse_simple_glyph_data(font, number_of_contours),
+        )
+
+    children = [parse_CompositeGlyphDescription(font)]
+    while children[-1].flags & CompositeGlyphFlags.MORE_COMPONENTS:
+        children.append(parse_CompositeGlyphDescription(font))
+
+    instruction_length = 0
+    if children[-1].flags & CompositeGlyphFlags.WE_HAVE_INSTRUCTIONS:
+        instruction_length = font.get_uint16()
+
+    return CompositeGlyph(
+        number_of_contours,
+        *bounds,
+        tuple(children),
+        instruction_length,
+        font.get_uint8_array(instruction_length),
+    )
+
+
+def parse_glyf(font: Font, record: TableRecord) -> glyf:
+    locations = font.get_table("loca").offsets
+    return glyf(font, record.offset, locations, parse_glyph)
+
+
 def parse_GPOS(font: Font, record: TableRecord) -> GPOS: ...  # TODO: GPOS
 def parse_GSUB(font: Font, record: TableRecord) -> GSUB: ...  # TODO: GSUB
 def parse_gvar(font: Font, record: TableRecord) -> gvar: ...  # TODO: gvar
 def parse_hdmx(font: Font, record: TableRecord) -> hdmx: ...  # TODO: hdmx
 
 
+# head and OS/2 are decoded lazily, most consumers only want one or two of their fields
 def parse_head(font: Font, record: TableRecord) -> head:
     font.seek(record.offset)
-    return head(
-        font.get_uint16(),
-        font.get_uint16(),
-        font.get_fixed(),
-        font.get_uint32(),
-        font.get_uint32(),
-        font.get_uint16(),
-        font.get_uint16(),
-        font.get_time(),
-        font.get_time(),
-        font.get_int16(),
-        font.get_int16(),
-        font.get_int16(),
-        font.get_int16(),
-        font.get_uint16(),
-        font.get_uint16(),
-        font.get_int16(),
-        font.get_int16(),
-        font.get_int16(),
-    )
+    return head.lazy(font.read(head.packed_size()))
 
 
 def parse_hhea(font: Font, record: TableRecord) -> hhea:
@@ -489,14 +663,20 @@ def parse_hmtx(font: Font, record: TableRecord) -> hmtx:
     number_of_metrics: int = font.get_table("hhea").numberOfHMetrics
 
     font.seek(record.offset)
-
-    metrics = tuple(
-        LongHorMetric(font.get_UFWORD(), font.get_FWORD())
-        for _ in range(number_of_metrics)
+    font.check_count(
+        number_of_metrics + max(num_glpyhs, number_of_metrics),
+        2,
+        record.offset + record.length,
     )
-    side_beaings = font.get_FWORD_array(num_glpyhs - number_of_metrics)
 
-    return hmtx(metrics, side_beaings)
+    # Both halves of each LongHorMetric are read in one go then split apart, the
+    # advances are reinterpreted as unsigned.
+    metrics = font.get_packed_array("h", 2 * number_of_metrics)
+    advances = array("H", metrics[::2].tobytes())
+    side_bearings = metrics[1::2]
+    side_bearings.extend(font.get_packed_array("h", num_glpyhs - number_of_metrics))
+
+    return hmtx(advances, side_bearings)
 
 
 def parse_HVAR(font: Font, record: TableRecord) -> HVAR: ...  # TODO: HVAR
@@ -505,7 +685,21 @@ def parse_just(font: Font, record: TableRecord) -> just: ...  # TODO: just
 def parse_kern(font: Font, record: TableRecord) -> kern: ...  # TODO: kern
 def parse_kerx(font: Font, record: TableRecord) -> kerx: ...  # TODO: kerx
 def parse_lcar(font: Font, record: TableRecord) -> lcar: ...  # TODO: lcar
-def parse_loca(font: Font, record: TableRecord) -> loca: ...  # TODO: loca
+
+
+def parse_loca(font: Font, record: TableRecord) -> loca:
+    num_glyphs: int = font.get_table("maxp").numGlyphs
+    long_offsets: bool = font.get_table("head").indexToLocFormat == 1
+
+    font.seek(record.offset)
+    size = 4 if long_offsets else 2
+    font.check_count(num_glyphs + 1, size, record.offset + record.length)
+    if long_offsets:
+        return loca(font.get_packed_array("I", num_glyphs + 1))
+    # short offsets are stored halved
+    return loca(array("I", [2 * o for o in font.get_uint16_array(num_glyphs + 1)]))
+
+
 def parse_ltag(font: Font, record: TableRecord) -> ltag: ...  # TODO: ltag
 def parse_LTSH(font: Font, record: TableRecord) -> LTSH: ...  # TODO: LTSH
 def parse_MATH(font: Font, record: TableRecord) -> MATH: ...  # TODO: MATH
@@ -515,7 +709,7 @@ def parse_maxp(font: Font, record: TableRecord) -> maxp:
     font.seek(record.offset)
     version = font.get_version_legacy()
 
-    if version == 0.5:
+    if version == (0, 5):
         return maxp_v05(version, font.get_uint16())
     return maxp_v10(
         version,
@@ -548,48 +742,21 @@ def parse_name(font: Font, record: TableRecord) -> name:
     version = font.get_uint16()
     count = font.get_uint16()
     offset = font.get_offset16()
-    records = tuple(
-        NameRecord(
-            font.get_uint16(),
-            font.get_uint16(),
-            font.get_uint16(),
-            font.get_uint16(),
-            font.get_uint16(),
-            font.get_offset16(),
-            "",
-        )
-        for _ in range(count)
-    )
+    # Every name record field is a uint16, so they're read in one go.
+    font.check_count(count, 12, record.offset + record.length)
+    fields = font.get_packed_array("H", 6 * count)
+    headers = tuple(zip(*(fields[idx::6] for idx in range(6))))
     lang_tag_count = 0 if version == 0 else font.get_uint16()
-    lang_tags = tuple(
-        LangTagRecord(font.get_uint16(), font.get_offset16(), "")
-        for _ in range(lang_tag_count)
+    font.check_count(lang_tag_count, 4, record.offset + record.length)
+    lang_tag_headers = tuple(
+        (font.get_uint16(), font.get_offset16()) for _ in range(lang_tag_count)
     )
 
-    data_location = record.offset + offset
-    font.seek(record.offset + offset)  # seek to data area for the name string data
-    for name_record in records:
-        font.seek(data_location + name_record.stringOffset)
-        b = font.read(name_record.length)
-        encoding = "UTF-16BE"
-        match name_record.platformID:
-            case Platform.MACINTOSH:
-                match name_record.encodingID:
-                    case MacintoshEncoding.ROMAN:
-                        encoding = "mac-roman"
-            case Platform.WINDOWS:
-                match name_record.encodingID:
-                    case WindowsEncoding.SHIFTJIS:
-                        encoding = "936"
-                    case WindowsEncoding.BIG5:
-                        encoding = "950"
-                    case WindowsEncoding.WANSUNG:
-                        encoding = "949"
-        name_record.string = b.decode(encoding)
-
-    for lang_tag in lang_tags:
-        font.seek(data_location + lang_tag.langTagOffset)
-        lang_tag.string = font.read(lang_tag.length).decode("UTF-16BE")
+    # The strings are left in the storage area and decoded when first used.
+    font.seek(record.offset + offset)
+    storage = font.read(max(record.length - offset, 0))
+    records = tuple(NameRecord(*header, storage) for header in headers)
+    lang_tags = tuple(LangTagRecord(*header, storage) for header in lang_tag_headers)
 
     if version == 0:
         return name_v0(version, count, offset, records)
@@ -602,185 +769,17 @@ def parse_opbd(font: Font, record: TableRecord) -> opbd: ...  # TODO: opbd
 def parse_OS2(font: Font, record: TableRecord) -> OS2:
     font.seek(record.offset)
     version = font.get_uint16()
-    xAvgCharWidth = font.get_FWORD()
-    usWeightClass = font.get_uint16()
-    usWidthClass = font.get_uint16()
-    fsType = font.get_uint16()
-    ySubscriptXSize = font.get_FWORD()
-    ysubscriptYSize = font.get_FWORD()
-    ySubscriptXOffset = font.get_FWORD()
-    ySubscriptYOffset = font.get_FWORD()
-    ySuperscriptXSize = font.get_FWORD()
-    ySuperscriptYSize = font.get_FWORD()
-    ySuperscriptXOffset = font.get_FWORD()
-    ySuperscriptYOffset = font.get_FWORD()
-    yStrikeoutSize = font.get_FWORD()
-    yStrickoutPosition = font.get_FWORD()
-    sFamilyClass = font.get_int16()
-    panose = font.get_int8_array(10)
-    ulUnicodeRange1 = font.get_uint32()
-    ulUnicodeRange2 = font.get_uint32()
-    ulUnicodeRange3 = font.get_uint32()
-    ulUnicodeRange4 = font.get_uint32()
-    achVendID = font.get_tag()
-    fsSelection = font.get_uint16()
-    usFirstCharIndex = font.get_uint16()
-    usLastCharIndex = font.get_uint16()
-    sTypoAscender = font.get_FWORD()
-    sTypoDescender = font.get_FWORD()
-    sTypeLineGap = font.get_FWORD()
-    usWinAscent = font.get_UFWORD()
-    usWinDescent = font.get_UFWORD()
-
     if version == 1:
-        return OS2_v1(
-            version,
-            xAvgCharWidth,
-            usWeightClass,
-            usWidthClass,
-            fsType,
-            ySubscriptXSize,
-            ysubscriptYSize,
-            ySubscriptXOffset,
-            ySubscriptYOffset,
-            ySuperscriptXSize,
-            ySuperscriptYSize,
-            ySuperscriptXOffset,
-            ySuperscriptYOffset,
-            yStrikeoutSize,
-            yStrickoutPosition,
-            sFamilyClass,
-            panose,
-            ulUnicodeRange1,
-            ulUnicodeRange2,
-            ulUnicodeRange3,
-            ulUnicodeRange4,
-            achVendID,
-            fsSelection,
-            usFirstCharIndex,
-            usLastCharIndex,
-            sTypoAscender,
-            sTypoDescender,
-            sTypeLineGap,
-            usWinAscent,
-            usWinDescent,
-            font.get_uint32(),
-            font.get_uint32(),
-        )
+        cls = OS2_v1
     elif version in {2, 3, 4}:
-        return OS2_v4(
-            version,
-            xAvgCharWidth,
-            usWeightClass,
-            usWidthClass,
-            fsType,
-            ySubscriptXSize,
-            ysubscriptYSize,
-            ySubscriptXOffset,
-            ySubscriptYOffset,
-            ySuperscriptXSize,
-            ySuperscriptYSize,
-            ySuperscriptXOffset,
-            ySuperscriptYOffset,
-            yStrikeoutSize,
-            yStrickoutPosition,
-            sFamilyClass,
-            panose,
-            ulUnicodeRange1,
-            ulUnicodeRange2,
-            ulUnicodeRange3,
-            ulUnicodeRange4,
-            achVendID,
-            fsSelection,
-            usFirstCharIndex,
-            usLastCharIndex,
-            sTypoAscender,
-            sTypoDescender,
-            sTypeLineGap,
-            usWinAscent,
-            usWinDescent,
-            font.get_uint32(),
-            font.get_uint32(),
-            font.get_FWORD(),
-            font.get_FWORD(),
-            font.get_uint16(),
-            font.get_uint16(),
-            font.get_uint16(),
-        )
+        cls = OS2_v4
     elif version == 5:
-        return OS2_v5(
-            version,
-            xAvgCharWidth,
-            usWeightClass,
-            usWidthClass,
-            fsType,
-            ySubscriptXSize,
-            ysubscriptYSize,
-            ySubscriptXOffset,
-            ySubscriptYOffset,
-            ySuperscriptXSize,
-            ySuperscriptYSize,
-            ySuperscriptXOffset,
-            ySuperscriptYOffset,
-            yStrikeoutSize,
-            yStrickoutPosition,
-            sFamilyClass,
-            panose,
-            ulUnicodeRange1,
-            ulUnicodeRange2,
-            ulUnicodeRange3,
-            ulUnicodeRange4,
-            achVendID,
-            fsSelection,
-            usFirstCharIndex,
-            usLastCharIndex,
-            sTypoAscender,
-            sTypoDescender,
-            sTypeLineGap,
-            usWinAscent,
-            usWinDescent,
-            font.get_uint32(),
-            font.get_uint32(),
-            font.get_FWORD(),
-            font.get_FWORD(),
-            font.get_uint16(),
-            font.get_uint16(),
-            font.get_uint16(),
-            font.get_uint16(),
-            font.get_uint16(),
-        )
-    return OS2_v0(
-        version,
-        xAvgCharWidth,
-        usWeightClass,
-        usWidthClass,
-        fsType,
-        ySubscriptXSize,
-        ysubscriptYSize,
-        ySubscriptXOffset,
-        ySubscriptYOffset,
-        ySuperscriptXSize,
-        ySuperscriptYSize,
-        ySuperscriptXOffset,
-        ySuperscriptYOffset,
-        yStrikeoutSize,
-        yStrickoutPosition,
-        sFamilyClass,
-        panose,
-        ulUnicodeRange1,
-        ulUnicodeRange2,
-        ulUnicodeRange3,
-        ulUnicodeRange4,
-        achVendID,
-        fsSelection,
-        usFirstCharIndex,
-        usLastCharIndex,
-        sTypoAscender,
-        sTypoDescender,
-        sTypeLineGap,
-        usWinAscent,
-        usWinDescent,
-    )
+        cls = OS2_v5
+    else:
+        cls = OS2_v0
+
+    font.seek(record.offset)
+    return cls.lazy(font.read(cls.packed_size()))
 
 
 def parse_PCLT(font: Font, record: TableRecord) -> PCLT:
@@ -818,7 +817,7 @@ def parse_post(font: Font, record: TableRecord) -> post:
     max_mem_type1 = font.get_uint32()
 
     if version == (2, 0):
-        count = font.get_uint16()
+        count = font.check_count(font.get_uint16(), 2, record.offset + record.length)
         glyph_name_index = font.get_uint16_array(count)
         return post_v2(
             version,
@@ -839,7 +838,7 @@ def parse_post(font: Font, record: TableRecord) -> post:
             ),
         )
     elif version == (2, 5):
-        count = font.get_uint16()
+        count = font.check_count(font.get_uint16(), 1, record.offset + record.length)
         offset = font.get_int8_array(count)
         return post_v25(
             version,
@@ -893,7 +892,7 @@ parsers: dict[str, ParseMethod] = {
     "bsln": parse_bsln,
     "CBDT": parse_CBDT,
     "CBLC": parse_CBLC,
-    "CFF": parse_CFF,
+    "CFF ": parse_CFF,
     "CFF2": parse_CFF2,
     "cmap": parse_cmap,
     "COLR": parse_COLR,
@@ -938,14 +937,14 @@ parsers: dict[str, ParseMethod] = {
     "MVAR": parse_MVAR,
     "name": parse_name,
     "opbd": parse_opbd,
-    "OS2": parse_OS2,
+    "OS/2": parse_OS2,
     "PCLT": parse_PCLT,
     "post": parse_post,
     "prep": parse_prep,
     "prop": parse_prop,
     "sbix": parse_sbix,
     "STAT": parse_STAT,
-    "SVG": parse_SVG,
+    "SVG ": parse_SVG,
     "trak": parse_trak,
     "VDMX": parse_VDMX,
     "vhea": parse_vhea,
@@ -956,4 +955,4 @@ parsers: dict[str, ParseMethod] = {
     "Zapf": parse_Zapf,
 }
 
-__all__ = ("ParseMethod", "parse_table_directory", "parsers")
+__all__ = ("ParseMethod", "parse_ttc_header", "parse_table_directory", "parsers")
@@ -0,0 +1,105 @@
+from __future__ import annotations
+from pathlib import Path
+from dataclasses import dataclass, replace
+from typing import BinaryIO
+from os import fstat
+
+from .font import FontCursor
+from .flags import fsSelectionFlags
+from .tables import TableRecord, head, maxp, name, OS2
+from .parsing import parsers, parse_table_directory
+
+__all__ = ("probe", "FontSummary")
+
+# The only tables probe reads, everything else in the font is never touched.
+PROBED_TABLES = ("head", "name", "OS/2", "maxp")
+
+
+@dataclass(frozen=True)
+class FontSummary:
+    path: Path
+    face: int
+    sfntVersion: int
+    tables: tuple[str, ...]
+    family: str | None
+    subfamily: str | None
+    fullName: str | None
+    postScriptName: str | None
+    fontRevision: float | None
+    unitsPerEm: int | None
+    numGlyphs: int | None
+    weight: int | None
+    width: int | None
+    fsSelection: int | None
+
+    @property
+    def italic(self) -> bool:
+        return bool((self.fsSelection or 0) & fsSelectionFlags.ITALIC)
+
+
+# Sizes come from the file, so they're checked against it before anything is read, an
+# unbuffered read allocates the whole size up front.
+def _read_at(fp: BinaryIO, offset: int, size: int, file_size: int) -> bytes:
+    if offset + size > file_size:
+        raise ValueError(f"{fp.name} ends before byte {offset + size}.")
+    fp.seek(offset)
+    data = fp.read(size)
+    if len(data) != size:
+        raise ValueError(f"{fp.name} ends before byte {offset + size}.")
+    return data
+
+
+# Identifies a font from its table directory and the head, name, OS/2 and maxp
+# tables, which are read on their own rather than reading (or mapping) the whole
+# file. face picks the font out of a collection and is ignored otherwise.
+def probe(path: Path, face: int = 0) -> FontSummary:
+    with open(path, "rb", buffering=0) as fp:
+        size = fstat(fp.fileno()).st_size
+        offset = 0
+        header = _read_at(fp, 0, 12, size)
+        if header[:4] == b"ttcf":
+            num_fonts = int.from_bytes(header[8:12])
+            if not 0 <= face < num_fonts:
+                raise IndexError(f"face {face} is not in the collection.")
+            # Only the offset of the face's table directory is read
+            offset = int.from_bytes(_read_at(fp, 12 + 4 * face, 4, size))
+            header = _read_at(fp, offset, 12, size)
+
+        num_tables = int.from_bytes(header[4:6])
+        data = header + _read_at(fp, offset + 12, 16 * num_tables, size)
+        directory = parse_table_directory(FontCursor(None, memoryview(data)))
+        records = {record.tableTag: record for record in directory.tableRecords}
+
+        # The probed tables are copied one after another into a small buffer, with
+        # their records moved to match, so the usual parsers can read them.
+        buffer = bytearray()
+        moved: dict[str, TableRecord] = {}
+        for tag in PROBED_TABLES:
+            if tag in records:
+                record = records[tag]
+                moved[tag] = replace(record, offset=len(buffer))
+                buffer += _read_at(fp, record.offset, record.length, size)
+
+    cursor = FontCursor(None, memoryview(bytes(buffer)))
+    tables = {tag: parsers[tag](cursor, record) for tag, record in moved.items()}
+
+    head_table: head | None = tables.get("head")
+    name_table: name | None = tables.get("name")
+    os2_table: OS2 | None = tables.get("OS/2")
+    maxp_table: maxp | None = tables.get("maxp")
+    return FontSummary(
+        Path(path),
+        face,
+        directory.sfntVersion,
+        tuple(records),
+        name_table and name_table.get_name(16, 1),
+        name_table and name_table.get_name(17, 2),
+        name_table and name_table.get_name(4),
+        name_table and name_table.get_name(6),
+        head_table and head_table.fontRevision,
+        head_table and head_table.unitsPerEm,
+        maxp_table and maxp_table.numGlyphs,
+        os2_table and os2_table.usWeightClass,
+        os2_table and os2_table.usWidthClass,
+        os2_table and os2_table.fsSelection,
+    )
@@ -1,5 +1,9 @@
+from typing import Iterable
+from array import array
+
 from fnt.types import (
     table,
+    record,
     uint8,
     int8,
     uint16,
@@ -17,7 +21,9 @@ from fnt.types import (
 )
 
 from .cmap import (
+    CodepointRanges,
     cmap,
+    Coverage,
     EncodingRecord,
     cmapHeader,
     cmapSubtable,
@@ -28,6 +34,7 @@ from .cmap import (
     cmapSubtable_v6,
     cmapSubtable_v10,
     MapGroup,
+    MapGroups,
     cmapSubtable_v8,
     cmapSubtable_v12,
     cmapSubtable_v13,
@@ -38,6 +45,18 @@ from .cmap import (
     NonDefaultUVS,
     cmapSubtable_v14,
 )
+from .columns import Columns
+from .lazy import LazyTable
+from .name import NameRecord, LangTagRecord, name_v0, name_v1, name
+
+from .glyf import (
+    SimpleGlyph,
+    GlyphOutline,
+    CompositeGlyphDescription,
+    CompositeGlyph,
+    glyfGlyph,
+    glyf,
+)
 
 # -- TOP LEVEL TABLES --
 
@@ -66,7 +85,7 @@ class TTCHeader_v2:
 type TTCHeader = TTCHeader_v1 | TTCHeader_v2
 
 
-@table
+@record(frozen=True)
 class TableRecord:
     tableTag: tag
     checksum: uint32
@@ -145,7 +164,7 @@ class ankr:
     glyphDataTable: tuple[ankr_glyph, ...]
 
 
-@table
+@record
 class AxisValueMap:
     fromCoordinate: F2DOT14
     toCoordinate: F2DOT14
@@ -230,7 +249,7 @@ class SignatureBlock_fmt1:
 type SignatureBlock = SignatureBlock_fmt1
 
 
-@table
+@record
 class SignatureRecord:
     format: uint32
     length: uint32
@@ -242,7 +261,7 @@ class DSIG:
     version: uint32
     numSignatures: uint16
     flags: uint16
-    signatureRecords: tuple[SignatureRecord, ...]
+    signatureRecords: tuple[SignatureRecord, ...] | Columns[SignatureRecord]
     signatureBlocks: tuple[SignatureBlock, ...]
 
 
@@ -283,7 +302,7 @@ class fpgm:
 class fvar: ...  # TODO: fvar
 
 
-@table
+@record
 class gaspRange:
     rangeMaxPPEM: uint16
     rangeGaspBehavior: uint16
@@ -300,64 +319,6 @@ class gasp:
 class GDEF: ...  # TODO: GDEF
 
 
-@table
-class SimpleGlyph:
-    numberOfContours: int16
-    xMin: int16
-    xMax: int16
-    yMin: int16
-    yMax: int16
-    endPtsOfContours: tuple[uint16, ...]
-    instructionLength: uint16
-    instructions: tuple[uint8, ...]
-    flags: tuple[uint8, ...]
-    xCoordinates: tuple[uint8 | int16, ...]
-    yCoordinates: tuple[uint8 | int16, ...]
-
-
-@table
-class CompositeGlyphDescription:
-    flags: uint16
-    glyphIndex: uint16
-    xOffset: uint8 | int8 | int16 | uint16
-    yOffset: uint8 | int8 | int16 | uint16
-    xScale: F2DOT14
-    yScale: F2DOT14 = None  # type: ignore
-    scale01: F2DOT14 = None  # type: ignore
-    scale10: F2DOT14 = None  # type: ignore
-
-    def __post_init__(self):
-        if self.yScale is None:
-            self.yScale = self.xScale
-
-        if self.scale01 is None or self.scale10 is None:
-            self.scale01 = self.scale10 = 1.0
-
-    @property
-    def transform(self) -> tuple[float, float, float, float]:
-        return self.xScale, self.scale01, self.scale10, self.yScale
-
-
-@table
-class CompositeGlyph:
-    numberOfContours: int16
-    xMin: int16
-    xMax: int16
-    yMin: int16
-    yMax: int16
-    children: tuple[CompositeGlyphDescription, ...]
-    instructionLength: uint16
-    instructions: tuple[uint8, ...]
-
-
-type glyfGlyph = SimpleGlyph | CompositeGlyph
-
-
-@table
-class glyf:
-    glyphs: tuple[glyfGlyph, ...]
-
-
 @table
 class GPOS: ...  # TODO: GPOS
 
@@ -375,7 +336,7 @@ class hdmx: ...  # TODO: hdmx
 
 
 @table
-class head:
+class head(LazyTable):
     majorVersion: uint16
     minorVersion: uint16
     fontRevision: fixed
@@ -415,16 +376,44 @@ class hhea:
     numberOfHMetrics: uint16
 
 
-@table
+@record
 class LongHorMetric:
     advanceWidth: UFWORD
     lsb: FWORD
 
 
+# Only numberOfHMetrics advances are stored, the last repeats for every glyph after
+# it. lsbs holds the left side bearing of every glyph.
 @table
 class hmtx:
-    hMetrics: tuple[LongHorMetric, ...]
-    leftSideBearings: tuple[FWORD, ...]
+    advanceWidths: array  # array('H')
+    lsbs: array  # array('h')
+
+    @property
+    def hMetrics(self) -> tuple[LongHorMetric, ...]:
+        return tuple(map(LongHorMetric, self.advanceWidths, self.lsbs))
+
+    @property
+    def leftSideBearings(self) -> tuple[FWORD, ...]:
+        return tuple(self.lsbs[len(self.advanceWidths) :])
+
+    # hMetrics as Columns over the advanceWidths and lsbs arrays
+    def metric_columns(self) -> Columns[LongHorMetric]:
+        lsbs = self.lsbs[: len(self.advanceWidths)]
+        return Columns(LongHorMetric, {"advanceWidth": self.advanceWidths, "lsb": lsbs})
+
+    def advance(self, glyph_id: int) -> UFWORD:
+        if glyph_id < len(self.advanceWidths):
+            return self.advanceWidths[glyph_id]
+        return self.advanceWidths[-1]
+
+    def lsb(self, glyph_id: int) -> FWORD:
+        return self.lsbs[glyph_id]
+
+    def advances(self, glyph_ids: Iterable[int]) -> array:
+        widths = self.advanceWidths
+        last = len(widths) - 1
+        return array("H", [widths[gid if gid < last else last] for gid in glyph_ids])
 
 
 @table
@@ -453,7 +442,7 @@ class lcar: ...  # TODO: lcar
 
 @table
 class loca:
-    offsets: tuple[offset16 | offset32, ...]
+    offsets: array  # array('I') of byte offsets into glyf, already doubled when short
 
 
 @table
@@ -516,51 +505,12 @@ class morx: ...  # TODO: morx
 class MVAR: ...  # TODO: MVAR
 
 
-@table
-class NameRecord:
-    platformID: uint16
-    encodingID: uint16
-    languageID: uint16
-    nameID: uint16
-    length: uint16
-    stringOffset: offset16
-    string: str
-
-
-@table
-class name_v0:
-    version: uint16
-    count: uint16
-    storageOffset: offset16
-    nameRecords: tuple[NameRecord, ...]
-
-
-@table
-class LangTagRecord:
-    length: uint16
-    langTagOffset: offset16
-    string: str
-
-
-@table
-class name_v1:
-    version: uint16
-    count: uint16
-    storageOffset: offset16
-    nameRecords: tuple[NameRecord, ...]
-    langTagCount: uint16
-    langTagRecords: tuple[LangTagRecord, ...]
-
-
-type name = name_v0 | name_v1
-
-
 @table
 class opbd: ...  # TODO: opbd
 
 
 @table
-class OS2_v0:
+class OS2_v0(LazyTable):
     version: uint16
     xAvgCharWidth: FWORD
     usWeightClass: uint16
@@ -686,7 +636,7 @@ class prop: ...  # TODO: prop
 class STAT: ...  # TODO: STAT
 
 
-@table
+@record
 class SVGDocumentRecord:
     startGlyphID: uint16
     endGlyphID: uint16
@@ -853,7 +803,11 @@ __all__ = (
     "TTCHeader_v2",
     "TableDirectory",
     "TableRecord",
+    "Columns",
+    "LazyTable",
+    "CodepointRanges",
     "cmap",
+    "Coverage",
     "EncodingRecord",
     "cmapHeader",
     "cmapSubtable",
@@ -864,6 +818,7 @@ __all__ = (
     "cmapSubtable_v6",
     "cmapSubtable_v10",
     "MapGroup",
+    "MapGroups",
     "cmapSubtable_v8",
     "cmapSubtable_v12",
     "cmapSubtable_v13",
@@ -879,6 +834,8 @@ __all__ = (
     "maxp",
     "maxp_v05",
     "maxp_v10",
+    "NameRecord",
+    "LangTagRecord",
     "name",
     "name_v0",
     "name_v1",
@@ -899,6 +856,7 @@ __all__ = (
     "glyf",
     "glyfGlyph",
     "SimpleGlyph",
+    "GlyphOutline",
     "CompositeGlyphDescription",
     "CompositeGlyph",
     "SVG",
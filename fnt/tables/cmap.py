@@ -1,11 +1,125 @@
-from typing import Literal
-
-from fnt.types import table, uint8, uint16, int16, uint24, uint32, offset32
-
-__all__ = ("cmapHeader", "cmapSubtable", "cmap")
-
-
+from typing import Literal, Callable, Iterable, Iterator
+from dataclasses import field
+from bisect import bisect_left, bisect_right
+from array import array
+
+from fnt.types import table, record, uint8, uint16, int16, uint24, uint32, offset32
+from fnt.flags import Platform, UnicodeEncoding, WindowsEncoding
+
+from .columns import Columns
+
+__all__ = ("cmapHeader", "cmapSubtable", "cmap", "Coverage")
+
+# Inclusive (first, last) codepoint ranges
+type CodepointRanges = tuple[tuple[int, int], ...]
+
+
+# The runs of codepoints within first..last which map to a glyph other than .notdef,
+# for the formats which can't tell without looking each codepoint up.
+def _mapped_runs(
+    lookup: Callable[[int], int], first: int, last: int
+) -> Iterator[tuple[int, int]]:
+    start = None
+    for codepoint in range(first, last + 1):
+        if lookup(codepoint):
+            if start is None:
+                start = codepoint
+        elif start is not None:
+            yield start, codepoint - 1
+            start = None
+    if start is not None:
+        yield start, last
+
+
+def _merge_ranges(ranges: Iterable[tuple[int, int]]) -> CodepointRanges:
+    merged: list[tuple[int, int]] = []
+    for first, last in sorted(ranges):
+        if merged and first <= merged[-1][1] + 1:
+            if last > merged[-1][1]:
+                merged[-1] = (merged[-1][0], last)
+        else:
+            merged.append((first, last))
+    return tuple(merged)
+
+
+# A set of codepoints as a little endian bitset, bit (codepoint & 7) of byte
+# (codepoint >> 3). Lookups index straight into the bytes, while set operations go
+# through python ints.
 @table
+class Coverage:
+    bits: bytes
+
+    @classmethod
+    def from_ranges(cls, ranges: Iterable[tuple[int, int]]) -> "Coverage":
+        ranges = tuple(ranges)
+        if not ranges:
+            return cls(b"")
+        bits = bytearray((max(last for _, last in ranges) >> 3) + 1)
+        for first, last in ranges:
+            head, tail = first >> 3, last >> 3
+            if head == tail:
+                bits[head] |= (0xFF << (first & 7)) & (0xFF >> (7 - (last & 7)))
+                continue
+            bits[head] |= (0xFF << (first & 7)) & 0xFF
+            bits[head + 1 : tail] = b"\xff" * (tail - head - 1)
+            bits[tail] |= 0xFF >> (7 - (last & 7))
+        return cls(bytes(bits))
+
+    @classmethod
+    def _from_int(cls, value: int) -> "Coverage":
+        return cls(value.to_bytes((value.bit_length() + 7) >> 3, "little"))
+
+    def __int__(self) -> int:
+        return int.from_bytes(self.bits, "little")
+
+    def __contains__(self, codepoint: int) -> bool:
+        idx = codepoint >> 3
+        return idx < len(self.bits) and bool(self.bits[idx] >> (codepoint & 7) & 1)
+
+    def __len__(self) -> int:
+        return int(self).bit_count()
+
+    def __and__(self, other: "Coverage") -> "Coverage":
+        return Coverage._from_int(int(self) & int(other))
+
+    def __or__(self, other: "Coverage") -> "Coverage":
+        return Coverage._from_int(int(self) | int(other))
+
+    def __sub__(self, other: "Coverage") -> "Coverage":
+        return Coverage._from_int(int(self) & ~int(other))
+
+    def covers(self, text: str) -> bool:
+        bits, size = self.bits, len(self.bits)
+        for codepoint in map(ord, set(text)):
+            idx = codepoint >> 3
+            if idx >= size or not bits[idx] >> (codepoint & 7) & 1:
+                return False
+        return True
+
+    def missing(self, text: str) -> str:
+        # Each character that isn't covered, once, in the order they appear.
+        return "".join(c for c in dict.fromkeys(text) if ord(c) not in self)
+
+    def ranges(self) -> CodepointRanges:
+        # Whole bytes which can't start or end a range are skipped.
+        ranges = []
+        start = None
+        for idx, byte in enumerate(self.bits):
+            if byte == (0 if start is None else 0xFF):
+                continue
+            for bit in range(8):
+                if byte >> bit & 1:
+                    if start is None:
+                        start = 8 * idx + bit
+                elif start is not None:
+                    ranges.append((start, 8 * idx + bit - 1))
+                    start = None
+        if start is not None:
+            ranges.append((start, 8 * len(self.bits) - 1))
+        return tuple(ranges)
+
+
+@record
 class EncodingRecord:
     platformID: uint16
     encodingID: uint16
@@ -27,8 +141,16 @@ class cmapSubtable_v0:
     language: uint16
     glyphIdArray: tuple[uint8, ...]  # 256 items always, but that's excessive to record
 
+    def lookup(self, codepoint: int) -> uint16:
+        if codepoint < len(self.glyphIdArray):
+            return self.glyphIdArray[codepoint]
+        return 0
 
-@table
+    def ranges(self) -> CodepointRanges:
+        return tuple(_mapped_runs(self.lookup, 0, len(self.glyphIdArray) - 1))
+
+
+@record
 class cmapSubHeader:
     firstCode: uint16
     entryCount: uint16
@@ -46,6 +168,37 @@ class cmapSubtable_v2:
     subHeaders: tuple[cmapSubHeader, ...]
     glyphIdArray: tuple[uint16, ...]
 
+    def lookup(self, codepoint: int) -> uint16:
+        # Single byte codes have a key of 0 and use the first sub header, any other
+        # key marks the first byte of a two byte code.
+        if codepoint < 0x100:
+            key, low = self.subHeaderKeys[codepoint] // 8, codepoint
+            if key:
+                return 0
+        elif codepoint < 0x10000:
+            key, low = self.subHeaderKeys[codepoint >> 8] // 8, codepoint & 0xFF
+            if not key:
+                return 0
+        else:
+            return 0
+
+        sub_header = self.subHeaders[key]
+        idx = low - sub_header.firstCode
+        if not 0 <= idx < sub_header.entryCount:
+            return 0
+
+        # idRangeOffset counts bytes from itself, so rebase it onto glyphIdArray which
+        # starts after the 6 byte header, 512 bytes of keys, and the 8 byte sub headers.
+        range_offset = 6 + 512 + 8 * key + 6 + sub_header.idRangeOffset
+        array_start = 6 + 512 + 8 * len(self.subHeaders)
+        idx += (range_offset - array_start) // 2
+        if not 0 <= idx < len(self.glyphIdArray) or not self.glyphIdArray[idx]:
+            return 0
+        return (self.glyphIdArray[idx] + sub_header.idDelta) & 0xFFFF
+
+    def ranges(self) -> CodepointRanges:
+        return tuple(_mapped_runs(self.lookup, 0, 0xFFFF))
+
 
 # Segment mapping to delta values
 @table
@@ -64,6 +217,44 @@ class cmapSubtable_v4:
     idRangeOffset: tuple[uint16, ...]
     glyphIdArray: tuple[uint16, ...]
 
+    def lookup(self, codepoint: int) -> uint16:
+        # endCode is sorted so the first segment ending at or after the codepoint is
+        # the only one that could contain it.
+        seg = bisect_left(self.endCode, codepoint)
+        if seg == len(self.endCode) or self.startCode[seg] > codepoint:
+            return 0
+
+        range_offset = self.idRangeOffset[seg]
+        if not range_offset:
+            return (codepoint + self.idDelta[seg]) & 0xFFFF
+
+        # idRangeOffset counts bytes from itself into glyphIdArray, which directly
+        # follows the idRangeOffset array.
+        idx = (
+            range_offset // 2
+            + (codepoint - self.startCode[seg])
+            - (len(self.idRangeOffset) - seg)
+        )
+        if not 0 <= idx < len(self.glyphIdArray) or not self.glyphIdArray[idx]:
+            return 0
+        return (self.glyphIdArray[idx] + self.idDelta[seg]) & 0xFFFF
+
+    def ranges(self) -> CodepointRanges:
+        ranges = []
+        for first, last, delta, range_offset in zip(
+            self.startCode, self.endCode, self.idDelta, self.idRangeOffset
+        ):
+            if range_offset:
+                ranges.extend(_mapped_runs(self.lookup, first, last))
+                continue
+            # Delta segments map every codepoint, except the one the delta wraps to 0.
+            notdef = -delta & 0xFFFF
+            if first < notdef:
+                ranges.append((first, min(last, notdef - 1)))
+            if notdef < last:
+                ranges.append((max(first, notdef + 1), last))
+        return tuple(ranges)
+
 
 # Trimmed table mapping
 @table
@@ -75,6 +266,16 @@ class cmapSubtable_v6:
     entryCount: uint16
     glyphIdArray: tuple[uint16, ...]
 
+    def lookup(self, codepoint: int) -> uint16:
+        idx = codepoint - self.firstCode
+        if 0 <= idx < len(self.glyphIdArray):
+            return self.glyphIdArray[idx]
+        return 0
+
+    def ranges(self) -> CodepointRanges:
+        last = self.firstCode + len(self.glyphIdArray) - 1
+        return tuple(_mapped_runs(self.lookup, self.firstCode, last))
+
 
 # Trimmed array
 @table
@@ -84,17 +285,75 @@ class cmapSubtable_v10:
     length: uint32
     language: uint32
     startCharCode: uint32
-    endCharCode: uint32
+    numChars: uint32
     glyphIdArray: tuple[uint16, ...]
 
+    def lookup(self, codepoint: int) -> uint16:
+        idx = codepoint - self.startCharCode
+        if 0 <= idx < len(self.glyphIdArray):
+            return self.glyphIdArray[idx]
+        return 0
 
-@table
+    def ranges(self) -> CodepointRanges:
+        last = self.startCharCode + len(self.glyphIdArray) - 1
+        return tuple(_mapped_runs(self.lookup, self.startCharCode, last))
+
+
+@record
 class MapGroup:
     startCharCode: uint32
     endCharCode: uint32
     startGlyphID: uint32
 
 
+# Columnar fonts keep their map groups as Columns
+type MapGroups = tuple[MapGroup, ...] | Columns[MapGroup]
+
+
+def _group_starts(groups: MapGroups) -> tuple[uint32, ...] | array:
+    if isinstance(groups, Columns):
+        return groups.startCharCode
+    return tuple(group.startCharCode for group in groups)
+
+
+def _group_rows(groups: MapGroups) -> Iterator[tuple[uint32, uint32, uint32]]:
+    if isinstance(groups, Columns):
+        return zip(groups.startCharCode, groups.endCharCode, groups.startGlyphID)
+    return ((g.startCharCode, g.endCharCode, g.startGlyphID) for g in groups)
+
+
+# Groups are sorted by startCharCode so the only candidate is the last group starting
+# at or before the codepoint. many_to_one is True for format 13 where every character
+# of a group maps to the same glyph.
+def _lookup_groups(
+    starts: tuple[uint32, ...] | array,
+    groups: MapGroups,
+    codepoint: int,
+    many_to_one: bool = False,
+) -> uint16:
+    idx = bisect_right(starts, codepoint) - 1
+    if idx < 0:
+        return 0
+    group = groups[idx]
+    if codepoint > group.endCharCode:
+        return 0
+    if many_to_one:
+        return group.startGlyphID
+    return group.startGlyphID + (codepoint - group.startCharCode)
+
+
+def _group_ranges(groups: MapGroups, many_to_one: bool = False):
+    ranges = []
+    for first, last, start_glyph_id in _group_rows(groups):
+        if start_glyph_id == 0:
+            if many_to_one:
+                continue
+            first += 1  # only the first character maps to .notdef
+        if first <= last:
+            ranges.append((first, last))
+    return tuple(ranges)
+
+
 # mixed 16-bit and 32-bit coverage
 @table
 class cmapSubtable_v8:
@@ -103,7 +362,18 @@ class cmapSubtable_v8:
     language: uint16
     is32: tuple[uint8, ...]  # Always 8192 items
     numGroups: uint32
-    groups: tuple[MapGroup, ...]
+    groups: MapGroups
+    _starts: tuple[uint32, ...] | array | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def lookup(self, codepoint: int) -> uint16:
+        if self._starts is None:
+            self._starts = _group_starts(self.groups)
+        return _lookup_groups(self._starts, self.groups, codepoint)
+
+    def ranges(self) -> CodepointRanges:
+        return _group_ranges(self.groups)
 
 
 # Segmented coverage
@@ -114,7 +384,18 @@ class cmapSubtable_v12:
     length: uint32
     language: uint32
     numGroups: uint32
-    groups: tuple[MapGroup, ...]
+    groups: MapGroups
+    _starts: tuple[uint32, ...] | array | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def lookup(self, codepoint: int) -> uint16:
+        if self._starts is None:
+            self._starts = _group_starts(self.groups)
+        return _lookup_groups(self._starts, self.groups, codepoint)
+
+    def ranges(self) -> CodepointRanges:
+        return _group_ranges(self.groups)
 
 
 # Many-to-one range mappings
@@ -124,17 +405,28 @@ class cmapSubtable_v13:
     reserved: uint16
     length: uint32
     numGroups: uint32
-    groups: tuple[MapGroup, ...]
+    groups: MapGroups
+    _starts: tuple[uint32, ...] | array | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
+    def lookup(self, codepoint: int) -> uint16:
+        if self._starts is None:
+            self._starts = _group_starts(self.groups)
+        return _lookup_groups(self._starts, self.groups, codepoint, True)
 
-@table
+    def ranges(self) -> CodepointRanges:
+        return _group_ranges(self.groups, True)
+
+
+@record
 class VariationSelector:
     varSelector: uint24
     defaultUVSOffset: offset32
     nonDefaultUVSOffset: offset32
 
 
-@table
+@record
 class UnicodeValueRange:
     startUnicodeValue: uint24
     additionalCount: uint8
@@ -143,10 +435,10 @@ class UnicodeValueRange:
 @table
 class DefaultUVS:
     numUnicodeValueRanges: uint32
-    ranges: tuple[UnicodeValueRange, ...]
+    ranges: tuple[UnicodeValueRange, ...] | Columns[UnicodeValueRange]
 
 
-@table
+@record
 class UVSMapping:
     unicodeValue: uint24
     glyphID: uint16
@@ -155,13 +447,13 @@ class UVSMapping:
 @table
 class NonDefaultUVS:
     numUVSMappings: uint32
-    uvsMappings: tuple[UVSMapping, ...]
+    uvsMappings: tuple[UVSMapping, ...] | Columns[UVSMapping]
 
 
 @table
 class cmapSubtable_v14:
     format: uint16
-    length: uint16
+    length: uint32
     numVarSelectorRecords: uint32
     varSelector: tuple[VariationSelector, ...]
     defaultUVS: tuple[DefaultUVS, ...]
@@ -181,7 +473,86 @@ type cmapSubtable = Literal[  # type: ignore
 ]
 
 
+# Most preferred first, full unicode repertoire before BMP only.
+UNICODE_SUBTABLE_PREFERENCE: tuple[tuple[uint16, uint16], ...] = (
+    (Platform.WINDOWS, WindowsEncoding.UNICODE_FULL),
+    (Platform.UNICODE, UnicodeEncoding.UNICODE_FULL),
+    (Platform.UNICODE, UnicodeEncoding.UNICODE2_FULL),
+    (Platform.WINDOWS, WindowsEncoding.UNICODE_BMP),
+    (Platform.UNICODE, UnicodeEncoding.UNICODE2_BMP),
+    (Platform.UNICODE, UnicodeEncoding.ISO_IEC),
+    (Platform.UNICODE, UnicodeEncoding.UNICODE11),
+    (Platform.UNICODE, UnicodeEncoding.UNICODE10),
+    (Platform.WINDOWS, WindowsEncoding.SYMBOL),
+)
+
+
 @table
 class cmap:
     header: cmapHeader
     subTables: tuple[cmapSubtable, ...]
+    _best: cmapSubtable | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _cache: dict[int, uint16] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _dense: array | None = field(default=None, init=False, repr=False, compare=False)
+    _coverage: Coverage | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def best_subtable(self) -> cmapSubtable | None:
+        if self._best is not None:
+            return self._best
+
+        # Format 14 only holds variation sequences so can never be used directly.
+        encodings = {
+            (record.platformID, record.encodingID): sub_table
+            for record, sub_table in zip(self.header.encodingRecords, self.subTables)
+            if sub_table is not None and sub_table.format != 14
+        }
+        for encoding in UNICODE_SUBTABLE_PREFERENCE:
+            if encoding in encodings:
+                self._best = encodings[encoding]
+                break
+        else:
+            self._best = next(iter(encodings.values()), None)
+        return self._best
+
+    def lookup(self, codepoint: int) -> uint16:
+        # Returns glyph 0 (.notdef) for unmapped characters.
+        dense = self._dense
+        if dense is not None and codepoint < len(dense):
+            return dense[codepoint]
+
+        glyph = self._cache.get(codepoint)
+        if glyph is None:
+            sub_table = self.best_subtable()
+            glyph = 0 if sub_table is None else sub_table.lookup(codepoint)
+            self._cache[codepoint] = glyph
+        return glyph
+
+    def lookup_many(self, text: str) -> tuple[uint16, ...]:
+        return tuple(map(self.lookup, map(ord, text)))
+
+    # Every codepoint the font maps to a glyph, as sorted non-overlapping ranges.
+    def ranges(self) -> CodepointRanges:
+        sub_table = self.best_subtable()
+        if sub_table is None:
+            return ()
+        return _merge_ranges(sub_table.ranges())
+
+    def coverage(self) -> Coverage:
+        if self._coverage is None:
+            self._coverage = Coverage.from_ranges(self.ranges())
+        return self._coverage
+
+    def build_dense(self, limit: int = 0x10000):
+        # Trade 4 bytes per codepoint below the limit for lookups which skip the
+        # subtable entirely. The BMP costs 256KB.
+        sub_table = self.best_subtable()
+        if sub_table is None:
+            self._dense = array("I")
+            return
+        self._dense = array("I", map(sub_table.lookup, range(limit)))
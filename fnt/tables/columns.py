@@ -0,0 +1,75 @@
+from typing import Any, Iterator, Sequence
+from array import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+__all__ = ("Columns",)
+
+
+# A tuple of records stored as one typed array per record field, which columnar fonts
+# use for the records they hold thousands of (cmap groups, variation mappings, DSIG
+# records). Each column is an attribute named after its field, rows are only built
+# when indexed or iterated so it can stand in for the tuple it replaces.
+class Columns[R](Sequence[R]):
+    __slots__ = ("_record", "_columns")
+
+    def __init__(self, record: type[R], columns: dict[str, array]):
+        self._record: type[R] = record
+        self._columns: dict[str, array] = columns  # in the record's field order
+
+    @property
+    def record(self) -> type[R]:
+        return self._record
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        return tuple(self._columns)
+
+    def column(self, name: str) -> array:
+        return self._columns[name]
+
+    def __getattr__(self, name: str) -> array:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self._columns[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    # The column as a numpy array sharing its memory, the column must not be resized
+    # while it's alive.
+    def numpy(self, name: str) -> "numpy.ndarray":
+        if numpy is None:
+            raise ImportError("Columns.numpy needs numpy to be installed.")
+        column = self._columns[name]
+        return numpy.frombuffer(column, dtype=column.typecode)
+
+    def __len__(self) -> int:
+        return len(next(iter(self._columns.values()), ()))
+
+    def __getitem__(self, idx: int | slice) -> R:
+        if isinstance(idx, slice):
+            columns = {name: column[idx] for name, column in self._columns.items()}
+            return Columns(self._record, columns)
+        return self._record(*(column[idx] for column in self._columns.values()))
+
+    def __iter__(self) -> Iterator[R]:
+        return map(self._record, *self._columns.values())
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Columns):
+            return self._record is other._record and self._columns == other._columns
+        if isinstance(other, tuple):
+            return tuple(self) == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"Columns[{self._record.__name__}]({len(self)} rows)"
+
+    def __reduce__(self):
+        return Columns, (self._record, self._columns)
@@ -0,0 +1,330 @@
+from typing import Callable, TYPE_CHECKING
+from dataclasses import field
+from functools import lru_cache
+from threading import Lock
+from itertools import accumulate
+from array import array
+
+from fnt.types import table, uint8, int8, uint16, int16, offset32, F2DOT14
+from fnt.flags import SimpleGlyphFlags, CompositeGlyphFlags
+from fnt.exceptions import (
+    CompositeGlyphCycleError,
+    CompositeGlyphDepthError,
+    CompositeGlyphPointError,
+)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+if TYPE_CHECKING:
+    from fnt.font import Font
+
+# numpy only pays for its call overhead on glyphs with a few hundred points, so
+# outlines smaller than this are decoded in python unless asked otherwise.
+VECTORIZE_POINTS = 256
+
+# Fonts rarely nest components more than a couple deep, anything past this is
+# treated as broken rather than followed.
+MAX_COMPONENT_DEPTH = 16
+
+IDENTITY = (1.0, 0.0, 0.0, 1.0)
+
+__all__ = (
+    "SimpleGlyph",
+    "GlyphOutline",
+    "CompositeGlyphDescription",
+    "CompositeGlyph",
+    "glyfGlyph",
+    "glyf",
+)
+
+
+# Points in absolute font units, onCurve holds 1 for on curve points and 0 for
+# off curve (quadratic control) points.
+@table
+class GlyphOutline:
+    endPtsOfContours: tuple[uint16, ...]
+    xCoordinates: array
+    yCoordinates: array
+    onCurve: array
+
+    def __len__(self) -> int:
+        return len(self.onCurve)
+
+
+EMPTY_OUTLINE = GlyphOutline((), array("i"), array("i"), array("B"))
+
+
+def _expand_flags(raw: tuple[uint8, ...], point_count: int) -> bytearray:
+    flags = bytearray()
+    values = iter(raw)
+    for flag in values:
+        if flag & SimpleGlyphFlags.REPEAT_FLAG:
+            flags += bytes((flag,)) * (next(values) + 1)
+        else:
+            flags.append(flag)
+    del flags[point_count:]
+    return flags
+
+
+def _decode_coordinates(
+    flags: bytearray, data: tuple[uint8, ...], short: int, same: int
+) -> array:
+    deltas = []
+    pos = 0
+    for flag in flags:
+        if flag & short:
+            delta = data[pos]
+            deltas.append(delta if flag & same else -delta)
+            pos += 1
+        elif flag & same:
+            deltas.append(0)
+        else:
+            delta = (data[pos] << 8) | data[pos + 1]
+            deltas.append(delta - 0x10000 if delta & 0x8000 else delta)
+            pos += 2
+    return array("i", accumulate(deltas))
+
+
+# Finds where every point's delta starts from the per point sizes, so all deltas
+# can be read and summed at once.
+def _decode_coordinates_numpy(
+    flags: "numpy.ndarray", data: tuple[uint8, ...], short: int, same: int
+) -> array:
+    is_short = (flags & short) != 0
+    is_same = (flags & same) != 0
+    sizes = numpy.where(is_short, 1, numpy.where(is_same, 0, 2))
+    starts = numpy.cumsum(sizes) - sizes
+
+    # padded so points without data at the end can still be indexed
+    raw = numpy.frombuffer(bytes(data) + b"\x00\x00", numpy.uint8).astype(numpy.int32)
+    high, low = raw[starts], raw[starts + 1]
+    words = ((high << 8) | low).astype(numpy.uint16).view(numpy.int16)
+
+    deltas = numpy.where(
+        is_short,
+        numpy.where(is_same, high, -high),
+        numpy.where(is_same, 0, words),
+    )
+    coordinates = numpy.cumsum(deltas, dtype=numpy.intc)
+    result = array("i")
+    result.frombytes(coordinates.tobytes())
+    return result
+
+
+# flags, xCoordinates and yCoordinates are the raw bytes as stored in the font.
+# The flags still contain their repeat counts, and the coordinates are a mix of
+# 8 and 16 bit deltas. Use outline() for the actual points.
+@table
+class SimpleGlyph:
+    numberOfContours: int16
+    xMin: int16
+    yMin: int16
+    xMax: int16
+    yMax: int16
+    endPtsOfContours: tuple[uint16, ...]
+    instructionLength: uint16
+    instructions: tuple[uint8, ...]
+    flags: tuple[uint8, ...]
+    xCoordinates: tuple[uint8, ...]
+    yCoordinates: tuple[uint8, ...]
+
+    def outline(self, vectorized: bool | None = None) -> GlyphOutline:
+        point_count = self.endPtsOfContours[-1] + 1 if self.endPtsOfContours else 0
+        if vectorized is None:
+            vectorized = numpy is not None and point_count >= VECTORIZE_POINTS
+        elif vectorized and numpy is None:
+            raise ImportError("numpy is required to decode glyphs vectorized")
+
+        flags = _expand_flags(self.flags, point_count)
+
+        if vectorized:
+            flags = numpy.frombuffer(flags, numpy.uint8)
+            decode = _decode_coordinates_numpy
+            on_curve = array("B", (flags & SimpleGlyphFlags.ON_CURVE_POINT).tobytes())
+        else:
+            decode = _decode_coordinates
+            on_curve = array(
+                "B", bytes(flag & SimpleGlyphFlags.ON_CURVE_POINT for flag in flags)
+            )
+
+        return GlyphOutline(
+            self.endPtsOfContours,
+            decode(
+                flags,
+                self.xCoordinates,
+                SimpleGlyphFlags.X_SHORT_VECTOR,
+                SimpleGlyphFlags.X_IS_SAME_OR_POSITIVE_X_SHORT_VECTOR,
+            ),
+            decode(
+                flags,
+                self.yCoordinates,
+                SimpleGlyphFlags.Y_SHORT_VECTOR,
+                SimpleGlyphFlags.Y_IS_SAME_OR_POSITIVE_Y_SHORT_VECTOR,
+            ),
+            on_curve,
+        )
+
+
+@table
+class CompositeGlyphDescription:
+    flags: uint16
+    glyphIndex: uint16
+    xOffset: uint8 | int8 | int16 | uint16
+    yOffset: uint8 | int8 | int16 | uint16
+    xScale: F2DOT14
+    yScale: F2DOT14 = None  # type: ignore
+    scale01: F2DOT14 = None  # type: ignore
+    scale10: F2DOT14 = None  # type: ignore
+
+    def __post_init__(self):
+        if self.yScale is None:
+            self.yScale = self.xScale
+
+        if self.scale01 is None or self.scale10 is None:
+            self.scale01 = self.scale10 = 0.0
+
+    @property
+    def transform(self) -> tuple[float, float, float, float]:
+        return self.xScale, self.scale01, self.scale10, self.yScale
+
+
+@table
+class CompositeGlyph:
+    numberOfContours: int16
+    xMin: int16
+    yMin: int16
+    xMax: int16
+    yMax: int16
+    children: tuple[CompositeGlyphDescription, ...]
+    instructionLength: uint16
+    instructions: tuple[uint8, ...]
+
+
+type glyfGlyph = SimpleGlyph | CompositeGlyph
+
+
+# Glyphs are only decoded when asked for, and the most recently used are kept. Each
+# decode reads through a fresh cursor so a glyf table can be shared between threads.
+@table
+class glyf:
+    font: "Font" = field(repr=False, compare=False)
+    offset: offset32
+    locations: array = field(repr=False)  # loca byte offsets, numGlyphs + 1 items
+    parseGlyph: Callable[["Font", int], glyfGlyph] = field(repr=False, compare=False)
+    cacheSize: int = 1024
+    _cached: Callable[[int], glyfGlyph | None] = field(
+        init=False, repr=False, compare=False
+    )
+    _outlines: dict[int, GlyphOutline] = field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+    _lock: Lock = field(init=False, repr=False, compare=False, default_factory=Lock)
+
+    def __post_init__(self):
+        self._cached = lru_cache(maxsize=self.cacheSize)(self._decode)
+
+    def _decode(self, glyph_id: int) -> glyfGlyph | None:
+        start = self.locations[glyph_id]
+        length = self.locations[glyph_id + 1] - start
+        if length <= 0:
+            return None  # Glyphs without an outline (i.e. space) have no data
+        return self.parseGlyph(self.font.cursor(self.offset + start), length)
+
+    def __len__(self) -> int:
+        return len(self.locations) - 1
+
+    def __getitem__(self, glyph_id: int) -> glyfGlyph | None:
+        return self.get(glyph_id)
+
+    def get(self, glyph_id: int) -> glyfGlyph | None:
+        if not 0 <= glyph_id < len(self.locations) - 1:
+            raise IndexError(f"glyph {glyph_id} is not in the font.")
+        return self._cached(glyph_id)
+
+    # The final outline of a glyph with every component resolved. Outlines are
+    # cached so base glyphs shared by many composites are only resolved once, the
+    # returned arrays are shared and should not be modified.
+    def flatten(self, glyph_id: int) -> GlyphOutline:
+        if not 0 <= glyph_id < len(self.locations) - 1:
+            raise IndexError(f"glyph {glyph_id} is not in the font.")
+        return self._flattened(glyph_id, ())
+
+    def _flattened(self, glyph_id: int, path: tuple[int, ...]) -> GlyphOutline:
+        outline = self._outlines.get(glyph_id)
+        if outline is not None:
+            return outline
+
+        outline = self._flatten(glyph_id, path)
+        with self._lock:
+            if len(self._outlines) >= self.cacheSize:
+                del self._outlines[next(iter(self._outlines))]
+            self._outlines[glyph_id] = outline
+        return outline
+
+    def _flatten(self, glyph_id: int, path: tuple[int, ...]) -> GlyphOutline:
+        if glyph_id in path:
+            raise CompositeGlyphCycleError(path + (glyph_id,))
+
+        glyph = self.get(glyph_id)
+        if glyph is None:
+            return EMPTY_OUTLINE
+        if isinstance(glyph, SimpleGlyph):
+            return glyph.outline()
+
+        if len(path) >= MAX_COMPONENT_DEPTH:
+            raise CompositeGlyphDepthError(path[0], MAX_COMPONENT_DEPTH)
+        path = path + (glyph_id,)
+
+        end_points: list[int] = []
+        x_coordinates: list[int | float] = []
+        y_coordinates: list[int | float] = []
+        on_curve = array("B")
+        typecode = "i"
+        for child in glyph.children:
+            outline = self._flattened(child.glyphIndex, path)
+            xs, ys = outline.xCoordinates, outline.yCoordinates
+            if outline.xCoordinates.typecode == "d":
+                typecode = "d"
+
+            a, b, c, d = transform = child.transform
+            if transform != IDENTITY:
+                typecode = "d"
+                xs, ys = (
+                    [a * x + c * y for x, y in zip(xs, ys)],
+                    [b * x + d * y for x, y in zip(xs, ys)],
+                )
+
+            if child.flags & CompositeGlyphFlags.ARGS_ARE_XY_VALUES:
+                dx, dy = child.xOffset, child.yOffset
+                if child.flags & CompositeGlyphFlags.SCALED_COMPONENT_OFFSET and not (
+                    child.flags & CompositeGlyphFlags.UNSCALED_COMPONENT_OFFSET
+                ):
+                    dx, dy = a * dx + c * dy, b * dx + d * dy
+            else:
+                # The offsets are point numbers, the child's point is moved onto
+                # the already placed parent point.
+                if not (
+                    0 <= child.xOffset < len(x_coordinates)
+                    and 0 <= child.yOffset < len(xs)
+                ):
+                    raise CompositeGlyphPointError(
+                        glyph_id, child.xOffset, child.yOffset
+                    )
+                dx = x_coordinates[child.xOffset] - xs[child.yOffset]
+                dy = y_coordinates[child.xOffset] - ys[child.yOffset]
+
+            start = len(on_curve)
+            end_points.extend(start + end for end in outline.endPtsOfContours)
+            x_coordinates.extend(x + dx for x in xs)
+            y_coordinates.extend(y + dy for y in ys)
+            on_curve.extend(outline.onCurve)
+
+        return GlyphOutline(
+            tuple(end_points),
+            array(typecode, x_coordinates),
+            array(typecode, y_coordinates),
+            on_curve,
+        )
@@ -0,0 +1,98 @@
+from dataclasses import fields
+from functools import cache
+from struct import Struct
+from typing import Any, Callable, Self, get_args
+
+from fnt.types import (
+    uint8,
+    int8,
+    uint16,
+    int16,
+    uint32,
+    int32,
+    UFWORD,
+    FWORD,
+    fixed,
+    F2DOT14,
+    LONGDATETIME,
+    tag,
+    tag_from_bytes,
+)
+
+__all__ = ("LazyTable",)
+
+# The struct code of each field type a lazy table can hold, and how to convert its
+# unpacked value (when it isn't used as is)
+_FIELD_CODES: dict[Any, tuple[str, Callable[[Any], Any] | None]] = {
+    uint8: ("B", None),
+    int8: ("b", None),
+    uint16: ("H", None),
+    int16: ("h", None),
+    uint32: ("I", None),
+    int32: ("i", None),
+    UFWORD: ("H", None),
+    FWORD: ("h", None),
+    fixed: ("i", lambda v: v / (1 << 16)),
+    F2DOT14: ("h", lambda v: v / (1 << 14)),
+    LONGDATETIME: ("q", None),
+    tag: ("4s", tag_from_bytes),
+}
+
+
+# A decoder for one field at offset, fixed length tuples of one type (like panose)
+# are unpacked whole.
+def _field_decoder(cls: type, name: str, typ: Any, offset: int):
+    items = get_args(typ)
+    if items and all(item is items[0] for item in items):
+        code, convert = _FIELD_CODES.get(items[0], (None, None))
+        if code is not None and convert is None:
+            fmt = Struct(f">{len(items)}{code}")
+            return fmt.size, lambda data: fmt.unpack_from(data, offset)
+
+    if typ not in _FIELD_CODES:
+        raise TypeError(f"{cls.__name__}.{name} can't be read lazily.")
+    code, convert = _FIELD_CODES[typ]
+    fmt = Struct(f">{code}")
+    if convert is None:
+        return fmt.size, lambda data: fmt.unpack_from(data, offset)[0]
+    return fmt.size, lambda data: convert(fmt.unpack_from(data, offset)[0])
+
+
+# Each field's decoder by name, and the packed size of the whole table. Built once per
+# class, so each version of a table (OS2_v0 ... OS2_v5) gets its own offsets.
+@cache
+def _layout(cls: type) -> tuple[dict[str, Callable[[bytes], Any]], int]:
+    decoders = {}
+    offset = 0
+    for field in fields(cls):
+        size, decoders[field.name] = _field_decoder(cls, field.name, field.type, offset)
+        offset += size
+    return decoders, offset
+
+
+# For fixed layout tables which consumers usually read one or two fields of (head,
+# OS/2). Tables made by lazy keep a copy of their bytes, and decode each field the
+# first time it's accessed. Decoded fields are stored on the table like any other,
+# so equality, repr and pickling are the same as a table made from all its values.
+class LazyTable:
+    @classmethod
+    def packed_size(cls) -> int:
+        return _layout(cls)[1]
+
+    @classmethod
+    def lazy(cls, data: bytes) -> Self:
+        if len(data) < _layout(cls)[1]:
+            raise ValueError(f"{cls.__name__} needs {_layout(cls)[1]} bytes.")
+        table = object.__new__(cls)
+        table._data = data
+        return table
+
+    def __getattr__(self, name: str) -> Any:
+        decoder = _layout(type(self))[0].get(name)
+        data = self.__dict__.get("_data")
+        if decoder is None or data is None:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        value = self.__dict__[name] = decoder(data)
+        return value
@@ -0,0 +1,141 @@
+from dataclasses import field
+
+from fnt.types import table, record, uint16, offset16
+from fnt.flags import Platform, MacintoshEncoding, ISOEncoding, WindowsEncoding
+
+__all__ = ("NameRecord", "LangTagRecord", "name_v0", "name_v1", "name")
+
+# Windows en-US, which is what almost every font has
+ENGLISH = 0x0409
+
+# Codecs for the (platformID, encodingID) pairs python can decode, anything else is
+# read as UTF-16BE. The Windows legacy encodings are stored as their own bytes.
+NAME_ENCODINGS: dict[tuple[uint16, uint16], str] = {
+    (Platform.MACINTOSH, MacintoshEncoding.ROMAN): "mac-roman",
+    (Platform.MACINTOSH, MacintoshEncoding.JAPANESE): "shift_jis",
+    (Platform.MACINTOSH, MacintoshEncoding.CHINESE_TRADITIONAL): "big5",
+    (Platform.MACINTOSH, MacintoshEncoding.KOREAN): "euc_kr",
+    (Platform.MACINTOSH, MacintoshEncoding.GREEK): "mac-greek",
+    (Platform.MACINTOSH, MacintoshEncoding.RUSSIAN): "mac-cyrillic",
+    (Platform.MACINTOSH, MacintoshEncoding.CHINESE_SIMPLIFIED): "gb2312",
+    (Platform.ISO, ISOEncoding.ASCII): "ascii",
+    (Platform.ISO, ISOEncoding.ISO_8859_1): "latin-1",
+    (Platform.WINDOWS, WindowsEncoding.SHIFTJIS): "cp932",
+    (Platform.WINDOWS, WindowsEncoding.PRC): "cp936",
+    (Platform.WINDOWS, WindowsEncoding.BIG5): "cp950",
+    (Platform.WINDOWS, WindowsEncoding.WANSUNG): "cp949",
+    (Platform.WINDOWS, WindowsEncoding.JOHAB): "johab",
+}
+
+type NameKey = tuple[uint16, uint16, uint16, uint16]
+
+
+def _decode_name(data: bytes, platform_id: uint16, encoding_id: uint16) -> str:
+    encoding = NAME_ENCODINGS.get((platform_id, encoding_id), "utf-16-be")
+    if encoding != "utf-16-be":
+        data = data.replace(b"\x00", b"")  # some fonts pad legacy strings to 16 bits
+    return data.decode(encoding, errors="replace")
+
+
+# The string is only decoded the first time it's asked for, storage is the name
+# table's whole string storage area which every record shares.
+@record
+class NameRecord:
+    platformID: uint16
+    encodingID: uint16
+    languageID: uint16
+    nameID: uint16
+    length: uint16
+    stringOffset: offset16
+    storage: bytes = field(repr=False)
+    _string: str | None = field(init=False, repr=False, compare=False, default=None)
+
+    @property
+    def key(self) -> NameKey:
+        return self.platformID, self.encodingID, self.languageID, self.nameID
+
+    @property
+    def string(self) -> str:
+        if self._string is None:
+            data = self.storage[self.stringOffset : self.stringOffset + self.length]
+            self._string = _decode_name(data, self.platformID, self.encodingID)
+        return self._string
+
+
+@record
+class LangTagRecord:
+    length: uint16
+    langTagOffset: offset16
+    storage: bytes = field(repr=False)
+
+    @property
+    def string(self) -> str:
+        data = self.storage[self.langTagOffset : self.langTagOffset + self.length]
+        return data.decode("utf-16-be", errors="replace")
+
+
+# Shared lookups of both name table versions. The records are indexed by their
+# (platformID, encodingID, languageID, nameID) key on first use.
+class _NameLookup:
+    nameRecords: tuple[NameRecord, ...]
+
+    @property
+    def records(self) -> dict[NameKey, NameRecord]:
+        try:
+            return self._records
+        except AttributeError:
+            self._records = {record.key: record for record in self.nameRecords}
+            return self._records
+
+    def get(
+        self, platformID: uint16, encodingID: uint16, languageID: uint16, nameID: uint16
+    ) -> NameRecord | None:
+        return self.records.get((platformID, encodingID, languageID, nameID))
+
+    # The string for the first of nameIDs the table has (i.e. typographic family 16,
+    # then family 1) in the Windows language lang. Each nameID falls back to Windows
+    # English, then Mac Roman English, then to any Windows string, then to whatever
+    # there is. Only the string which is returned gets decoded.
+    def get_name(self, *nameIDs: uint16, lang: uint16 = ENGLISH) -> str | None:
+        for nameID in nameIDs:
+            string = self._find_name(nameID, lang)
+            if string is not None:
+                return string
+        return None
+
+    def _find_name(self, nameID: uint16, lang: uint16) -> str | None:
+        for language in dict.fromkeys((lang, ENGLISH)):
+            for encoding in (WindowsEncoding.UNICODE_BMP, WindowsEncoding.UNICODE_FULL):
+                record = self.get(Platform.WINDOWS, encoding, language, nameID)
+                if record is not None:
+                    return record.string
+        record = self.get(Platform.MACINTOSH, MacintoshEncoding.ROMAN, 0, nameID)
+        if record is not None:
+            return record.string
+
+        candidates = [r for r in self.nameRecords if r.nameID == nameID]
+        for record in candidates:
+            if record.platformID == Platform.WINDOWS:
+                return record.string
+        return candidates[0].string if candidates else None
+
+
+@table
+class name_v0(_NameLookup):
+    version: uint16
+    count: uint16
+    storageOffset: offset16
+    nameRecords: tuple[NameRecord, ...]
+
+
+@table
+class name_v1(_NameLookup):
+    version: uint16
+    count: uint16
+    storageOffset: offset16
+    nameRecords: tuple[NameRecord, ...]
+    langTagCount: uint16
+    langTagRecords: tuple[LangTagRecord, ...]
+
+
+type name = name_v0 | name_v1
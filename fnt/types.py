@@ -60,6 +60,7 @@ __all__ = (
     "version16dot16_from_bytes",
     "version16dot16_to_bytes",
     "table",
+    "record",
 )
 
 # types
@@ -252,3 +253,11 @@ def version16dot16_to_bytes(v: version16dot16) -> bytes:
 
 
 table = dataclass
+
+
+# For the small records a font can hold tens of thousands of (map groups, metrics, name
+# records), which are slotted so they don't each carry a __dict__. Frozen records are
+# hashable but take around three times as long to create.
+def record(cls: type | None = None, /, *, frozen: bool = False):
+    wrap = dataclass(slots=True, frozen=frozen)
+    return wrap if cls is None else wrap(cls)
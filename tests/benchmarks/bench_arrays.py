@@ -0,0 +1,68 @@
+"""
+Compares the struct backed Font.get_*_array readers against the previous
+per-item int.from_bytes decoding using the cmap and hmtx tables of the test fonts.
+
+run with: python -m tests.benchmarks.bench_arrays
+"""
+
+from pathlib import Path
+from timeit import timeit
+
+from fnt import FileFont
+from fnt.types import uint16_from_bytes, int16_from_bytes, uint32_from_bytes
+
+FONTS = Path(__file__).parent.parent / "fonts"
+NUMBER = 200
+
+
+def per_item_uint16(b: bytes, count: int):
+    return tuple(uint16_from_bytes(b[2 * i : 2 * i + 2]) for i in range(count))
+
+
+def per_item_int16(b: bytes, count: int):
+    return tuple(int16_from_bytes(b[2 * i : 2 * i + 2]) for i in range(count))
+
+
+def per_item_uint32(b: bytes, count: int):
+    return tuple(uint32_from_bytes(b[4 * i : 4 * i + 4]) for i in range(count))
+
+
+def bench_font(path: Path):
+    font = FileFont.from_file(path)
+    for name in ("cmap", "hmtx"):
+        record = font.get_record(name)
+        count16 = record.length // 2
+        count32 = record.length // 4
+
+        font.seek(record.offset)
+        b = font.read(record.length)
+
+        cases = (
+            ("uint16", per_item_uint16, font.get_uint16_array, count16),
+            ("int16", per_item_int16, font.get_int16_array, count16),
+            ("uint32", per_item_uint32, font.get_uint32_array, count32),
+        )
+        for typ, old, new, count in cases:
+
+            def run_new():
+                font.seek(record.offset)
+                return new(count)
+
+            assert old(b, count) == run_new()
+            t_old = timeit(lambda: old(b, count), number=NUMBER)
+            t_new = timeit(run_new, number=NUMBER)
+            print(
+                f"{path.name:<28}{name:<6}{typ:<8}{count:>7} items "
+                f"per-item {1e6 * t_old / NUMBER:9.1f}us  "
+                f"struct {1e6 * t_new / NUMBER:9.1f}us  "
+                f"x{t_old / t_new:5.1f}"
+            )
+
+
+def main():
+    for path in sorted(FONTS.glob("*.[ot]tf")):
+        bench_font(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Times opening every test font and parsing its common tables, without a cache, while
+filling a cache, and loading from the filled cache.
+
+run with: python -m tests.benchmarks.bench_cache
+"""
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from fnt import FileFont, TableCache
+
+FONTS = Path(__file__).parent.parent / "fonts"
+TABLES = ("cmap", "head", "hhea", "hmtx", "maxp", "post", "OS/2", "name")
+ROUNDS = 20
+
+
+def open_all(cache: TableCache | None) -> float:
+    start = perf_counter()
+    for path in sorted(FONTS.glob("*.[ot]tf")):
+        with FileFont.from_file(path, cache=cache) as font:
+            for name in TABLES:
+                if font.has_table(name):
+                    try:
+                        font.get_table(name)
+                    except Exception:
+                        pass  # tables pyfont can't parse yet are left out of both runs
+    return perf_counter() - start
+
+
+def main():
+    with TemporaryDirectory() as directory:
+        cache = TableCache(Path(directory))
+        t_fill = open_all(cache)
+        t_cold = min(open_all(None) for _ in range(ROUNDS))
+        t_warm = min(open_all(cache) for _ in range(ROUNDS))
+
+    print(f"no cache {1e3 * t_cold:8.2f}ms")
+    print(f"filling  {1e3 * t_fill:8.2f}ms")
+    print(f"cached   {1e3 * t_warm:8.2f}ms  x{t_cold / t_warm:5.2f}")
+
+
+if __name__ == "__main__":
+    main()
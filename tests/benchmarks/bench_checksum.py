@@ -0,0 +1,61 @@
+"""
+Times FileFont.verify on the test fonts, on one thread and on a pool, against summing
+each table a word at a time with struct, and checksum on a few MiB of data with and
+without numpy.
+
+run with: python -m tests.benchmarks.bench_checksum
+"""
+
+from pathlib import Path
+from struct import unpack_from
+from timeit import timeit
+from os import urandom
+
+from fnt import FileFont
+import fnt.checksum
+from fnt.checksum import checksum
+
+FONTS = Path(__file__).parent.parent / "fonts"
+NUMBER = 20
+
+
+def checksum_words(data: bytes) -> int:
+    data = data + b"\x00" * (-len(data) % 4)
+    total = 0
+    for idx in range(0, len(data), 4):
+        total += unpack_from(">I", data, idx)[0]
+    return total & 0xFFFFFFFF
+
+
+def verify_words(font: FileFont):
+    return [
+        checksum_words(font.read_at(record.offset, record.length))
+        for record in font.get_table("directory").tableRecords
+    ]
+
+
+def main():
+    for path in sorted(FONTS.glob("*.[ot]tf")):
+        font = FileFont.from_file(path)
+        t_words = timeit(lambda: verify_words(font), number=NUMBER)
+        t_serial = timeit(lambda: font.verify(workers=1), number=NUMBER)
+        t_pool = timeit(lambda: font.verify(workers=4), number=NUMBER)
+        print(
+            f"{path.name:<28}words {1e3 * t_words / NUMBER:8.2f}ms  "
+            f"verify {1e3 * t_serial / NUMBER:6.2f}ms  "
+            f"pool {1e3 * t_pool / NUMBER:6.2f}ms"
+        )
+
+    data = urandom(8 << 20)
+    t_numpy = timeit(lambda: checksum(data), number=NUMBER)
+    numpy, fnt.checksum.numpy = fnt.checksum.numpy, None
+    t_array = timeit(lambda: checksum(data), number=NUMBER)
+    fnt.checksum.numpy = numpy
+    print(
+        f"8MiB checksum  array {1e3 * t_array / NUMBER:6.2f}ms  "
+        f"numpy {1e3 * t_numpy / NUMBER:6.2f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Times parse_cmap on the test fonts against parsing every encoding record's subtable,
+which is what parse_cmap used to do. Fonts with several encodings pointing at the same
+subtable should show the largest gap.
+
+run with: python -m tests.benchmarks.bench_cmap
+"""
+
+from pathlib import Path
+from timeit import timeit
+
+from fnt import FileFont
+from fnt.parsing import parse_cmap, parse_cmap_subtable
+
+FONTS = Path(__file__).parent.parent / "fonts"
+NUMBER = 50
+
+
+# Leaves out reading the cmap header, so slightly favours the old behaviour.
+def parse_every_subtable(font: FileFont):
+    record = font.get_record("cmap")
+    return tuple(
+        parse_cmap_subtable(font, record, encoding)
+        for encoding in font.get_table("cmap").header.encodingRecords
+    )
+
+
+def bench_font(path: Path):
+    font = FileFont.from_file(path)
+    record = font.get_record("cmap")
+    encodings = font.get_table("cmap").header.encodingRecords
+    unique = len({encoding.subtableOffset for encoding in encodings})
+
+    t_dedup = timeit(lambda: parse_cmap(font, record), number=NUMBER)
+    t_every = timeit(lambda: parse_every_subtable(font), number=NUMBER)
+    print(
+        f"{path.name:<28}{len(encodings):>2} encodings {unique:>2} subtables  "
+        f"every {1e3 * t_every / NUMBER:8.2f}ms  "
+        f"dedup {1e3 * t_dedup / NUMBER:8.2f}ms  "
+        f"x{t_every / t_dedup:5.2f}"
+    )
+
+
+def main():
+    for path in sorted(FONTS.glob("*.[ot]tf")):
+        bench_font(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Times checking which test fonts cover a string through the coverage bitsets against
+looking every character up in each cmap, and intersecting every font's coverage.
+
+run with: python -m tests.benchmarks.bench_coverage
+"""
+
+from functools import reduce
+from operator import and_
+from pathlib import Path
+from timeit import timeit
+
+from fnt import FileFont
+from fnt.tables import Coverage
+
+FONTS = Path(__file__).parent.parent / "fonts"
+TEXT = "The quick brown fox jumps over the lazy dog, 0123456789 ☺♥♦♣♠•◘○"
+NUMBER = 1000
+
+
+def main():
+    cmaps = [
+        FileFont.from_file(path).get_table("cmap") for path in FONTS.glob("*.[ot]tf")
+    ]
+    t_build = timeit(
+        lambda: [Coverage.from_ranges(cmap.ranges()) for cmap in cmaps], number=10
+    )
+    coverages = [cmap.coverage() for cmap in cmaps]
+
+    t_lookup = timeit(
+        lambda: [all(cmap.lookup(ord(c)) for c in TEXT) for cmap in cmaps],
+        number=NUMBER,
+    )
+    t_covers = timeit(lambda: [cov.covers(TEXT) for cov in coverages], number=NUMBER)
+    t_and = timeit(lambda: reduce(and_, coverages), number=NUMBER)
+
+    print(f"{len(cmaps)} fonts, build coverage {1e3 * t_build / 10:.2f}ms")
+    print(
+        f"lookup {1e6 * t_lookup / NUMBER:8.2f}us  "
+        f"covers {1e6 * t_covers / NUMBER:8.2f}us"
+    )
+    print(f"intersect all {1e6 * t_and / NUMBER:8.2f}us")
+
+
+if __name__ == "__main__":
+    main()
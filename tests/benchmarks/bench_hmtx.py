@@ -0,0 +1,73 @@
+"""
+Compares the memory and lookup speed of the array backed hmtx against the tuple of
+LongHorMetric it replaced, on a made up 60k glyph font.
+
+run with: python -m tests.benchmarks.bench_hmtx
+"""
+
+from random import randrange
+from struct import pack
+from timeit import timeit
+from types import SimpleNamespace
+import tracemalloc
+
+from fnt import Font, FontCursor
+from fnt.parsing import parsers
+from fnt.tables import LongHorMetric, TableRecord
+
+GLYPHS = 60_000
+NUMBER = 20
+
+
+# parse_hmtx only needs maxp and hhea from the font it belongs to, the rest (like
+# charging the memory budget) is left to Font
+class MetricsFont(Font):
+    def __init__(self, glyphs: int):
+        self.tables = {
+            "maxp": SimpleNamespace(numGlyphs=glyphs),
+            "hhea": SimpleNamespace(numberOfHMetrics=glyphs),
+        }
+
+    def get_table(self, name: str):
+        return self.tables[name]
+
+
+def measure(build):
+    tracemalloc.start()
+    value = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, size
+
+
+def main():
+    values = [v for _ in range(GLYPHS) for v in (randrange(2000), randrange(-200, 200))]
+    data = memoryview(pack(f">{2 * GLYPHS}h", *values))
+    record = TableRecord("hmtx", 0, 0, len(data))
+
+    def parse():
+        return parsers["hmtx"](FontCursor(MetricsFont(GLYPHS), data), record)
+
+    hmtx, new_size = measure(parse)
+    old, old_size = measure(
+        lambda: tuple(
+            LongHorMetric(values[i] & 0xFFFF, values[i + 1])
+            for i in range(0, len(values), 2)
+        )
+    )
+
+    glyph_ids = [randrange(GLYPHS) for _ in range(10_000)]
+    t_old = timeit(lambda: [old[gid].advanceWidth for gid in glyph_ids], number=NUMBER)
+    t_new = timeit(lambda: hmtx.advances(glyph_ids), number=NUMBER)
+    t_parse = timeit(parse, number=NUMBER)
+
+    print(f"{GLYPHS} glyphs, parse {1e3 * t_parse / NUMBER:.2f}ms")
+    print(f"tuple {old_size / 1024:10.1f}KiB  array {new_size / 1024:8.1f}KiB")
+    print(
+        f"10k advances  tuple {1e3 * t_old / NUMBER:6.2f}ms  "
+        f"array {1e3 * t_new / NUMBER:6.2f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Times parsing head and OS/2 then reading one field of each (unitsPerEm, usWeightClass),
+as a font index would, with the lazy tables against reading every field up front like
+the parsers did before, using the test fonts.
+
+run with: python -m tests.benchmarks.bench_lazy
+"""
+
+from dataclasses import fields
+from pathlib import Path
+from timeit import timeit
+from typing import get_args
+
+from fnt import FileFont, Font
+from fnt.parsing import parsers
+from fnt.tables import TableRecord
+
+FONTS = Path(__file__).parent.parent / "fonts"
+NUMBER = 2_000
+
+
+# How head and OS/2 were parsed before, one font.get_* call per field
+def read_every_field(font: Font, record: TableRecord, cls: type):
+    font.seek(record.offset)
+    values = []
+    for field in fields(cls):
+        if get_args(field.type):  # panose
+            values.append(font.get_int8_array(10))
+        elif field.type.__name__ == "LONGDATETIME":
+            values.append(font.get_time())
+        else:
+            values.append(getattr(font, f"get_{field.type.__name__}")())
+    return cls(*values)
+
+
+def main():
+    fonts = []
+    for path in sorted(FONTS.glob("*.[ot]tf")):
+        font = FileFont.from_file(path)
+        if font.has_table("head") and font.has_table("OS/2"):
+            fonts.append(font)
+    jobs = [
+        (font, font.get_record(tag), tag, field)
+        for font in fonts
+        for tag, field in (("head", "unitsPerEm"), ("OS/2", "usWeightClass"))
+    ]
+    classes = [type(parsers[tag](font, record)) for font, record, tag, _ in jobs]
+
+    def lazy():
+        for font, record, tag, field in jobs:
+            getattr(parsers[tag](font, record), field)
+
+    def eager():
+        for (font, record, _, field), cls in zip(jobs, classes):
+            getattr(read_every_field(font, record, cls), field)
+
+    for font, record, tag, field in jobs:
+        table = parsers[tag](font, record)
+        assert read_every_field(font, record, type(table)) == table
+
+    t_lazy = timeit(lazy, number=NUMBER) / (NUMBER * len(fonts))
+    t_eager = timeit(eager, number=NUMBER) / (NUMBER * len(fonts))
+    print(f"head + OS/2, one field each, {len(fonts)} fonts")
+    print(f"every field {1e6 * t_eager:7.2f}us per font")
+    print(f"lazy        {1e6 * t_lazy:7.2f}us per font  x{t_eager / t_lazy:.1f}")
+
+
+if __name__ == "__main__":
+    main()
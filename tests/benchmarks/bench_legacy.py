@@ -0,0 +1,134 @@
+"""
+Times the legacy declarative tables read by their compiled decoders against the field
+by field interpreter they replaced, on a made up hmtx and cmap format 4 subtable, and
+static Arrays unpacked in bulk against reading them item by item.
+
+run with: python -m tests.benchmarks.bench_legacy
+"""
+
+from random import randrange
+from struct import pack
+from timeit import timeit
+from types import SimpleNamespace
+
+from fnt.legacy import types
+from fnt.legacy.types import (
+    TTFType,
+    Array,
+    uint16,
+    int16,
+    Offset32,
+    FWORD,
+    UFWORD,
+    arrayEntry,
+    staticEntry,
+    dynamicEntry,
+    linkedEntry,
+    definition,
+)
+
+GLYPHS = 2_000
+SEGMENTS = 200
+NUMBER = 50
+
+
+# The legacy hmtx and cmap format 4 definitions, which can't be imported themselves
+@definition
+class LongHorMetric:
+    advanceWidth: UFWORD
+    lsb: FWORD
+
+
+@definition
+class hmtx:
+    numberOfHMetrics: uint16 = linkedEntry("hhea", "numberOfHMetrics")
+    numGlyphs: uint16 = linkedEntry("maxp", "numGlyphs")
+    hMetrics: Array[LongHorMetric] = arrayEntry("numberOfHMetrics")
+    leftSideBearings: Array[FWORD] = dynamicEntry(
+        lambda n, m, typ, buffer, offset, sz: typ[m - n].read(buffer, offset + sz),
+        "numberOfHMetrics",
+        "numGlyphs",
+    )
+
+
+@definition
+class cmapSubtable4:
+    format: uint16
+    length: uint16
+    language: uint16
+    segCountX2: uint16
+    searchRange: uint16
+    entrySelector: uint16
+    rangeShift: uint16
+    segCount: uint16 = dynamicEntry(
+        lambda x2, typ, buffer, offset, sz: uint16.byte(x2 // 2),
+        "segCountX2",
+        derived=True,
+    )
+    endCode: Array[uint16] = arrayEntry("segCount")
+    reservedPad: uint16 = staticEntry()
+    startCode: Array[uint16] = arrayEntry("segCount")
+    idDelta: Array[int16] = arrayEntry("segCount")
+    idRangeOffsets: Array[uint16] = arrayEntry("segCount")
+
+
+def report(name: str, t_interpreted: float, t_compiled: float):
+    print(
+        f"{name:<22}interpreted {1e3 * t_interpreted / NUMBER:7.2f}ms  "
+        f"compiled {1e3 * t_compiled / NUMBER:7.2f}ms  "
+        f"x{t_interpreted / t_compiled:5.2f}"
+    )
+
+
+# How Array read its items before they were unpacked in bulk
+def per_item(typ: type[TTFType], ln: int, buffer: bytes) -> tuple:
+    items = tuple(typ.read(buffer, idx * typ.sz) for idx in range(ln))
+    return items, "".join(item.fmt for item in items)
+
+
+def bench_array(name: str, typ: type[TTFType], ln: int):
+    data = bytes(range(256)) * (ln * typ.sz // 256 + 1)
+    t_items = timeit(lambda: per_item(typ, ln, data), number=NUMBER)
+    t_bulk = timeit(lambda: Array[typ, ln].read(data), number=NUMBER)
+    print(
+        f"{name:<22}per item    {1e3 * t_items / NUMBER:7.2f}ms  "
+        f"bulk     {1e3 * t_bulk / NUMBER:7.2f}ms  x{t_items / t_bulk:5.2f}"
+    )
+
+
+def main():
+    font = SimpleNamespace(
+        get_table=lambda tag: {
+            "hhea": {"numberOfHMetrics": uint16.byte(GLYPHS)},
+            "maxp": {"numGlyphs": uint16.byte(GLYPHS)},
+        }[tag]
+    )
+    values = [v for _ in range(GLYPHS) for v in (randrange(2000), randrange(-200, 200))]
+    data = pack(f">{2 * GLYPHS}h", *values)
+    record = SimpleNamespace(offset=0, length=len(data))
+
+    t_compiled = timeit(lambda: hmtx.parse(record, font, data), number=NUMBER)
+    t_interpreted = timeit(
+        lambda: types._interpret_parse(hmtx, record, font, data), number=NUMBER
+    )
+    report(f"hmtx {GLYPHS} glyphs", t_interpreted, t_compiled)
+
+    header = (4, 16 + 8 * SEGMENTS, 0, 2 * SEGMENTS, 0, 0, 0)
+    codes = [randrange(0x10000) for _ in range(4 * SEGMENTS)]
+    data = pack(f">7H{SEGMENTS}H", *header, *codes[:SEGMENTS]) + pack(
+        f">H{3 * SEGMENTS}H", 0, *codes[SEGMENTS:]
+    )
+
+    t_compiled = timeit(lambda: cmapSubtable4.read(data), number=NUMBER)
+    t_interpreted = timeit(
+        lambda: types._interpret_read(cmapSubtable4, data), number=NUMBER
+    )
+    report(f"cmap 4 {SEGMENTS} segments", t_interpreted, t_compiled)
+
+    bench_array("subHeaderKeys", uint16, 256)
+    bench_array(f"Offset32[{SEGMENTS}]", Offset32, SEGMENTS)
+    bench_array(f"LongHorMetric[{GLYPHS}]", LongHorMetric, GLYPHS)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Times Font.measure against looking each character up through cmap and hmtx by
+hand, over a few string lengths. The numpy path is used for the longer strings
+when it is installed.
+
+run with: python -m tests.benchmarks.bench_measure
+"""
+
+from pathlib import Path
+from timeit import timeit
+
+from fnt import FileFont
+
+FONTS = Path(__file__).parent.parent / "fonts"
+SAMPLE = "The quick brown fox jumps over the lazy dog. "
+NUMBER = 2000
+
+
+def by_hand(font: FileFont, text: str, size: float) -> float:
+    cmap, hmtx = font.get_table("cmap"), font.get_table("hmtx")
+    upem = font.get_table("head").unitsPerEm
+    return sum(hmtx.advance(cmap.lookup(ord(c))) for c in text) * size / upem
+
+
+def main():
+    font = FileFont.from_file(FONTS / "YDWbananaslipplus.otf")
+    for length in (8, 32, 128, 1024):
+        text = (SAMPLE * (length // len(SAMPLE) + 1))[:length]
+        t_hand = timeit(lambda: by_hand(font, text, 12), number=NUMBER)
+        t_measure = timeit(lambda: font.measure(text, 12), number=NUMBER)
+        print(
+            f"{length:>5} chars  by hand {1e6 * t_hand / NUMBER:8.2f}us  "
+            f"measure {1e6 * t_measure / NUMBER:8.2f}us  x{t_hand / t_measure:5.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Times reading the family and subfamily out of each test font's name table against
+decoding every string in it, which is what parse_name used to do.
+
+run with: python -m tests.benchmarks.bench_name
+"""
+
+from pathlib import Path
+from timeit import timeit
+
+from fnt import FileFont
+from fnt.parsing import parse_name
+
+FONTS = Path(__file__).parent.parent / "fonts"
+NUMBER = 500
+
+
+def family(font: FileFont):
+    table = parse_name(font, font.get_record("name"))
+    return table.get_name(1), table.get_name(2)
+
+
+def every_string(font: FileFont):
+    table = parse_name(font, font.get_record("name"))
+    return [record.string for record in table.nameRecords]
+
+
+def main():
+    for path in sorted(FONTS.glob("*.[ot]tf")):
+        font = FileFont.from_file(path)
+        t_lazy = timeit(lambda: family(font), number=NUMBER)
+        t_every = timeit(lambda: every_string(font), number=NUMBER)
+        print(
+            f"{path.name:<28}every {1e6 * t_every / NUMBER:8.2f}us  "
+            f"family {1e6 * t_lazy / NUMBER:8.2f}us  x{t_every / t_lazy:5.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Times decoding every simple glyph's outline in the test fonts, with and without
+numpy. The glyphs are parsed up front so only the outline decoding is measured.
+
+run with: python -m tests.benchmarks.bench_outline
+"""
+
+from pathlib import Path
+from timeit import timeit
+
+from fnt import FileFont
+from fnt.tables import SimpleGlyph
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+FONTS = Path(__file__).parent.parent / "fonts"
+NUMBER = 10
+
+
+def bench_font(path: Path):
+    glyphs = FileFont.from_file(path).get_table("glyf")
+    simple = [
+        glyph
+        for glyph in map(glyphs.get, range(len(glyphs)))
+        if isinstance(glyph, SimpleGlyph)
+    ]
+    points = sum(len(glyph.outline(False)) for glyph in simple)
+
+    def decode(vectorized: bool):
+        for glyph in simple:
+            glyph.outline(vectorized)
+
+    t_python = timeit(lambda: decode(False), number=NUMBER)
+    line = (
+        f"{path.name:<28}{len(simple):>5} glyphs {points:>6} points  "
+        f"python {1e3 * t_python / NUMBER:8.2f}ms"
+    )
+    if numpy is not None:
+        t_numpy = timeit(lambda: decode(True), number=NUMBER)
+        line += f"  numpy {1e3 * t_numpy / NUMBER:8.2f}ms  x{t_python / t_numpy:5.2f}"
+    print(line)
+
+
+def main():
+    for path in sorted(FONTS.glob("*.ttf")):
+        bench_font(path)
+
+
+if __name__ == "__main__":
+    main()
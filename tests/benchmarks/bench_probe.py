@@ -0,0 +1,43 @@
+"""
+Times identifying each test font with probe against opening it with FileFont (read and
+memory mapped) and parsing the same head, name, OS/2 and maxp tables.
+
+run with: python -m tests.benchmarks.bench_probe
+"""
+
+from pathlib import Path
+from timeit import timeit
+
+from fnt import FileFont, probe
+
+FONTS = Path(__file__).parent.parent / "fonts"
+NUMBER = 200
+
+
+def open_font(path: Path, mmap: bool):
+    with FileFont.from_file(path, mmap=mmap) as font:
+        names = font.get_table("name")
+        return (
+            names.get_name(1),
+            names.get_name(2),
+            font.get_table("head").unitsPerEm,
+            font.get_table("maxp").numGlyphs,
+            font.get_table("OS/2").usWeightClass,
+        )
+
+
+def main():
+    for path in sorted(FONTS.glob("*.[ot]tf")):
+        t_probe = timeit(lambda: probe(path), number=NUMBER)
+        t_read = timeit(lambda: open_font(path, False), number=NUMBER)
+        t_mmap = timeit(lambda: open_font(path, True), number=NUMBER)
+        print(
+            f"{path.name:<28}{path.stat().st_size // 1024:>6}KiB  "
+            f"read {1e6 * t_read / NUMBER:8.2f}us  "
+            f"mmap {1e6 * t_mmap / NUMBER:8.2f}us  "
+            f"probe {1e6 * t_probe / NUMBER:8.2f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
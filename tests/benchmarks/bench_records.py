@@ -0,0 +1,96 @@
+"""
+Compares the memory and creation time of the slotted records (TableRecord, MapGroup,
+LongHorMetric, NameRecord, ...) against plain dataclasses of the same fields, using
+every record in the test fonts.
+
+run with: python -m tests.benchmarks.bench_records
+"""
+
+from collections import defaultdict
+from dataclasses import fields, is_dataclass, make_dataclass
+from pathlib import Path
+from timeit import timeit
+from typing import Any
+import tracemalloc
+
+from fnt import FileFont
+
+FONTS = Path(__file__).parent.parent / "fonts"
+TABLES = ("cmap", "hmtx", "name", "gasp", "DSIG")
+NUMBER = 20
+
+
+def is_record(obj: Any) -> bool:
+    return is_dataclass(obj) and hasattr(type(obj), "__slots__")
+
+
+# Every record reachable from value, through tuples and other tables
+def collect(value: Any, found: dict[type, list]):
+    if isinstance(value, tuple):
+        for item in value:
+            collect(item, found)
+    elif is_dataclass(value) and not isinstance(value, type):
+        if is_record(value):
+            found[type(value)].append(value)
+        for field in fields(value):
+            collect(getattr(value, field.name), found)
+
+
+def font_records(path: Path) -> dict[type, list[tuple]]:
+    found: dict[type, list] = defaultdict(list)
+    font = FileFont.from_file(path)
+    collect(font.get_table("directory").tableRecords, found)
+    for name in TABLES:
+        if not font.has_table(name):
+            continue
+        try:
+            table = font.get_table(name)
+        except ValueError:
+            continue  # tables pyfont can't parse yet are left out
+        collect(table, found)
+        if name == "hmtx":
+            collect(table.hMetrics, found)
+
+    # Only the init arguments, so both kinds of record are built from the same values
+    return {
+        cls: [tuple(getattr(r, f.name) for f in fields(r) if f.init) for r in records]
+        for cls, records in found.items()
+    }
+
+
+def plain(cls: type) -> type:
+    return make_dataclass(cls.__name__, [(f.name, f.type, f) for f in fields(cls)])
+
+
+def measure(cls: type, values: list[tuple]) -> tuple[int, float]:
+    tracemalloc.start()
+    records = [cls(*v) for v in values]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    return size, timeit(lambda: [cls(*v) for v in values], number=NUMBER) / NUMBER
+
+
+def main():
+    totals = [0, 0]
+    for path in sorted(FONTS.glob("*.[ot]tf")):
+        print(path.name)
+        records = sorted(font_records(path).items(), key=lambda item: -len(item[1]))
+        for cls, values in records:
+            slotted_size, t_slotted = measure(cls, values)
+            plain_size, t_plain = measure(plain(cls), values)
+            totals[0] += slotted_size
+            totals[1] += plain_size
+            print(
+                f"  {cls.__name__:<18}{len(values):>7} records  "
+                f"plain {plain_size / 1024:8.1f}KiB {1e3 * t_plain:7.2f}ms  "
+                f"slotted {slotted_size / 1024:8.1f}KiB {1e3 * t_slotted:7.2f}ms"
+            )
+    print(
+        f"total plain {totals[1] / 1024:.1f}KiB  slotted {totals[0] / 1024:.1f}KiB  "
+        f"x{totals[1] / totals[0]:.2f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
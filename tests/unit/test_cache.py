@@ -0,0 +1,103 @@
+from pathlib import Path
+from os import utime
+from shutil import copyfile
+
+from fnt import FileFont, TableCache
+from fnt.tables import Columns
+import fnt.file_font
+import pytest
+
+FONTS = Path(__file__).parent.parent / "fonts"
+TABLES = ("cmap", "head", "hhea", "hmtx", "maxp", "post")
+
+
+def fail_parsing(monkeypatch: pytest.MonkeyPatch):
+    def parse(*_):
+        raise AssertionError("table was parsed instead of loaded from the cache")
+
+    parsers = {tag: parse for tag in fnt.file_font.parsers}
+    monkeypatch.setattr(fnt.file_font, "parsers", parsers)
+
+
+def test_tables_loaded_from_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    cache = TableCache(tmp_path / "cache")
+    path = FONTS / "monof55.ttf"
+    expected = {name: FileFont.from_file(path).get_table(name) for name in TABLES}
+
+    with FileFont.from_file(path, cache=cache) as first:
+        for name in TABLES:
+            first.get_table(name)
+
+    fail_parsing(monkeypatch)
+    second = FileFont.from_file(path, cache=cache)
+    for name in TABLES:
+        assert second.get_table(name) == expected[name]
+
+
+def test_glyf_not_cached(tmp_path: Path):
+    cache = TableCache(tmp_path)
+    with FileFont.from_file(FONTS / "monof55.ttf", cache=cache) as font:
+        font.get_table("glyf")[36]
+    (entry,) = tmp_path.glob("*.pickle")
+    tables = TableCache(tmp_path).load(TableCache.font_key(FONTS / "monof55.ttf"))
+    assert sorted(key[0] for key in tables) == ["head", "loca", "maxp"]
+
+
+def test_modified_font_reparsed(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    cache = TableCache(tmp_path / "cache")
+    path = tmp_path / "font.ttf"
+    copyfile(FONTS / "monof55.ttf", path)
+    with FileFont.from_file(path, cache=cache) as font:
+        font.get_table("head")
+
+    utime(path, ns=(0, 0))
+    fail_parsing(monkeypatch)
+    with pytest.raises(AssertionError):
+        FileFont.from_file(path, cache=cache).get_table("head")
+
+
+def test_corrupt_entry_reparsed(tmp_path: Path):
+    cache = TableCache(tmp_path)
+    path = FONTS / "monof55.ttf"
+    with FileFont.from_file(path, cache=cache) as font:
+        expected = font.get_table("head")
+    for entry in tmp_path.glob("*.pickle"):
+        entry.write_bytes(b"not a pickle")
+    assert FileFont.from_file(path, cache=cache).get_table("head") == expected
+
+
+def test_columnar_fonts_cached_apart(tmp_path: Path):
+    cache = TableCache(tmp_path)
+    path = FONTS / "YDWbananaslipplus.otf"
+    for columnar in (False, True):
+        with FileFont.from_file(path, cache=cache, columnar=columnar) as font:
+            font.get_table("cmap")
+    assert len(list(tmp_path.glob("*.pickle"))) == 2
+
+    font = FileFont.from_file(path, cache=cache, columnar=True)
+    assert isinstance(font.get_table("cmap").best_subtable().groups, Columns)
+
+
+def test_entry_written_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    cache = TableCache(tmp_path)
+    stores = []
+
+    def store(font_key, tables):
+        stores.append(font_key)
+        TableCache.store(cache, font_key, tables)
+
+    monkeypatch.setattr(cache, "store", store)
+
+    font = FileFont.from_file(FONTS / "monof55.ttf", cache=cache)
+    for name in TABLES:
+        font.get_table(name)
+    assert not stores
+    font.flush()
+    font.flush()
+    assert len(stores) == 1
+
+    font.get_table("name")
+    font.close()
+    assert len(stores) == 2
+    tables = cache.load(TableCache.font_key(FONTS / "monof55.ttf"))
+    assert sorted(key[0] for key in tables) == sorted(TABLES + ("name",))
@@ -0,0 +1,55 @@
+from pathlib import Path
+from struct import pack, unpack_from
+
+from fnt import FileFont, Collection
+from fnt.checksum import checksum
+import fnt.checksum
+import pytest
+
+FONTS = Path(__file__).parent.parent / "fonts"
+
+
+def test_checksum_pads_last_word():
+    assert checksum(b"") == 0
+    assert checksum(b"\x00\x00\x00\x01\x00\x00\x00\x02") == 3
+    assert checksum(b"\x00\x00\x00\x01\x02") == 0x02000001
+    assert checksum(b"\xff\xff\xff\xff\x00\x00\x00\x02") == 1
+
+
+def test_checksum_vectorized(monkeypatch: pytest.MonkeyPatch):
+    pytest.importorskip("numpy")
+    data = (FONTS / "YDWbananaslipplus.otf").read_bytes()[:100003]
+    expected = checksum(data)
+    monkeypatch.setattr(fnt.checksum, "numpy", None)
+    assert checksum(data) == expected
+
+
+@pytest.mark.parametrize("workers", (1, 4))
+def test_verify(workers: int):
+    font = FileFont.from_file(FONTS / "MxPlus_IBM_BIOS.ttf")
+    assert font.verify(workers) == ()
+
+    # monofur was shipped with a zero glyf checksum
+    font = FileFont.from_file(FONTS / "monof55.ttf")
+    (mismatch,) = font.verify(workers)
+    assert (mismatch.tableTag, mismatch.expected) == ("glyf", 0)
+
+
+def test_verify_detects_corruption():
+    data = bytearray((FONTS / "MxPlus_IBM_BIOS.ttf").read_bytes())
+    record = FileFont(bytes(data)).get_record("cmap")
+    data[record.offset + 20] ^= 0xFF
+
+    tags = [mismatch.tableTag for mismatch in FileFont(bytes(data)).verify()]
+    assert tags == ["cmap", None]
+
+
+def test_verify_collection_member():
+    # The font's table offsets moved past a single font TTC header, which leaves its
+    # checksumAdjustment out of date but every table intact.
+    data = bytearray((FONTS / "MxPlus_IBM_BIOS.ttf").read_bytes())
+    for idx in range(12, 12 + 16 * unpack_from(">H", data, 4)[0], 16):
+        (offset,) = unpack_from(">I", data, idx + 8)
+        data[idx + 8 : idx + 12] = pack(">I", offset + 16)
+    collection = Collection(pack(">4sHHII", b"ttcf", 1, 0, 1, 16) + data)
+    assert collection[0].verify() == ()
@@ -0,0 +1,92 @@
+from pathlib import Path
+
+from fnt import FileFont
+from fnt.tables import cmapSubHeader, cmapSubtable_v2, Coverage
+import pytest
+
+FONTS = Path(__file__).parent.parent / "fonts"
+
+
+@pytest.fixture(scope="module")
+def banana():
+    return FileFont.from_file(FONTS / "YDWbananaslipplus.otf").get_table("cmap")
+
+
+def test_best_subtable_prefers_full_unicode(banana):
+    assert banana.best_subtable().format == 12
+
+
+def test_format4_matches_format12(banana):
+    bmp, full = banana.subTables[3], banana.subTables[4]
+    assert (bmp.format, full.format) == (4, 12)
+    for codepoint in range(0x10000):
+        assert bmp.lookup(codepoint) == full.lookup(codepoint)
+
+
+@pytest.mark.parametrize("name", ("monof55.ttf", "MxPlus_IBM_BIOS.ttf"))
+def test_lookup(name: str):
+    cmap = FileFont.from_file(FONTS / name).get_table("cmap")
+    glyphs = cmap.lookup_many("Hello")
+    assert glyphs[2] == glyphs[3] != 0
+    assert glyphs == tuple(cmap.lookup(ord(c)) for c in "Hello")
+    assert cmap.lookup(0x10FFFF) == 0
+
+
+def test_dense_lookup(banana):
+    text = "The quick brown fox \U0001f98a"
+    expected = banana.lookup_many(text)
+    banana.build_dense()
+    assert banana.lookup_many(text) == expected
+
+
+def test_format2_lookup():
+    keys = [0] * 256
+    keys[0x81] = 8
+    sub_tables = (
+        # idRangeOffset is counted from the field itself to the target glyph
+        cmapSubHeader(0, 256, 0, 10),
+        cmapSubHeader(0x40, 2, 5, 514),
+    )
+    glyphs = tuple(range(256)) + (100, 0)
+    sub_table = cmapSubtable_v2(2, 0, 0, tuple(keys), sub_tables, glyphs)
+    assert sub_table.lookup(0x41) == 0x41
+    assert sub_table.lookup(0x81) == 0  # first byte of a two byte code
+    assert sub_table.lookup(0x8140) == 105
+    assert sub_table.lookup(0x8141) == 0
+    assert sub_table.lookup(0x8242) == 0
+
+
+def test_shared_subtables_parsed_once():
+    cmap = FileFont.from_file(FONTS / "monof55.ttf").get_table("cmap")
+    offsets = [record.subtableOffset for record in cmap.header.encodingRecords]
+    assert offsets[0] == offsets[2]
+    assert cmap.subTables[0] is cmap.subTables[2]
+    assert cmap.subTables[0] is not cmap.subTables[1]
+
+
+def test_coverage_matches_lookup(banana):
+    coverage = banana.coverage()
+    assert coverage is banana.coverage()
+    assert len(coverage) == sum(hi - lo + 1 for lo, hi in banana.ranges())
+    for codepoint in range(0x20000):
+        assert (codepoint in coverage) == bool(banana.lookup(codepoint))
+    assert coverage.ranges() == banana.ranges()
+
+
+def test_coverage_text(banana):
+    coverage = banana.coverage()
+    assert coverage.covers("Hello")
+    assert not coverage.covers("Hello \U0010fffd")
+    assert (
+        coverage.missing("a\U0010fffdb\U0010fffd\U0010fffe") == "\U0010fffd\U0010fffe"
+    )
+
+
+def test_coverage_set_operations():
+    a = Coverage.from_ranges(((0x41, 0x5A), (0x100, 0x107)))
+    b = Coverage.from_ranges(((0x50, 0x60),))
+    assert (a & b).ranges() == ((0x50, 0x5A),)
+    assert (a | b).ranges() == ((0x41, 0x60), (0x100, 0x107))
+    assert (a - b).ranges() == ((0x41, 0x4F), (0x100, 0x107))
+    assert len(a) == 34 and 0x107 in a and 0x108 not in a
+    assert len(Coverage.from_ranges(())) == 0
@@ -0,0 +1,79 @@
+from pathlib import Path
+from struct import pack, unpack_from
+
+from fnt import Collection, FileFont
+import pytest
+
+FONTS = Path(__file__).parent.parent / "fonts"
+
+
+def make_ttc(*paths: Path) -> bytes:
+    # Lay each font's table directory out after the TTC header followed by the raw
+    # fonts, faces made from the same file point at the same table bytes.
+    fonts = [path.read_bytes() for path in paths]
+    dir_sizes = [12 + 16 * unpack_from(">H", b, 4)[0] for b in fonts]
+    header_size = 12 + 4 * len(fonts)
+
+    dir_offsets = [header_size + sum(dir_sizes[:idx]) for idx in range(len(fonts))]
+    data_offsets: dict[bytes, int] = {}
+    offset = header_size + sum(dir_sizes)
+    for b in fonts:
+        if b not in data_offsets:
+            data_offsets[b] = offset
+            offset += len(b)
+
+    directories = b""
+    for b, sz in zip(fonts, dir_sizes):
+        directory = bytearray(b[:sz])
+        for idx in range(12, sz, 16):
+            (table_offset,) = unpack_from(">I", directory, idx + 8)
+            directory[idx + 8 : idx + 12] = pack(">I", table_offset + data_offsets[b])
+        directories += directory
+
+    header = pack(f">4sHHI{len(fonts)}I", b"ttcf", 1, 0, len(fonts), *dir_offsets)
+    return header + directories + b"".join(data_offsets)
+
+
+@pytest.fixture
+def collection() -> Collection:
+    path = FONTS / "monof55.ttf"
+    return Collection(make_ttc(path, path, FONTS / "monof56.ttf"))
+
+
+def test_collection_header(collection: Collection):
+    assert collection.header.ttcTag == "ttcf"
+    assert len(collection) == 3
+    assert [font.index for font in collection] == [0, 1, 2]
+
+
+def test_collection_tables_match_file_font(collection: Collection):
+    for font, name in zip(collection, ("monof55.ttf", "monof55.ttf", "monof56.ttf")):
+        file_font = FileFont.from_file(FONTS / name)
+        assert font.get_table_names() == file_font.get_table_names()
+        for table in ("cmap", "head", "hmtx", "post"):
+            assert font.get_table(table) == file_font.get_table(table)
+
+
+def test_collection_shares_tables(collection: Collection):
+    first, second, third = collection
+    assert first.get_table("hmtx") is second.get_table("hmtx")
+    assert first.get_table("cmap") is second.get_table("cmap")
+    assert first.get_table("cmap") is not third.get_table("cmap")
+
+
+def test_collection_close(collection: Collection):
+    font = collection[0]
+    with collection:
+        font.get_table("head")
+    assert collection.closed and font.closed
+
+
+def test_collection_glyf_outlives_sibling(collection: Collection):
+    first, second, _ = collection
+    expected = FileFont.from_file(FONTS / "monof55.ttf").get_table("glyf")
+    first.get_table("glyf")
+    first.close()
+
+    glyphs = second.get_table("glyf")
+    assert glyphs[36] == expected[36]
+    assert glyphs.flatten(36) == expected.flatten(36)
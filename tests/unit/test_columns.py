@@ -0,0 +1,81 @@
+from pathlib import Path
+from struct import pack
+from array import array
+import pickle
+
+from fnt import FileFont, FontCursor
+from fnt.parsing import parse_cmap_subtable
+from fnt.tables import Columns, MapGroup, UVSMapping, TableRecord, EncodingRecord
+import pytest
+
+FONTS = Path(__file__).parent.parent / "fonts"
+BANANA = FONTS / "YDWbananaslipplus.otf"
+
+
+class ColumnarCursor(FontCursor):
+    @property
+    def columnar(self) -> bool:
+        return True
+
+
+def test_columnar_cmap_matches():
+    rows = FileFont.from_file(BANANA).get_table("cmap")
+    columns = FileFont.from_file(BANANA, columnar=True).get_table("cmap")
+
+    groups = columns.best_subtable().groups
+    assert isinstance(groups, Columns)
+    assert isinstance(groups.startCharCode, array) and groups.record is MapGroup
+    assert tuple(groups) == rows.best_subtable().groups
+    assert groups[5] == rows.best_subtable().groups[5]
+
+    for codepoint in range(0x30000):
+        assert columns.lookup(codepoint) == rows.lookup(codepoint)
+    assert columns.coverage().bits == rows.coverage().bits
+
+
+def test_columnar_dsig():
+    rows = FileFont.from_file(BANANA).get_table("DSIG")
+    columns = FileFont.from_file(BANANA, columnar=True).get_table("DSIG")
+    assert isinstance(columns.signatureRecords, Columns)
+    assert columns.signatureRecords == rows.signatureRecords
+    assert columns.signatureBlocks == rows.signatureBlocks
+
+
+def test_columnar_variation_mappings():
+    mappings = [(0x4E00, 10), (0x1F600, 700), (0x20000, 65535)]
+    data = pack(">HIIBHII", 14, 0, 1, 0, 0xFE00, 0, 21)
+    data += pack(">I", len(mappings))
+    data += b"".join(pack(">BHH", u >> 16, u & 0xFFFF, g) for u, g in mappings)
+    record = TableRecord("cmap", 0, 0, len(data))
+    encoding = EncodingRecord(0, 5, 0)
+
+    rows = parse_cmap_subtable(FontCursor(None, memoryview(data)), record, encoding)
+    cursor = ColumnarCursor(None, memoryview(data))
+    columns = parse_cmap_subtable(cursor, record, encoding)
+
+    (uvs,) = columns.nonDefaultUVS
+    assert isinstance(uvs.uvsMappings, Columns)
+    assert uvs.uvsMappings == rows.nonDefaultUVS[0].uvsMappings
+    assert list(uvs.uvsMappings.unicodeValue) == [u for u, _ in mappings]
+    assert uvs.uvsMappings[1:].glyphID.tolist() == [700, 65535]
+    assert uvs.uvsMappings[-1] == UVSMapping(0x20000, 65535)
+
+
+def test_columns_numpy_shares_memory():
+    numpy = pytest.importorskip("numpy")
+    groups = FileFont.from_file(BANANA, columnar=True).get_table("cmap")
+    groups = groups.best_subtable().groups
+    starts = groups.numpy("startCharCode")
+    assert starts.dtype == numpy.uint32
+    assert numpy.shares_memory(starts, groups.startCharCode)
+    assert starts.tolist() == groups.startCharCode.tolist()
+
+
+def test_columns_pickle_and_hmtx():
+    hmtx = FileFont.from_file(FONTS / "monof55.ttf").get_table("hmtx")
+    metrics = hmtx.metric_columns()
+    assert metrics == hmtx.hMetrics
+    assert len(metrics) == len(hmtx.hMetrics)
+    assert pickle.loads(pickle.dumps(metrics)) == metrics
+    with pytest.raises(AttributeError):
+        metrics.missing
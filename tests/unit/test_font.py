@@ -0,0 +1,126 @@
+from pathlib import Path
+from struct import pack, Struct
+from concurrent.futures import ThreadPoolExecutor
+
+from fnt import Font, FileFont
+import pytest
+
+
+class BytesFont(Font):
+    def __init__(self, data: bytes):
+        self._data = data
+        self._offset = 0
+
+    def seek(self, offset: int):
+        self._offset = offset
+
+    def read(self, sz: int) -> bytes:
+        b = self._data[self._offset : self._offset + sz]
+        self._offset += sz
+        return b
+
+    def pointer(self) -> int:
+        return self._offset
+
+
+array_vals = (
+    ("get_uint8_array", ">4B", (0, 1, 127, 255)),
+    ("get_int8_array", ">4b", (0, 1, -128, 127)),
+    ("get_uint16_array", ">4H", (0, 1, 0x8000, 0xFFFF)),
+    ("get_int16_array", ">4h", (0, -1, -32768, 32767)),
+    ("get_uint32_array", ">3I", (0, 0x10000, 0xFFFFFFFF)),
+    ("get_int32_array", ">3i", (0, -1, -(2**31))),
+    ("get_time_array", ">2q", (0, -(2**40))),
+)
+
+
+@pytest.mark.parametrize("method, fmt, v", array_vals)
+def test_int_arrays(method: str, fmt: str, v: tuple[int, ...]):
+    font = BytesFont(b"\xAA" + pack(fmt, *v))
+    font.seek(1)
+    assert getattr(font, method)(len(v)) == v
+    assert font.pointer() == 1 + len(pack(fmt, *v))
+
+
+def test_decimal_arrays():
+    font = BytesFont(pack(">2h2i", 0x4000, -0x8000, 0x18000, -0x10000))
+    assert font.get_F2DOT14_array(2) == (1.0, -2.0)
+    assert font.get_fixed_array(2) == (1.5, -1.0)
+
+
+def test_tag_array():
+    font = BytesFont(b"cmapOS/2cvt ")
+    assert font.get_tag_array(3) == ("cmap", "OS/2", "cvt ")
+
+
+def test_empty_array():
+    assert BytesFont(b"").get_uint16_array(0) == ()
+
+
+scalar_vals = (
+    ("get_uint8", ">B", 255),
+    ("get_int8", ">b", -128),
+    ("get_uint16", ">H", 0xFFFE),
+    ("get_int16", ">h", -2),
+    ("get_uint32", ">I", 0xFFFFFFFE),
+    ("get_int32", ">i", -2),
+    ("get_time", ">q", -(2**40)),
+)
+
+
+@pytest.mark.parametrize("method, fmt, v", scalar_vals)
+def test_scalars(method: str, fmt: str, v: int):
+    font = BytesFont(pack(fmt, v))
+    assert getattr(font, method)() == v
+    assert font.pointer() == len(pack(fmt, v))
+
+
+def test_24bit():
+    font = BytesFont(b"\xFF\xFF\xFE\x01\x00\x00" * 2)
+    assert font.get_int24() == -2
+    assert font.get_uint24() == 0x010000
+    assert font.get_uint24_array(2) == (0xFFFFFE, 0x010000)
+
+
+def test_file_font_matches_read_path():
+    path = Path(__file__).parent.parent / "fonts" / "monof55.ttf"
+    file_font = FileFont.from_file(path)
+    bytes_font = BytesFont(path.read_bytes())
+    for font in (file_font, bytes_font):
+        font.seek(file_font.get_record("hmtx").offset)
+    assert file_font.get_int16_array(64) == bytes_font.get_int16_array(64)
+    assert file_font.get_uint32() == bytes_font.get_uint32()
+    assert file_font.pointer() == bytes_font.pointer()
+    assert bytes(file_font.view(4)) == bytes_font.read(4)
+
+
+def test_mmap_file_font():
+    path = Path(__file__).parent.parent / "fonts" / "monof55.ttf"
+    with FileFont.from_file(path, mmap=True) as font:
+        assert font.get_table("head") == FileFont.from_file(path).get_table("head")
+    assert font.closed
+    with pytest.raises(ValueError):
+        font.get_uint16()
+
+
+def test_read_at_keeps_position():
+    path = Path(__file__).parent.parent / "fonts" / "monof55.ttf"
+    font = FileFont.from_file(path)
+    font.seek(12)
+    assert font.read_at(0, 4) == path.read_bytes()[:4]
+    assert font.unpack_at(Struct(">H"), 4) == (font.get_table("directory").numTables,)
+    assert font.pointer() == 12
+
+
+def test_threaded_get_table():
+    path = Path(__file__).parent.parent / "fonts" / "YDWbananaslipplus.otf"
+    names = ("cmap", "hmtx", "head", "hhea", "maxp", "post", "DSIG") * 8
+    expected = {name: FileFont.from_file(path).get_table(name) for name in names}
+
+    font = FileFont.from_file(path)
+    with ThreadPoolExecutor(8) as pool:
+        tables = list(pool.map(font.get_table, names))
+
+    for name, table in zip(names, tables):
+        assert table == expected[name]
+        assert table is font.get_table(name)
@@ -0,0 +1,202 @@
+from pathlib import Path
+from struct import pack
+from dataclasses import replace
+
+from array import array
+
+from fnt import FileFont, FontCursor
+from fnt.flags import CompositeGlyphFlags
+from fnt.exceptions import (
+    CompositeGlyphCycleError,
+    CompositeGlyphDepthError,
+    CompositeGlyphPointError,
+)
+from fnt.parsing import parse_glyph
+from fnt.tables import SimpleGlyph, CompositeGlyph, glyf
+import pytest
+
+FONTS = Path(__file__).parent.parent / "fonts"
+
+
+@pytest.mark.parametrize("name", ("monof55.ttf", "MxPlus_IBM_BIOS.ttf"))
+def test_loca_offsets(name: str):
+    font = FileFont.from_file(FONTS / name)
+    offsets = font.get_table("loca").offsets
+    assert len(offsets) == font.get_table("maxp").numGlyphs + 1
+    assert offsets[-1] <= font.get_record("glyf").length
+    assert all(a <= b for a, b in zip(offsets, offsets[1:]))
+
+
+def test_glyphs_decoded_on_demand():
+    font = FileFont.from_file(FONTS / "monof55.ttf")
+    glyphs = font.get_table("glyf")
+    assert len(glyphs) == 675
+
+    glyph = glyphs[36]
+    assert isinstance(glyph, SimpleGlyph)
+    assert glyph is glyphs.get(36)
+    assert glyph.xMin <= glyph.xMax and glyph.yMin <= glyph.yMax
+    assert glyph.numberOfContours == len(glyph.endPtsOfContours)
+    assert glyphs[3] is None  # space
+
+    with pytest.raises(IndexError):
+        glyphs.get(675)
+
+
+def test_glyph_cache_is_bounded():
+    font = FileFont.from_file(FONTS / "monof55.ttf")
+    glyphs = replace(font.get_table("glyf"), cacheSize=4)
+    first = glyphs[36]
+    for gid in range(37, 45):
+        glyphs[gid]
+    assert glyphs[36] is not first
+    assert glyphs[36] == first
+
+
+def test_composite_glyph():
+    flags = (
+        CompositeGlyphFlags.ARG_1_AND_2_ARE_WORDS
+        | CompositeGlyphFlags.ARGS_ARE_XY_VALUES
+        | CompositeGlyphFlags.MORE_COMPONENTS
+    )
+    data = (
+        pack(">5h", -1, 0, -10, 500, 700)
+        + pack(">HHhh", flags, 36, -20, 300)
+        + pack(">HHBBh", CompositeGlyphFlags.WE_HAVE_A_SCALE, 37, 5, 6, 0x2000)
+    )
+    glyph = parse_glyph(FontCursor(None, memoryview(data)), len(data))
+    assert isinstance(glyph, CompositeGlyph)
+    assert (glyph.xMin, glyph.yMin, glyph.xMax, glyph.yMax) == (0, -10, 500, 700)
+
+    first, second = glyph.children
+    assert (first.glyphIndex, first.xOffset, first.yOffset) == (36, -20, 300)
+    assert first.transform == (1.0, 0.0, 0.0, 1.0)
+    assert (second.glyphIndex, second.xOffset, second.yOffset) == (37, 5, 6)
+    assert second.transform == (0.5, 0.0, 0.0, 0.5)
+    assert glyph.instructionLength == 0
+
+
+@pytest.mark.parametrize("vectorized", (False, True))
+def test_outline_matches_bounds(vectorized: bool):
+    if vectorized:
+        pytest.importorskip("numpy")
+    glyphs = FileFont.from_file(FONTS / "monof55.ttf").get_table("glyf")
+    for gid in range(len(glyphs)):
+        glyph = glyphs[gid]
+        if glyph is None or not glyph.endPtsOfContours:
+            continue
+        outline = glyph.outline(vectorized)
+        assert len(outline) == glyph.endPtsOfContours[-1] + 1
+        assert min(outline.xCoordinates) == glyph.xMin
+        assert max(outline.xCoordinates) == glyph.xMax
+        assert min(outline.yCoordinates) == glyph.yMin
+        assert max(outline.yCoordinates) == glyph.yMax
+
+
+def test_outline_decodes_vectors():
+    # on curve, x short positive, y long, repeated twice more
+    # then off curve with x the same and y short negative
+    flags = (0x01 | 0x02 | 0x10 | 0x08, 2, 0x10 | 0x04)
+    x = (10, 20, 30)
+    y = (0x01, 0x00, 0xFF, 0x00, 0x00, 0x01, 0x05)
+    glyph = SimpleGlyph(1, 0, 0, 0, 0, (3,), 0, (), flags, x, y)
+
+    outline = glyph.outline(False)
+    assert list(outline.xCoordinates) == [10, 30, 60, 60]
+    assert list(outline.yCoordinates) == [256, 0, 1, -4]
+    assert list(outline.onCurve) == [1, 1, 1, 0]
+
+
+XY = CompositeGlyphFlags.ARGS_ARE_XY_VALUES
+WORDS = CompositeGlyphFlags.ARG_1_AND_2_ARE_WORDS
+MORE = CompositeGlyphFlags.MORE_COMPONENTS
+
+
+def square() -> bytes:
+    # (0, 0) (100, 0) (100, 100) (0, 100) all on curve with 16 bit deltas
+    return (
+        pack(">5h", 1, 0, 0, 100, 100)
+        + pack(">HH", 3, 0)
+        + bytes((0x01,) * 4)
+        + pack(">4h", 0, 100, 0, -100)
+        + pack(">4h", 0, 0, 100, 0)
+    )
+
+
+def composite(*children: tuple[int, int, int, int, bytes]) -> bytes:
+    data = pack(">5h", -1, 0, 0, 0, 0)
+    for idx, (flags, gid, arg1, arg2, scale) in enumerate(children):
+        flags |= WORDS | (MORE if idx < len(children) - 1 else 0)
+        data += pack(">HHhh", flags, gid, arg1, arg2) + scale
+    return data
+
+
+def make_glyf(*glyphs: bytes) -> glyf:
+    data = b""
+    locations = array("I", [0])
+    for glyph in glyphs:
+        data += glyph + b"\x00" * (len(glyph) % 2)
+        locations.append(len(data))
+    return glyf(FontCursor(None, memoryview(data)), 0, locations, parse_glyph)
+
+
+def test_flatten_applies_offsets_and_transforms():
+    half = pack(">h", 0x2000)
+    two_by_two = pack(">4h", 0, 0x4000, -0x4000, 0)  # rotate 90 degrees
+    glyphs = make_glyf(
+        square(),
+        composite(
+            (XY, 0, 10, 20, b""),
+            (XY | CompositeGlyphFlags.WE_HAVE_A_SCALE, 0, 0, 0, half),
+        ),
+        composite((XY | CompositeGlyphFlags.WE_HAVE_A_TWO_BY_TWO, 0, 0, 0, two_by_two)),
+        composite((XY, 1, 5, 5, b"")),
+    )
+    assert glyphs.flatten(0) == glyphs[0].outline()
+
+    outline = glyphs.flatten(1)
+    assert outline.endPtsOfContours == (3, 7)
+    assert list(outline.xCoordinates) == [10, 110, 110, 10, 0, 50, 50, 0]
+    assert list(outline.yCoordinates) == [20, 20, 120, 120, 0, 0, 50, 50]
+    assert list(outline.onCurve) == [1] * 8
+
+    outline = glyphs.flatten(2)
+    assert list(outline.xCoordinates) == [0, 0, -100, -100]
+    assert list(outline.yCoordinates) == [0, 100, 100, 0]
+
+    nested = glyphs.flatten(3)
+    assert list(nested.xCoordinates) == [x + 5 for x in glyphs.flatten(1).xCoordinates]
+    assert glyphs.flatten(3) is nested
+
+
+def test_flatten_matches_points():
+    # second square placed so its point 0 sits on the first square's point 2
+    glyphs = make_glyf(square(), composite((XY, 0, 0, 0, b""), (0, 0, 2, 0, b"")))
+    outline = glyphs.flatten(1)
+    assert (outline.xCoordinates[4], outline.yCoordinates[4]) == (100, 100)
+
+
+def test_flatten_checks_matched_points():
+    glyphs = make_glyf(
+        square(),
+        composite((XY, 0, 0, 0, b""), (0, 0, 4, 0, b"")),
+        composite((XY, 0, 0, 0, b""), (0, 0, 2, 4, b"")),
+        composite((0, 0, 0, 0, b"")),
+    )
+    for glyph_id in (1, 2, 3):
+        with pytest.raises(CompositeGlyphPointError):
+            glyphs.flatten(glyph_id)
+
+
+def test_flatten_detects_cycles():
+    glyphs = make_glyf(composite((XY, 1, 0, 0, b"")), composite((XY, 0, 0, 0, b"")))
+    with pytest.raises(CompositeGlyphCycleError):
+        glyphs.flatten(0)
+
+
+def test_flatten_limits_depth():
+    chain = [composite((XY, gid + 1, 0, 0, b"")) for gid in range(40)]
+    glyphs = make_glyf(*chain, square())
+    with pytest.raises(CompositeGlyphDepthError):
+        glyphs.flatten(0)
+    assert len(glyphs.flatten(30)) == 4
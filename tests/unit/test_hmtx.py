@@ -0,0 +1,39 @@
+from pathlib import Path
+from struct import unpack_from
+
+from fnt import FileFont
+from fnt.tables import LongHorMetric
+import pytest
+
+FONTS = Path(__file__).parent.parent / "fonts"
+
+
+@pytest.mark.parametrize(
+    "name", ("monof55.ttf", "MxPlus_IBM_BIOS.ttf", "YDWbananaslipplus.otf")
+)
+def test_hmtx_matches_file(name: str):
+    font = FileFont.from_file(FONTS / name)
+    hmtx = font.get_table("hmtx")
+    metrics = font.get_table("hhea").numberOfHMetrics
+    glyphs = font.get_table("maxp").numGlyphs
+
+    data = (FONTS / name).read_bytes()
+    offset = font.get_record("hmtx").offset
+    expected = unpack_from(f">{2 * metrics}h", data, offset)
+    bearings = unpack_from(f">{glyphs - metrics}h", data, offset + 4 * metrics)
+
+    assert hmtx.hMetrics == tuple(
+        LongHorMetric(advance & 0xFFFF, lsb)
+        for advance, lsb in zip(expected[::2], expected[1::2])
+    )
+    assert hmtx.leftSideBearings == bearings
+    assert len(hmtx.lsbs) == glyphs
+
+
+def test_last_advance_repeats():
+    hmtx = FileFont.from_file(FONTS / "MxPlus_IBM_BIOS.ttf").get_table("hmtx")
+    assert len(hmtx.advanceWidths) == 4
+    last = hmtx.advanceWidths[-1]
+    assert hmtx.advance(3) == hmtx.advance(500) == last
+    assert hmtx.lsb(500) == hmtx.leftSideBearings[496]
+    assert list(hmtx.advances([0, 1, 700])) == [hmtx.advance(0), hmtx.advance(1), last]
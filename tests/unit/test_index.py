@@ -0,0 +1,69 @@
+from pathlib import Path
+from shutil import copyfile
+from os import utime
+
+from fnt import FontIndex
+import fnt.index
+import pytest
+
+FONTS = Path(__file__).parent.parent / "fonts"
+
+
+@pytest.fixture
+def fonts(tmp_path: Path) -> Path:
+    directory = tmp_path / "fonts"
+    (directory / "nested").mkdir(parents=True)
+    copyfile(FONTS / "monof55.ttf", directory / "monof55.ttf")
+    copyfile(FONTS / "monof56.ttf", directory / "nested" / "monof56.ttf")
+    copyfile(FONTS / "MxPlus_IBM_BIOS.ttf", directory / "MxPlus_IBM_BIOS.ttf")
+    (directory / "broken.ttf").write_bytes(b"\x00\x01\x00\x00")
+    return directory
+
+
+def test_scan_and_find(fonts: Path):
+    with FontIndex() as index:
+        assert index.scan(fonts, workers=2) == 4
+        assert len(index) == 3
+
+        names = [font.path.name for font in index.find("Hello")]
+        assert names == ["MxPlus_IBM_BIOS.ttf", "monof55.ttf", "monof56.ttf"]
+
+        (italic,) = index.find("Hello", weight=400, italic=True)
+        assert italic.family == "monofur" and italic.italic
+        assert index.find("Hello", weight=700) == []
+        (superscript,) = index.find("\u2074")  # only the IBM font has it
+        assert superscript.path.name == "MxPlus_IBM_BIOS.ttf"
+        assert index.find(0x10FFFF) == []
+
+
+def test_incremental_scan(fonts: Path, tmp_path: Path):
+    database = tmp_path / "index.sqlite"
+    with FontIndex(database) as index:
+        index.scan(fonts, workers=1)
+
+    with FontIndex(database) as index:
+        assert index.scan(fonts, workers=1) == 0
+
+        utime(fonts / "monof55.ttf", ns=(0, 0))
+        (fonts / "nested" / "monof56.ttf").unlink()
+        assert index.scan(fonts, workers=1) == 1
+        assert len(index) == 2
+        assert index.find("Hello", italic=True) == []
+
+
+def test_unreadable_files_retried(fonts: Path, monkeypatch: pytest.MonkeyPatch):
+    from_file = fnt.index.FileFont.from_file
+
+    def locked(path: Path, **kwargs):
+        if path.name == "monof55.ttf":
+            raise PermissionError(path)
+        return from_file(path, **kwargs)
+
+    with FontIndex() as index:
+        monkeypatch.setattr(fnt.index.FileFont, "from_file", locked)
+        assert index.scan(fonts, workers=1) == 4
+        assert len(index) == 2
+
+        monkeypatch.undo()
+        assert index.scan(fonts, workers=1) == 1  # broken.ttf isn't read again
+        assert len(index) == 3
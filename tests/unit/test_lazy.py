@@ -0,0 +1,68 @@
+from dataclasses import fields, replace
+from pathlib import Path
+from struct import pack
+import pickle
+
+from fnt import FileFont, FontCursor
+from fnt.parsing import parsers
+from fnt.tables import head, OS2_v0, OS2_v2, OS2_v5, TableRecord
+import pytest
+
+FONTS = Path(__file__).parent.parent / "fonts"
+
+OS2_V0 = pack(
+    ">HhHHH10hh10b4I4s3H3h2H",
+    *(0, 500, 700, 5, 8),
+    *range(1, 11),
+    -3,
+    *range(10),
+    *(1, 2, 3, 4),
+    b"ABCD",
+    *(64, 32, 126),
+    *(900, -200, 10),
+    *(950, 250),
+)
+
+
+def eager(table):
+    return type(table)(*(getattr(table, f.name) for f in fields(table)))
+
+
+def test_lazy_head_decodes_on_access():
+    table = FileFont.from_file(FONTS / "monof55.ttf").get_table("head")
+    assert "unitsPerEm" not in vars(table)
+    assert table.unitsPerEm == 2400
+    assert "unitsPerEm" in vars(table) and "xMin" not in vars(table)
+    assert table.magicNumber == 0x5F0F3CF5
+    assert eager(table) == table
+
+
+def test_lazy_OS2_versions():
+    data = OS2_V0
+    record = TableRecord("OS/2", 0, 0, len(data))
+    table = parsers["OS/2"](FontCursor(None, memoryview(data)), record)
+    assert type(table) is OS2_v0 and OS2_v0.packed_size() == 78
+    assert table.usWeightClass == 700 and table.achVendID == "ABCD"
+    assert table.panose == tuple(range(10)) and table.sFamilyClass == -3
+
+    v5 = pack(">IIhhHHHHH", 1, 2, 500, 700, 0, 32, 3, 8, 72)
+    data = pack(">H", 5) + data[2:] + v5
+    table = parsers["OS/2"](FontCursor(None, memoryview(data)), record)
+    assert type(table) is OS2_v5 and OS2_v5.packed_size() == len(data)
+    assert table.usUpperOpticalPointSize == 72 and table.sCapHeight == 700
+    assert table.usWeightClass == 700
+
+
+def test_lazy_tables_compare_and_pickle():
+    font = FileFont.from_file(FONTS / "YDWbananaslipplus.otf")
+    table = font.get_table("OS/2")
+    assert isinstance(table, OS2_v2)
+    assert pickle.loads(pickle.dumps(table)) == table
+    assert replace(table, usWeightClass=100).usWeightClass == 100
+    with pytest.raises(AttributeError):
+        table.usLowerOpticalPointSize
+
+
+def test_lazy_table_too_short():
+    with pytest.raises(ValueError):
+        head.lazy(bytes(head.packed_size() - 1))
@@ -0,0 +1,159 @@
+from dataclasses import dataclass, fields
+import random
+
+from fnt.exceptions import InvalidFieldTypeError
+from fnt.legacy import types
+from fnt.legacy.types import (
+    Table,
+    Array,
+    Tag,
+    uint16,
+    int16,
+    uint24,
+    int24,
+    uint32,
+    fixed,
+    F2DOT14,
+    LONGDATETIME,
+    Version16Dot16,
+    arrayEntry,
+    staticEntry,
+    dynamicEntry,
+    versionEntry,
+    linkedEntry,
+    propertyEntry,
+    definition,
+)
+import pytest
+
+
+@definition
+class Metric:
+    advanceWidth: uint16
+    lsb: int16
+
+
+@definition
+class Mixed:
+    version: Version16Dot16
+    revision: fixed
+    created: LONGDATETIME
+    tag: Tag
+    small: uint24
+    signed: int24
+    scale: F2DOT14
+    count: uint16
+    metrics: Array[Metric] = arrayEntry("count")
+    values: Array[int16] = arrayEntry("count")
+    tags: Array[Tag, 2] = staticEntry()
+    tail: uint32 = staticEntry()
+
+
+@definition
+class Linked:
+    numberOfHMetrics: uint16
+    numGlyphs: uint16 = linkedEntry("maxp", "numGlyphs")
+    hMetrics: Array[Metric] = arrayEntry("numberOfHMetrics")
+    length: uint32 = propertyEntry()
+    rest: Array[uint16] = dynamicEntry(
+        lambda n, m, typ, buffer, offset, sz: typ[n - m].read(buffer, offset + sz),
+        "numGlyphs",
+        "numberOfHMetrics",
+    )
+
+
+@definition
+class Subtable:
+    format: uint16 = versionEntry()
+
+
+@Subtable.add_version(uint16.byte(4))
+class Subtable4(Subtable):
+    count: uint16 = staticEntry()
+    codes: Array[uint16] = arrayEntry("count")
+
+
+@dataclass
+class Record:
+    offset: int
+    length: int
+
+
+class Font:
+    def get_table(self, tag: str):
+        assert tag == "maxp"
+        return {"numGlyphs": uint16.byte(5)}
+
+
+def assert_same(compiled: Table, interpreted: Table):
+    assert compiled == interpreted
+    assert compiled.fmt == interpreted.fmt
+    assert compiled.sz == interpreted.sz
+    for field in fields(compiled):
+        a, b = getattr(compiled, field.name), getattr(interpreted, field.name)
+        assert type(a) is type(b)
+        if isinstance(a, Array | Table):
+            assert (a.fmt, a.sz) == (b.fmt, b.sz)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_compiled_read_matches_interpreter(seed: int):
+    data = bytearray(random.Random(seed).randbytes(200))
+    data[29:31] = (3).to_bytes(2)  # count
+    buffer = bytes(data)
+
+    compiled = Mixed.read(buffer, 1)
+    assert_same(compiled, types._interpret_read(Mixed, buffer, 1))
+    assert compiled.sz == 30 + 3 * 4 + 3 * 2 + 8 + 4
+
+
+def test_compiled_parse_matches_interpreter():
+    buffer = b"\xff" * 3 + b"\x00\x02" + b"\x01\xf4\xff\xce" * 2 + b"\x00\x07" * 3
+    record = Record(3, len(buffer) - 3)
+
+    compiled = Linked.parse(record, Font(), buffer)
+    assert_same(compiled, types._interpret_parse(Linked, record, Font(), buffer))
+    assert compiled.numGlyphs == 5
+    assert compiled.length == 16
+    assert compiled.hMetrics[1].lsb == -50
+    assert compiled.rest == (7, 7, 7)
+
+
+def test_compiled_versions():
+    buffer = b"\x00\x04\x00\x02\x00\x41\x00\x42"
+    table = Subtable.read(buffer)
+    assert type(table) is Subtable4
+    assert table.codes == (0x41, 0x42)
+    assert_same(table, types._interpret_read(Subtable4, buffer))
+
+
+def test_compiled_read_too_small():
+    with pytest.raises(ValueError):
+        Mixed.read(bytes(30))
+    with pytest.raises(ValueError):
+        Array[Metric, 3].read(bytes(11))
+    with pytest.raises(InvalidFieldTypeError):
+        Linked.read(bytes(10))  # only parse can fill the linked field
+
+
+@pytest.mark.parametrize("typ", [uint16, int16, uint24, fixed, Tag, Version16Dot16])
+def test_bulk_array_matches_items(typ: type):
+    buffer = random.Random(0).randbytes(2 + 8 * typ.sz)
+    array = Array[typ, 8].read(buffer, 2)
+    items = [typ.read(buffer, 2 + idx * typ.sz) for idx in range(8)]
+
+    assert array == tuple(items)
+    assert all(type(item) is typ for item in array)
+    assert (array.fmt, array.sz) == (8 * typ.fmt, 8 * typ.sz)
+    assert Array[typ, 8](buffer[2:]) == array
+
+
+def test_bulk_record_array():
+    buffer = b"\x01\xf4\xff\xce\x02\x00\x00\x0a"
+    array = Array[Metric, 2].read(buffer)
+    assert array == (Metric.read(buffer), Metric.read(buffer, 4))
+    assert array[0].fmt == Metric.fmt and array[1].sz == 4
+    assert (array.fmt, array.sz) == (2 * Metric.fmt, 8)
+
+    empty = Array[uint16].read(buffer)
+    assert (empty, empty.fmt, empty.sz) == ((), "", 0)
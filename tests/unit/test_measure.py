@@ -0,0 +1,38 @@
+from pathlib import Path
+
+from fnt import FileFont
+import fnt.font
+import pytest
+
+FONTS = Path(__file__).parent.parent / "fonts"
+TEXT = "The quick brown fox jumps over the lazy dog \U0001f98a"
+
+
+@pytest.fixture(scope="module")
+def font() -> FileFont:
+    return FileFont.from_file(FONTS / "YDWbananaslipplus.otf")
+
+
+def test_measure_sums_advances(font: FileFont):
+    cmap, hmtx = font.get_table("cmap"), font.get_table("hmtx")
+    units = sum(hmtx.advance(cmap.lookup(ord(c))) for c in TEXT)
+    upem = font.get_table("head").unitsPerEm
+    assert font.measure(TEXT) == pytest.approx(units / upem)
+    assert font.measure(TEXT, upem) == pytest.approx(units)
+    assert font.measure("") == 0
+
+
+def test_measure_advances(font: FileFont):
+    advances = font.measure(TEXT, 16, advances=True)
+    assert len(advances) == len(TEXT)
+    assert sum(advances) == pytest.approx(font.measure(TEXT, 16))
+    assert advances[2] == font.measure("e", 16)
+
+
+def test_measure_numpy_matches(font: FileFont, monkeypatch: pytest.MonkeyPatch):
+    pytest.importorskip("numpy")
+    text = TEXT * 4
+    expected = font.measure(text, 12, advances=True)
+    monkeypatch.setattr(fnt.font, "VECTORIZE_CHARACTERS", 0)
+    assert font.measure(text, 12, advances=True) == expected
+    assert font.measure(text, 12) == pytest.approx(sum(expected))
@@ -0,0 +1,63 @@
+from pathlib import Path
+
+from fnt import FileFont
+from fnt.flags import Platform, MacintoshEncoding, WindowsEncoding
+from fnt.tables import NameRecord, name_v0
+
+FONTS = Path(__file__).parent.parent / "fonts"
+
+
+def test_strings_decoded_on_access():
+    table = FileFont.from_file(FONTS / "monof55.ttf").get_table("name")
+    assert all(record._string is None for record in table.nameRecords)
+
+    record = table.get(Platform.WINDOWS, WindowsEncoding.UNICODE_BMP, 0x409, 1)
+    assert record.string == "monofur"
+    assert record._string == "monofur"
+    assert sum(r._string is not None for r in table.nameRecords) == 1
+
+
+def test_get_name_prefers_windows_english():
+    table = FileFont.from_file(FONTS / "YDWbananaslipplus.otf").get_table("name")
+    assert table.get_name(1) == "YDW bananaslip plus plus"
+    assert table.get_name(4, lang=0x411) == "YDW バナナスリップplus plus"
+    assert table.get_name(4, lang=0x407) == table.get_name(4)
+    assert table.get_name(1234) is None
+    assert table.get_name(1234, 1) == table.get_name(1)
+    assert table.get_name(16, 1) == table.get_name(16) != table.get_name(1)
+    assert table.get_name(1234, 5678) is None
+
+
+def test_get_name_missing_language_falls_back_to_english():
+    def windows(lang: int, string: str) -> NameRecord:
+        data = string.encode("utf-16-be")
+        return NameRecord(
+            Platform.WINDOWS, WindowsEncoding.UNICODE_BMP, lang, 1, len(data), 0, data
+        )
+
+    mac = NameRecord(Platform.MACINTOSH, MacintoshEncoding.ROMAN, 0, 1, 3, 0, b"Mac")
+    table = name_v0(0, 3, 0, (windows(0x407, "Schrift"), mac, windows(0x409, "Font")))
+    assert table.get_name(1, lang=0x40C) == "Font"
+    assert table.get_name(1, lang=0x407) == "Schrift"
+
+    table = name_v0(0, 2, 0, (windows(0x407, "Schrift"), mac))
+    assert table.get_name(1, lang=0x40C) == "Mac"
+    assert table.get_name(1) == "Mac"
+
+
+def test_legacy_encodings():
+    table = FileFont.from_file(FONTS / "YDWbananaslipplus.otf").get_table("name")
+    mac = table.get(Platform.MACINTOSH, MacintoshEncoding.JAPANESE, 11, 4)
+    assert mac.string == "YDW バナナスリップplus plus"
+
+    data = "Ünïcödé".encode("mac-roman")
+    record = NameRecord(
+        Platform.MACINTOSH, MacintoshEncoding.ROMAN, 0, 1, len(data), 0, data
+    )
+    assert record.string == "Ünïcödé"
+
+    data = "フォント".encode("cp932")
+    record = NameRecord(
+        Platform.WINDOWS, WindowsEncoding.SHIFTJIS, 0x411, 1, len(data), 0, data
+    )
+    assert record.string == "フォント"
@@ -0,0 +1,63 @@
+from pathlib import Path
+from struct import pack, unpack_from
+
+from fnt import FileFont, probe
+import pytest
+
+FONTS = Path(__file__).parent.parent / "fonts"
+
+
+@pytest.mark.parametrize("path", sorted(FONTS.glob("*.[ot]tf")), ids=lambda p: p.name)
+def test_probe_matches_file_font(path: Path):
+    summary = probe(path)
+    font = FileFont.from_file(path)
+    names = font.get_table("name")
+
+    assert summary.tables == font.get_table_names()
+    assert summary.family == (names.get_name(16) or names.get_name(1))
+    assert summary.fullName == names.get_name(4)
+    assert summary.unitsPerEm == font.get_table("head").unitsPerEm
+    assert summary.numGlyphs == font.get_table("maxp").numGlyphs
+    assert summary.weight == font.get_table("OS/2").usWeightClass
+    assert summary.italic == (path.name == "monof56.ttf")
+
+
+def test_probe_collection(tmp_path: Path):
+    # A single font collection, the font's table offsets moved past the TTC header.
+    data = bytearray((FONTS / "monof56.ttf").read_bytes())
+    for idx in range(12, 12 + 16 * unpack_from(">H", data, 4)[0], 16):
+        (offset,) = unpack_from(">I", data, idx + 8)
+        data[idx + 8 : idx + 12] = pack(">I", offset + 16)
+    path = tmp_path / "monof.ttc"
+    path.write_bytes(pack(">4sHHII", b"ttcf", 1, 0, 1, 16) + data)
+
+    summary = probe(path)
+    assert summary.fullName == "monofur   italic"
+    assert summary.numGlyphs == 677
+    with pytest.raises(IndexError):
+        probe(path, 1)
+
+
+def test_probe_truncated(tmp_path: Path):
+    path = tmp_path / "truncated.ttf"
+    path.write_bytes((FONTS / "monof55.ttf").read_bytes()[:100])
+    with pytest.raises(ValueError):
+        probe(path)
+
+
+def test_probe_rejects_sizes_past_the_file(tmp_path: Path):
+    path = tmp_path / "huge.ttc"
+    path.write_bytes(pack(">4sHHII", b"ttcf", 1, 0, 0x3FFFFFFF, 0xFFFFFF00))
+    with pytest.raises(ValueError):
+        probe(path, 5)
+    with pytest.raises(ValueError):
+        probe(path)  # its directory offset points past the end
+
+    data = bytearray((FONTS / "monof55.ttf").read_bytes())
+    for idx in range(12, 12 + 16 * unpack_from(">H", data, 4)[0], 16):
+        if data[idx : idx + 4] == b"head":
+            data[idx + 12 : idx + 16] = pack(">I", 0x7FFFFFFF)
+    path = tmp_path / "long.ttf"
+    path.write_bytes(data)
+    with pytest.raises(ValueError):
+        probe(path)
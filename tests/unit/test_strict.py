@@ -0,0 +1,120 @@
+from pathlib import Path
+from struct import pack, unpack_from
+
+from fnt import FileFont, FontCursor, Collection
+from fnt.exceptions import (
+    TableBoundsError,
+    ReadBoundsError,
+    CountBoundsError,
+    MemoryBudgetError,
+)
+from fnt.parsing import parse_cmap
+from fnt.tables import TableRecord
+import pytest
+
+FONTS = Path(__file__).parent.parent / "fonts"
+TABLES = ("cmap", "head", "hhea", "hmtx", "loca", "maxp", "name", "OS/2", "post")
+
+
+def set_record_length(data: bytearray, tag: bytes, length: int):
+    for idx in range(12, 12 + 16 * unpack_from(">H", data, 4)[0], 16):
+        if data[idx : idx + 4] == tag:
+            data[idx + 12 : idx + 16] = pack(">I", length)
+            return
+    raise KeyError(tag)
+
+
+def test_strict_parses_the_same():
+    loose = FileFont.from_file(FONTS / "monof55.ttf")
+    strict = FileFont.from_file(FONTS / "monof55.ttf", strict=True)
+    assert strict.strict and not loose.strict
+    for tag in TABLES:
+        assert strict.get_table(tag) == loose.get_table(tag)
+
+    glyphs = strict.get_table("glyf")
+    assert all(glyphs.flatten(gid) == loose.glyf.flatten(gid) for gid in range(675))
+
+
+def test_strict_rejects_truncated_font():
+    data = (FONTS / "monof55.ttf").read_bytes()[:-1000]
+    FileFont(data)
+    with pytest.raises(TableBoundsError):
+        FileFont(data, strict=True)
+
+
+def test_strict_rejects_huge_table_count():
+    data = bytearray((FONTS / "monof55.ttf").read_bytes()[:64])
+    data[4:6] = pack(">H", 0x7FFF)
+    with pytest.raises(ReadBoundsError):
+        FileFont(bytes(data), strict=True)
+
+
+def test_strict_reads_stop_at_table_end():
+    data = bytearray((FONTS / "monof55.ttf").read_bytes())
+    set_record_length(data, b"head", 10)
+
+    with pytest.raises(ReadBoundsError):
+        FileFont(bytes(data), strict=True).get_table("head")
+    assert FileFont(bytes(data)).get_table("head")
+
+
+def test_counts_checked_against_table():
+    data = bytearray((FONTS / "monof55.ttf").read_bytes())
+    set_record_length(data, b"name", 10)
+    set_record_length(data, b"hmtx", 100)
+
+    for strict in (False, True):
+        font = FileFont(bytes(data), strict=strict)
+        with pytest.raises(CountBoundsError):
+            font.get_table("name")
+        with pytest.raises(CountBoundsError):
+            font.get_table("hmtx")
+
+
+def test_huge_cmap_count():
+    # a format 12 subtable claiming 2^32 - 1 groups
+    subtable = pack(">HHIII", 12, 0, 28, 0, 0xFFFFFFFF) + pack(">3I", 32, 32, 1)
+    data = pack(">HHHHI", 0, 1, 3, 10, 12) + subtable
+    record = TableRecord("cmap", 0, 0, len(data))
+    with pytest.raises(CountBoundsError):
+        parse_cmap(FontCursor(None, memoryview(data)), record)
+
+
+def test_memory_budget():
+    font = FileFont.from_file(FONTS / "monof55.ttf", budget=3000)
+    font.get_table("name")
+    assert font.budget == 3000 - 24 * 12
+    with pytest.raises(MemoryBudgetError):
+        font.get_table("cmap")
+    assert FileFont.from_file(FONTS / "monof55.ttf", budget=1 << 20).get_table("cmap")
+
+
+def test_strict_collection():
+    data = bytearray((FONTS / "monof55.ttf").read_bytes())
+    for idx in range(12, 12 + 16 * unpack_from(">H", data, 4)[0], 16):
+        (offset,) = unpack_from(">I", data, idx + 8)
+        data[idx + 8 : idx + 12] = pack(">I", offset + 16)
+    set_record_length(data, b"head", 10)
+    collection = Collection(pack(">4sHHII", b"ttcf", 1, 0, 1, 16) + data, strict=True)
+
+    font = collection[0]
+    assert font.strict
+    assert font.get_table("maxp").numGlyphs == 675
+    with pytest.raises(ReadBoundsError):
+        font.get_table("head")
+
+
+def test_strict_mmap_closes_with_glyf(tmp_path: Path):
+    with FileFont.from_file(FONTS / "monof55.ttf", mmap=True, strict=True) as font:
+        assert font.get_table("glyf")[36] is not None
+    assert font.closed
+
+    data = bytearray((FONTS / "monof55.ttf").read_bytes())
+    for idx in range(12, 12 + 16 * unpack_from(">H", data, 4)[0], 16):
+        (offset,) = unpack_from(">I", data, idx + 8)
+        data[idx + 8 : idx + 12] = pack(">I", offset + 16)
+    path = tmp_path / "monof.ttc"
+    path.write_bytes(pack(">4sHHII", b"ttcf", 1, 0, 1, 16) + data)
+    with Collection.from_file(path, mmap=True, strict=True) as collection:
+        assert collection[0].get_table("glyf")[36] is not None
+    assert collection.closed
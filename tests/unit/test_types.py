@@ -1,4 +1,7 @@
+from dataclasses import FrozenInstanceError, replace
+
 from fnt.types import F2DOT14, fixed
+from fnt.tables import TableRecord, LongHorMetric, MapGroup, NameRecord
 import pytest
 
 F2DOT14_vals = (
@@ -29,3 +32,25 @@ fixed_vals = (
 @pytest.mark.parametrize("b, v", fixed_vals)
 def test_fixed(b, v):
     assert fixed(b) == pytest.approx(v, rel=1.1e-4)
+
+
+@pytest.mark.parametrize(
+    "record",
+    [
+        LongHorMetric(500, -20),
+        MapGroup(0x20, 0x7E, 1),
+        NameRecord(3, 1, 0x409, 1, 0, 0, b""),
+    ],
+)
+def test_records_are_slotted(record):
+    assert not hasattr(record, "__dict__")
+    with pytest.raises(AttributeError):
+        record.extra = 1
+
+
+def test_frozen_record():
+    record = TableRecord("head", 1, 2, 3)
+    with pytest.raises(FrozenInstanceError):
+        record.offset = 4
+    assert replace(record, offset=4).offset == 4
+    assert hash(record) == hash(TableRecord("head", 1, 2, 3))